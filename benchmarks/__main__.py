@@ -0,0 +1,56 @@
+import argparse
+import os
+import sys
+
+from .runner import DEFAULT_TOLERANCE, compare, default_scenarios, format_table, load_baseline, run_scenario, save_baseline
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Бенчмарки валидации моделей")
+    parser.add_argument("-k", "--filter", default="", help="запускать только сценарии, в имени которых есть подстрока")
+    parser.add_argument("--widths", type=int, nargs="+", default=[2, 8], help="длины списков")
+    parser.add_argument("--error-rates", type=float, nargs="+", default=[0.0, 0.1], help="доли невалидных контактов")
+    parser.add_argument("--contacts", type=int, default=20_000, help="число контактов на сценарий")
+    parser.add_argument("--repeat", type=int, default=3, help="число замеряемых проходов")
+    parser.add_argument("--quick", action="store_true", help="короткий прогон для проверки, что все работает")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="файл базовой линии")
+    parser.add_argument("--save-baseline", action="store_true", help="записать результаты как новую базовую линию")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="допустимое падение пропускной способности")
+    args = parser.parse_args(argv)
+
+    contacts = 1_000 if args.quick else args.contacts
+    scenarios = [
+        scenario
+        for scenario in default_scenarios(args.widths, args.error_rates)
+        if args.filter in scenario.name
+    ]
+
+    results = []
+    for scenario in scenarios:
+        print(f"{scenario.name}...", file=sys.stderr)
+        results.append(run_scenario(scenario, contacts, 1 if args.quick else args.repeat))
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(format_table(results))
+        print(f"\nБазовая линия записана в {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline) if os.path.exists(args.baseline) else None
+    print(format_table(results, baseline))
+    if baseline is None:
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nРегрессии (падение больше {args.tolerance:.0%}):")
+        print("\n".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
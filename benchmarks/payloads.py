@@ -0,0 +1,73 @@
+import random
+from typing import Any
+
+from tests.test_validate_with_coerce import Company, Contact, Department, Employee, Team
+
+
+# модели по глубине вложенности: глубина 1 — Contact, 5 — Company
+MODELS_BY_DEPTH = (Contact, Employee, Team, Department, Company)
+
+# значение, которое не проходит ни строгую проверку, ни приведение к int
+INVALID_EXTENSION = "12abc"
+
+
+class PayloadGenerator:
+    """Синтетические документы для схемы Company → Department → Team → Employee → Contact.
+
+    ``width`` — длина каждого списка, ``error_rate`` — доля контактов
+    с невалидным ``extension``. При ``coerce`` числа передаются строками,
+    чтобы валидация действительно приводила типы.
+    """
+
+    def __init__(self, width: int, error_rate: float, coerce: bool, seed: int = 0):
+        if width < 1:
+            raise ValueError(f"width должен быть положительным, получено {width!r}")
+        if not 0 <= error_rate <= 1:
+            raise ValueError(f"error_rate должен быть в диапазоне [0, 1], получено {error_rate!r}")
+
+        self.width = width
+        self.error_rate = error_rate
+        self.coerce = coerce
+        self._random = random.Random(seed)
+        self.contacts = 0
+        self.invalid_contacts = 0
+
+    def contact(self) -> dict:
+        rnd = self._random
+        self.contacts += 1
+
+        if rnd.random() < self.error_rate:
+            self.invalid_contacts += 1
+            extension: Any = INVALID_EXTENSION
+        else:
+            extension = rnd.randrange(1, 1000)
+            if self.coerce:
+                extension = str(extension)
+
+        digits = f"{rnd.randrange(10 ** 10):010d}"
+        return {
+            "phone": f"8 ({digits[:3]}) {digits[3:6]}-{digits[6:8]}-{digits[8:]}",
+            "extension": extension,
+        }
+
+    def employee(self) -> dict:
+        idx = self.contacts
+        return {"first_name": f"Имя{idx}", "last_name": f"Фамилия{idx}", "contact": self.contact()}
+
+    def team(self) -> dict:
+        return {"team_name": f"team-{self.contacts}", "members": [self.employee() for _ in range(self.width)]}
+
+    def department(self) -> dict:
+        return {"dept_name": f"dept-{self.contacts}", "teams": [self.team() for _ in range(self.width)]}
+
+    def company(self) -> dict:
+        return {"company_name": f"company-{self.contacts}", "departments": [self.department() for _ in range(self.width)]}
+
+    def document(self, depth: int) -> dict:
+        builders = (self.contact, self.employee, self.team, self.department, self.company)
+        return builders[depth - 1]()
+
+
+def contacts_per_document(depth: int, width: int) -> int:
+    # списки есть начиная с Team, у Employee и Contact ровно один контакт
+    return width ** max(0, depth - 2)
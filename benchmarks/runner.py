@@ -0,0 +1,178 @@
+import json
+import math
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Iterable
+
+from serializer import ValidationErrorGroup
+
+from .payloads import MODELS_BY_DEPTH, PayloadGenerator, contacts_per_document
+
+
+# регрессией считается падение пропускной способности больше чем на эту долю
+DEFAULT_TOLERANCE = 0.2
+
+
+@dataclass(frozen=True)
+class Scenario:
+    depth: int
+    width: int
+    error_rate: float
+    coerce: bool
+
+    @property
+    def model(self) -> type:
+        return MODELS_BY_DEPTH[self.depth - 1]
+
+    @property
+    def name(self) -> str:
+        mode = "coerce" if self.coerce else "strict"
+        return f"{self.model.__name__}-w{self.width}-e{self.error_rate:g}-{mode}"
+
+
+@dataclass
+class Result:
+    scenario: str
+    documents: int
+    contacts: int
+    invalid_documents: int
+    records_per_sec: float
+    contacts_per_sec: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    peak_memory_kib: float
+
+
+def default_scenarios(widths: Iterable[int] = (2, 8), error_rates: Iterable[float] = (0.0, 0.1)) -> list[Scenario]:
+    scenarios = []
+    for depth in range(1, len(MODELS_BY_DEPTH) + 1):
+        # до Team списков нет, ширина ни на что не влияет
+        depth_widths = sorted(set(widths)) if depth > 2 else [1]
+        for width in depth_widths:
+            for error_rate in error_rates:
+                for coerce in (False, True):
+                    scenarios.append(Scenario(depth, width, error_rate, coerce))
+    return scenarios
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    # ближайший ранг
+    idx = max(0, math.ceil(q * len(sorted_values)) - 1)
+    return sorted_values[idx]
+
+
+def run_scenario(
+    scenario: Scenario,
+    contacts: int = 20_000,
+    repeat: int = 3,
+    min_documents: int = 20,
+    seed: int = 0,
+) -> Result:
+    """Валидирует ``contacts`` контактов, упакованных в документы сценария.
+
+    Время и память измеряются в разных проходах: ``tracemalloc`` сам
+    замедляет выделение памяти.
+    """
+    per_document = contacts_per_document(scenario.depth, scenario.width)
+    count = max(min_documents, contacts // per_document)
+
+    generator = PayloadGenerator(scenario.width, scenario.error_rate, scenario.coerce, seed)
+    documents = [generator.document(scenario.depth) for _ in range(count)]
+    validate = scenario.model.validate
+    coerce = scenario.coerce
+
+    def validate_one(document: dict) -> bool:
+        try:
+            validate(document, coerce=coerce)
+        except ValidationErrorGroup:
+            return False
+        return True
+
+    # прогрев: компиляция плана и кэши интерпретатора
+    for document in documents[:min_documents]:
+        validate_one(document)
+
+    # пропускная способность берется по самому быстрому проходу,
+    # задержки — по всем проходам
+    latencies = []
+    elapsed = math.inf
+    perf_counter = time.perf_counter
+    for _ in range(repeat):
+        invalid = 0
+        started = perf_counter()
+        for document in documents:
+            document_started = perf_counter()
+            invalid += not validate_one(document)
+            latencies.append(perf_counter() - document_started)
+        elapsed = min(elapsed, perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        for document in documents:
+            validate_one(document)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return Result(
+        scenario=scenario.name,
+        documents=count,
+        contacts=generator.contacts,
+        invalid_documents=invalid,
+        records_per_sec=count / elapsed,
+        contacts_per_sec=generator.contacts / elapsed,
+        p50_us=_percentile(latencies, 0.5) * 1e6,
+        p90_us=_percentile(latencies, 0.9) * 1e6,
+        p99_us=_percentile(latencies, 0.99) * 1e6,
+        peak_memory_kib=peak / 1024,
+    )
+
+
+def load_baseline(path: str) -> dict[str, dict]:
+    with open(path, encoding="utf-8") as fp:
+        return json.load(fp)["results"]
+
+
+def save_baseline(path: str, results: list[Result]):
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump({"results": {result.scenario: asdict(result) for result in results}}, fp, ensure_ascii=False, indent=2)
+        fp.write("\n")
+
+
+def compare(results: list[Result], baseline: dict[str, dict], tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """Сценарии, пропускная способность которых упала больше чем на ``tolerance``."""
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.scenario)
+        if expected is None:
+            continue
+
+        ratio = result.records_per_sec / expected["records_per_sec"]
+        if ratio < 1 - tolerance:
+            regressions.append(
+                f"{result.scenario}: {result.records_per_sec:.0f} записей/с, "
+                f"в базовой линии {expected['records_per_sec']:.0f} ({ratio - 1:+.0%})"
+            )
+    return regressions
+
+
+def format_table(results: list[Result], baseline: dict[str, dict] | None = None) -> str:
+    header = f"{'сценарий':<34} {'записей/с':>11} {'контактов/с':>12} {'p50 мкс':>10} {'p90 мкс':>10} {'p99 мкс':>10} {'пик КиБ':>9}"
+    if baseline is not None:
+        header += f" {'к базе':>7}"
+
+    lines = [header]
+    for result in results:
+        line = (
+            f"{result.scenario:<34} {result.records_per_sec:>11.0f} {result.contacts_per_sec:>12.0f} "
+            f"{result.p50_us:>10.1f} {result.p90_us:>10.1f} {result.p99_us:>10.1f} {result.peak_memory_kib:>9.1f}"
+        )
+        if baseline is not None:
+            expected = baseline.get(result.scenario)
+            change = f"{result.records_per_sec / expected['records_per_sec'] - 1:+.0%}" if expected else "—"
+            line += f" {change:>7}"
+        lines.append(line)
+    return "\n".join(lines)
@@ -1,3 +1,9 @@
 from serializer.lib.base import Model
 from serializer.lib.types_ import PhoneNumber
-from serializer.lib.exc import ValidationErrorGroup
\ No newline at end of file
+from serializer.lib.exc import ValidationErrorGroup
+from serializer.lib.schema_validator import SchemaValidator
+from serializer.lib.codegen import CodegenValidator
+from serializer.lib.cache import CoercionCache, SubtreeCache
+from serializer.lib.registry import register_type
+from serializer.lib.tagged import TaggedUnion
+from serializer.lib.hooks import ValidationHooks, ProfileCollector
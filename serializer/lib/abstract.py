@@ -1,6 +1,6 @@
 import inspect
 from abc import ABCMeta, abstractmethod, ABC
-from typing import Any
+from typing import Any, Iterable
 from .exc import ValidationError
 
 
@@ -13,6 +13,7 @@ class MetaBase(type):
             for k, v in namespace.items()
             if not k.startswith("_") and not inspect.isroutine(v)
         }
+        cls._plan = None
 
         return cls
 
@@ -24,7 +25,7 @@ class ModelMeta(ABCMeta, MetaBase):
 class AbstractModel(metaclass=ModelMeta):
     @classmethod
     @abstractmethod
-    def _validate(cls, obj, context=None, coerce=False) -> tuple[dict, list[ValidationError]]:
+    def _validate(cls, obj, context=None, coerce=False, plan=None) -> tuple[dict, list[ValidationError]]:
         pass
 
     @classmethod
@@ -32,6 +33,16 @@ class AbstractModel(metaclass=ModelMeta):
     def validate(cls, obj: dict, *, coerce: bool) -> dict:
         pass
 
+    @classmethod
+    @abstractmethod
+    def validate_json(cls, data: str | bytes, *, coerce: bool) -> dict:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def validate_many(cls, objs: Iterable[dict], *, coerce: bool, on_error: str) -> tuple[list[dict | None], dict[int, Any]]:
+        pass
+
 
 class AbstractSchemaValidator(ABC):    
     @abstractmethod
@@ -52,4 +63,16 @@ class AbstractSchemaValidator(ABC):
 
     @abstractmethod
     def validate_json(self, obj: dict) -> dict:
-        pass
\ No newline at end of file
+        pass
+
+class AbstractTaggedUnion(ABC):
+    tag: str
+    variants: dict[Any, type]
+
+    @abstractmethod
+    def validate(self, obj: dict, *, coerce: bool) -> dict:
+        pass
+
+    @abstractmethod
+    def validate_many(self, objs: Iterable[dict], *, coerce: bool, on_error: str) -> tuple[list[dict | None], dict[int, Any]]:
+        pass
@@ -0,0 +1,101 @@
+import asyncio
+import time
+from typing import Any
+
+from .plan import ModelPlan, TypePlan
+from .schema_validator import SchemaValidator
+
+
+DEFAULT_YIELD_EVERY = 1000
+DEFAULT_TIME_BUDGET = 0.005
+
+
+class AsyncValidation:
+    """Обход модели и списков с передачей управления event loop.
+
+    Сами значения проверяются синхронными методами валидатора, поэтому результат
+    и ошибки совпадают с ``validator.validate_json``.
+    """
+
+    def __init__(self, validator: SchemaValidator, yield_every: int = DEFAULT_YIELD_EVERY, time_budget: float | None = DEFAULT_TIME_BUDGET):
+        self.validator = validator
+        self.ctx = validator.ctx
+        self.yield_every = yield_every
+        self.time_budget = time_budget
+        self._ticks = 0
+        self._slice_started = time.perf_counter()
+
+    def _should_yield(self) -> bool:
+        self._ticks += 1
+        if self._ticks < self.yield_every and (
+            self.time_budget is None or time.perf_counter() - self._slice_started < self.time_budget
+        ):
+            return False
+
+        self._ticks = 0
+        return True
+
+    async def _yield(self):
+        await asyncio.sleep(0)
+        self._slice_started = time.perf_counter()
+
+    async def _validate_value_type(self, value: Any, expected_type: TypePlan):
+        if expected_type.model is not None:
+            return await self.validate_model(value, expected_type.model)
+
+        if expected_type.origin is not None and type(value) is expected_type.origin:
+            return await self._process_list(value, expected_type.item)
+
+        return self.validator._validate_value_type(value, expected_type)
+
+    async def _process_list(self, lst: list, expected_type: TypePlan) -> list[Any]:
+        if expected_type.numeric is not None:
+            # числовой список проверяется целиком, без обхода элементов
+            return self.validator._process_list(lst, expected_type)
+
+        ctx = self.ctx
+        is_scalar = expected_type.model is None and expected_type.origin is None
+        validated_lst = []
+
+        path_depth = ctx.depth
+        for idx, v in enumerate(lst):
+            ctx.append_path(idx)
+            if is_scalar:
+                validated_lst.append(self.validator._validate_value_type(v, expected_type))
+            else:
+                validated_lst.append(await self._validate_value_type(v, expected_type))
+            ctx.remove_path_from_idx(path_depth)
+
+            if self._should_yield():
+                await self._yield()
+
+        return validated_lst
+
+    async def validate_model(self, obj: Any, plan: ModelPlan) -> dict:
+        validator = self.validator
+        if not isinstance(obj, dict) or plan.validator_cls is not type(validator):
+            return validator._validate_model(obj, plan)
+
+        ctx = self.ctx
+        validated_obj = {}
+
+        path_depth = ctx.depth
+        for field in plan.fields:
+            ctx.append_path(field.name)
+            try:
+                value = obj[field.name]
+            except KeyError:
+                validator._process_missing_field(field, validated_obj)
+            else:
+                if field.type.model is None and field.type.origin is None:
+                    validated_obj[field.name] = validator._validate_value_type(value, field.type)
+                else:
+                    validated_obj[field.name] = await self._validate_value_type(value, field.type)
+            ctx.remove_path_from_idx(path_depth)
+
+        if self._should_yield():
+            await self._yield()
+
+        if plan.record_cls is not None:
+            return plan.record_cls(validated_obj)
+        return validated_obj
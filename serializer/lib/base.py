@@ -1,15 +1,44 @@
+import json
+import os
+from typing import IO, Any, AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from .batch import check_on_error, collect_batch, group_errors, iter_validate, resolve_max_errors
 from .ctx import ValidationContext
-from .exc import ValidationError, ValidationErrorGroup
+from .exc import ErrorLimitReached, ValidationError, ValidationErrorGroup
 from .abstract import AbstractModel, AbstractSchemaValidator
 from .schema_validator import SchemaValidator
-
+from .cache import CoercionCache, SubtreeCache
+from .hooks import ValidationHooks
+from .columnar import ColumnarValidation
+from .numeric import np
+from .records import Record
+from .revalidate import Revalidation
+from . import dump as dump_
+from .aio import DEFAULT_TIME_BUDGET, DEFAULT_YIELD_EVERY, AsyncValidation
+from .json_parser import SchemaParser
+from .parallel import DEFAULT_MIN_PARALLEL_SIZE, iter_validate_parallel
+from .plan import ModelPlan, compile_model, project_plan
+from .stream import DEFAULT_CHUNK_SIZE, MalformedRecord, decode_record, iter_json_records
 
 
 class Model(AbstractModel):
     _validator_cls: type[AbstractSchemaValidator] = SchemaValidator
+    _coercion_cache: CoercionCache | None = None
+    # списки int/float/bool возвращаются как numpy.ndarray
+    _ndarray_lists: bool = False
+    # validate возвращает записи со слотами вместо словарей
+    _record_output: bool = False
+
+    @classmethod
+    def _get_plan(cls) -> ModelPlan:
+        return cls._plan or compile_model(cls)
+
+    @classmethod
+    def _get_projection(cls, include: Iterable[str] | None, exclude: Iterable[str] | None) -> ModelPlan:
+        return project_plan(cls._get_plan(), include, exclude)
 
     @classmethod
-    def _validate(cls, obj: dict, context: ValidationContext, coerce: bool = False) -> tuple[dict, list[ValidationError]]:
+    def _validate(cls, obj: dict, context: ValidationContext, coerce: bool = False, plan: ModelPlan | None = None) -> tuple[dict, list[ValidationError]]:
         if not isinstance(obj, dict):
             if context:
                 context.add_error(
@@ -24,8 +53,7 @@ class Model(AbstractModel):
 
 
         validator = cls._validator_cls(
-            annotations=cls.__annotations__,
-            default_values=cls._default_values,
+            plan=plan or cls._get_plan(),
             context=context,
             coerce=coerce
         )
@@ -36,17 +64,306 @@ class Model(AbstractModel):
     
 
     @classmethod
-    def validate(cls, obj: dict, *, coerce: bool = False) -> dict:
+    def validate(
+        cls,
+        obj: dict,
+        *,
+        coerce: bool = False,
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        memo: SubtreeCache | None = None,
+        hooks: ValidationHooks | None = None,
+    ) -> dict:
         if not isinstance(obj, dict):
             raise TypeError(f"Must be dict type, got {type(obj).__name__ }")
-        
-        validated_obj, errors = cls._validate(obj, ValidationContext(), coerce)
+
+        plan = cls._get_projection(include, exclude)
+        context = ValidationContext(resolve_max_errors(fail_fast, max_errors), memo, hooks)
+        try:
+            validated_obj, errors = cls._validate(obj, context, coerce, plan)
+        except ErrorLimitReached:
+            raise ValidationErrorGroup(context.errors, cls.__name__) from None
 
         if errors:
             raise ValidationErrorGroup(errors, cls.__name__)
 
         return validated_obj
+
+
+    @classmethod
+    def validate_json(
+        cls,
+        data: str | bytes,
+        *,
+        coerce: bool = False,
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> dict:
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode(json.detect_encoding(data), "surrogatepass")
+
+        context = ValidationContext(resolve_max_errors(fail_fast, max_errors))
+        validator = cls._validator_cls(plan=cls._get_projection(include, exclude), context=context, coerce=coerce)
+        try:
+            validated_obj = SchemaParser(validator).parse(data)
+        except ErrorLimitReached:
+            raise ValidationErrorGroup(context.errors, cls.__name__) from None
+
+        if validator.ctx.errors:
+            raise ValidationErrorGroup(validator.ctx.errors, cls.__name__)
+
+        return validated_obj
+
+
+    @classmethod
+    def revalidate(
+        cls,
+        previous: dict,
+        patch: Iterable[dict],
+        *,
+        coerce: bool = False,
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+    ) -> dict:
+        # записи (_record_output) патчатся так же, как словари
+        if not isinstance(previous, (dict, Record)):
+            raise TypeError(f"Must be dict type, got {type(previous).__name__ }")
+
+        context = ValidationContext(resolve_max_errors(fail_fast, max_errors))
+        validator = cls._validator_cls(plan=cls._get_plan(), context=context, coerce=coerce)
+        try:
+            validated_obj = Revalidation(validator).apply_patch(previous, patch)
+        except ErrorLimitReached:
+            raise ValidationErrorGroup(context.errors, cls.__name__) from None
+
+        if context.errors:
+            raise ValidationErrorGroup(context.errors, cls.__name__)
+
+        return validated_obj
+
+
+    @classmethod
+    def _iter_validate(
+        cls,
+        objs: Iterable[Any],
+        coerce: bool,
+        start: int = 0,
+        max_errors: int | None = None,
+        plan: ModelPlan | None = None,
+        memo: SubtreeCache | None = None,
+        hooks: ValidationHooks | None = None,
+    ) -> Iterator[tuple[int, dict | None, list[ValidationError] | None]]:
+        ctx = ValidationContext(max_errors, memo, hooks)
+        validator = cls._validator_cls(plan=plan or cls._get_plan(), context=ctx, coerce=coerce)
+        validate_json = validator.validate_json
+
+        def validate_one(obj: Any) -> dict | None:
+            if type(obj) is MalformedRecord:
+                error = obj.to_error(validator.plan.name)
+                if hooks is not None:
+                    hooks.on_error(error)
+                ctx.add_error(error)
+                return None
+            return validate_json(obj)
+
+        return iter_validate(validate_one, objs, ctx, start)
+
+
+    @classmethod
+    def validate_many(
+        cls,
+        objs: Iterable[dict],
+        *,
+        coerce: bool = False,
+        on_error: str = "collect",
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        memo: SubtreeCache | None = None,
+        hooks: ValidationHooks | None = None,
+    ) -> tuple[list[dict | None], dict[int, ValidationErrorGroup]]:
+        check_on_error(on_error)
+        max_errors = resolve_max_errors(fail_fast, max_errors)
+        plan = cls._get_projection(include, exclude)
+        results = cls._iter_validate(objs, coerce, max_errors=max_errors, plan=plan, memo=memo, hooks=hooks)
+        return collect_batch(results, on_error, cls.__name__)
+
+
+    @classmethod
+    def validate_columns(
+        cls,
+        objs: Iterable[dict],
+        *,
+        coerce: bool = False,
+        on_error: str = "collect",
+        ndarray: bool = False,
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+    ) -> tuple[dict[str, Any], Any, dict[int, ValidationErrorGroup]]:
+        check_on_error(on_error)
+        if ndarray and np is None:
+            raise ImportError("Для ndarray=True требуется numpy: pip install numpy")
+
+        ctx = ValidationContext(resolve_max_errors(fail_fast, max_errors))
+        columnar = ColumnarValidation(cls._validator_cls(plan=cls._get_plan(), context=ctx, coerce=coerce))
+        results = ((idx, None, errors) for idx, errors in columnar.iter_validate(objs))
+
+        valid = []
+        errors = {}
+        for idx, _, error_group in group_errors(results, on_error, cls.__name__):
+            if error_group is None:
+                valid.append(True)
+                continue
+
+            errors[idx] = error_group
+            if on_error == "collect":
+                valid.append(False)
+                columnar.append_empty_row()
+
+        if ndarray:
+            columns, valid = columnar.to_ndarrays(valid)
+            return columns, valid, errors
+
+        return columnar.columns, valid, errors
+
+
+    @classmethod
+    def validate_stream(
+        cls,
+        fp: IO,
+        *,
+        coerce: bool = False,
+        on_error: str = "collect",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+        hooks: ValidationHooks | None = None,
+    ) -> Iterator[tuple[int, dict | None, ValidationErrorGroup | None]]:
+        check_on_error(on_error)
+        max_errors = resolve_max_errors(fail_fast, max_errors)
+        results = cls._iter_validate(iter_json_records(fp, chunk_size), coerce, max_errors=max_errors, hooks=hooks)
+
+        for idx, validated_obj, error_group in group_errors(results, on_error, cls.__name__):
+            if error_group is not None and on_error == "skip":
+                continue
+            yield idx, validated_obj, error_group
+
+
+    @classmethod
+    def validate_parallel(
+        cls,
+        objs: Iterable[dict],
+        *,
+        coerce: bool = False,
+        on_error: str = "collect",
+        workers: int | None = None,
+        chunksize: int | None = None,
+        min_parallel_size: int = DEFAULT_MIN_PARALLEL_SIZE,
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+    ) -> tuple[list[dict | None], dict[int, ValidationErrorGroup]]:
+        check_on_error(on_error)
+        max_errors = resolve_max_errors(fail_fast, max_errors)
+        objs = list(objs)
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1 or len(objs) < min_parallel_size:
+            return collect_batch(cls._iter_validate(objs, coerce, max_errors=max_errors), on_error, cls.__name__)
+
+        return collect_batch(iter_validate_parallel(cls, objs, coerce, workers, chunksize, max_errors), on_error, cls.__name__)
+        
+    
+    @classmethod
+    async def avalidate(
+        cls,
+        obj: dict,
+        *,
+        coerce: bool = False,
+        yield_every: int = DEFAULT_YIELD_EVERY,
+        time_budget: float | None = DEFAULT_TIME_BUDGET,
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+    ) -> dict:
+        if not isinstance(obj, dict):
+            raise TypeError(f"Must be dict type, got {type(obj).__name__ }")
+
+        context = ValidationContext(resolve_max_errors(fail_fast, max_errors))
+        validator = cls._validator_cls(plan=cls._get_plan(), context=context, coerce=coerce)
+        try:
+            validated_obj = await AsyncValidation(validator, yield_every, time_budget).validate_model(obj, validator.plan)
+        except ErrorLimitReached:
+            raise ValidationErrorGroup(context.errors, cls.__name__) from None
+
+        if validator.ctx.errors:
+            raise ValidationErrorGroup(validator.ctx.errors, cls.__name__)
+
+        return validated_obj
+
+
+    @classmethod
+    async def avalidate_stream(
+        cls,
+        source: AsyncIterable[dict | str | bytes],
+        *,
+        coerce: bool = False,
+        on_error: str = "collect",
+        yield_every: int = DEFAULT_YIELD_EVERY,
+        time_budget: float | None = DEFAULT_TIME_BUDGET,
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+    ) -> AsyncIterator[tuple[int, dict | None, ValidationErrorGroup | None]]:
+        check_on_error(on_error)
+        ctx = ValidationContext(resolve_max_errors(fail_fast, max_errors))
+        validator = cls._validator_cls(plan=cls._get_plan(), context=ctx, coerce=coerce)
+        walker = AsyncValidation(validator, yield_every, time_budget)
+
+        idx = 0
+        async for obj in source:
+            # строки NDJSON, например из asyncio.StreamReader
+            if isinstance(obj, (str, bytes)):
+                if not obj.strip():
+                    continue
+                obj = decode_record(obj)
+
+            try:
+                if type(obj) is MalformedRecord:
+                    ctx.add_error(obj.to_error(validator.plan.name))
+                else:
+                    validated_obj = await walker.validate_model(obj, validator.plan)
+            except ErrorLimitReached:
+                ctx.remove_path_from_idx(0)
+
+            result = (idx, validated_obj, None) if not ctx.errors else (idx, None, ctx.take_errors())
+            for idx, validated_obj, error_group in group_errors((result,), on_error, cls.__name__):
+                if error_group is None or on_error == "collect":
+                    yield idx, validated_obj, error_group
+            idx += 1
         
     
+    @classmethod
+    def dump(cls, obj: dict) -> dict:
+        return dump_.dump(cls._get_plan(), obj)
+
+
+    @classmethod
+    def dumps(cls, obj: dict) -> bytes:
+        return dump_.dumps(cls._get_plan(), obj)
+
+
+    @classmethod
+    def dump_iter(cls, objs: Iterable[dict], *, batch_size: int = dump_.DEFAULT_DUMP_BATCH_SIZE) -> Iterator[bytes]:
+        return dump_.iter_dumps(cls._get_plan(), objs, batch_size)
+
+
+    @classmethod
+    def dump_to(cls, objs: Iterable[dict], fp: IO[bytes], *, batch_size: int = dump_.DEFAULT_DUMP_BATCH_SIZE):
+        dump_.dump_to(cls._get_plan(), objs, fp, batch_size)
+
+
     def __new__(cls, *args, **kwargs):
         raise TypeError(f"Экземпляр класса '{cls.__name__}' не должен создаваться вручную, используйте метод {cls.__name__}.validate")
\ No newline at end of file
@@ -0,0 +1,66 @@
+from typing import Any, Callable, Iterable, Iterator
+
+from .ctx import ValidationContext
+from .exc import ErrorLimitReached, ValidationError, ValidationErrorGroup
+
+
+ON_ERROR_MODES = ("collect", "skip", "raise")
+
+# (индекс, результат, ошибки) — результат валидации одного объекта пакета
+BatchResult = tuple[int, Any, list[ValidationError] | None]
+
+
+def check_on_error(on_error: str):
+    if on_error not in ON_ERROR_MODES:
+        raise ValueError(f"on_error должен быть одним из {ON_ERROR_MODES}, получено {on_error!r}")
+
+
+def resolve_max_errors(fail_fast: bool, max_errors: int | None) -> int | None:
+    if fail_fast:
+        return 1
+    if max_errors is not None and max_errors < 1:
+        raise ValueError(f"max_errors должен быть положительным, получено {max_errors!r}")
+    return max_errors
+
+
+def iter_validate(validate_one: Callable[[Any], Any], objs: Iterable[Any], ctx: ValidationContext, start: int = 0) -> Iterator[BatchResult]:
+    """Валидирует объекты по одному с общим контекстом; ошибки забираются из него после каждого объекта."""
+    for idx, obj in enumerate(objs, start):
+        try:
+            validated_obj = validate_one(obj)
+        except ErrorLimitReached:
+            ctx.remove_path_from_idx(0)
+
+        if not ctx.errors:
+            yield idx, validated_obj, None
+            continue
+
+        yield idx, None, ctx.take_errors()
+
+
+def group_errors(results: Iterable[BatchResult], on_error: str, name: str) -> Iterator[tuple[int, Any, ValidationErrorGroup | None]]:
+    for idx, validated_obj, errors in results:
+        if errors is None:
+            yield idx, validated_obj, None
+            continue
+
+        error_group = ValidationErrorGroup(errors, name)
+        if on_error == "raise":
+            raise error_group
+        yield idx, None, error_group
+
+
+def collect_batch(results: Iterable[BatchResult], on_error: str, name: str) -> tuple[list[Any], dict[int, ValidationErrorGroup]]:
+    validated_objs = []
+    errors = {}
+
+    for idx, validated_obj, error_group in group_errors(results, on_error, name):
+        if error_group is None:
+            validated_objs.append(validated_obj)
+            continue
+
+        errors[idx] = error_group
+        if on_error == "collect":
+            validated_objs.append(None)
+
+    return validated_objs, errors
@@ -0,0 +1,165 @@
+from collections import OrderedDict
+from typing import Any
+
+
+# значения этих типов хэшируемы и неизменяемы, поэтому результат конструктора
+# для них можно переиспользовать
+CACHEABLE_TYPES = frozenset((str, int, float, bool))
+
+CONSTRUCTION_FAILED = object()
+
+
+class CoercionCache:
+    """LRU-кэш результатов вызова конструктора типа для скалярных значений.
+
+    Ключ — ``(тип, исключения, тип значения, значение)``, тип значения нужен,
+    чтобы ``1``, ``1.0`` и ``True`` не делили одну запись. Кэшируются и неудачи
+    (исключения из ``errors``), для них возвращается ``CONSTRUCTION_FAILED``;
+    строгий режим и режим приведения ловят разные исключения, поэтому их
+    записи не пересекаются. Подходит только для типов, возвращающих
+    неизменяемые значения.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError(f"maxsize должен быть положительным, получено {maxsize!r}")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def construct(self, expected_type: Any, value: Any, errors: tuple[type[Exception], ...] = (ValueError,)) -> Any:
+        key = (expected_type, errors, type(value), value)
+        entries = self._entries
+
+        try:
+            result = entries[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            entries.move_to_end(key)
+            return result
+
+        self.misses += 1
+        try:
+            result = expected_type(value)
+        except errors:
+            result = CONSTRUCTION_FAILED
+
+        entries[key] = result
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+def _structural_key(value: Any, budget: list[int]) -> Any:
+    # неизменяемый ключ по содержимому; тип скаляров входит в ключ, чтобы
+    # 1, 1.0 и True различались
+    budget[0] -= 1
+    if budget[0] < 0:
+        raise OverflowError
+
+    value_type = type(value)
+    if value_type is dict:
+        return (dict, tuple((key, _structural_key(item, budget)) for key, item in value.items()))
+    if value_type is list:
+        return (list, tuple(_structural_key(item, budget) for item in value))
+
+    hash(value)
+    return (value_type, value)
+
+
+class SubtreeCache:
+    """Кэш результатов валидации вложенных моделей в пределах вызова или пакета.
+
+    Повторный объект ищется сначала по идентичности, затем, если включен
+    ``structural`` и поддерево не больше ``max_structural_size`` узлов,
+    по содержимому. Переиспользуются и результат, и ошибки: их пути
+    перестраиваются под новое место в документе.
+    Одинаковые поддеревья в результате становятся одним и тем же объектом.
+    """
+
+    def __init__(self, maxsize: int = 1024, structural: bool = False, max_structural_size: int = 32):
+        if maxsize < 1:
+            raise ValueError(f"maxsize должен быть положительным, получено {maxsize!r}")
+        self.maxsize = maxsize
+        self.structural = structural
+        self.max_structural_size = max_structural_size
+        # ключ -> (исходный объект, результат, ошибки с относительными путями)
+        self._entries: OrderedDict[tuple, tuple] = OrderedDict()
+        self.identity_hits = 0
+        self.structural_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _keys(self, plan: Any, coerce: bool, obj: dict) -> tuple[tuple, tuple | None]:
+        identity_key = (plan, coerce, id(obj))
+        if not self.structural:
+            return identity_key, None
+        try:
+            return identity_key, (plan, coerce, _structural_key(obj, [self.max_structural_size]))
+        except (OverflowError, TypeError):
+            return identity_key, None
+
+    def lookup(self, plan: Any, coerce: bool, obj: dict) -> tuple[tuple, tuple | None, tuple | None]:
+        identity_key, structural_key = self._keys(plan, coerce, obj)
+        entries = self._entries
+
+        entry = entries.get(identity_key)
+        # объект хранится в записи, поэтому его id не может достаться другому объекту
+        if entry is not None and entry[0] is obj:
+            self.identity_hits += 1
+            entries.move_to_end(identity_key)
+            return identity_key, structural_key, entry
+
+        if structural_key is not None:
+            entry = entries.get(structural_key)
+            if entry is not None:
+                self.structural_hits += 1
+                entries.move_to_end(structural_key)
+                return identity_key, structural_key, entry
+
+        self.misses += 1
+        return identity_key, structural_key, None
+
+    def store(self, keys: tuple[tuple, tuple | None], obj: dict, result: Any, errors: list[tuple]):
+        entry = (obj, result, errors)
+        for key in keys:
+            if key is None:
+                continue
+            self._entries[key] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.identity_hits = self.structural_hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        lookups = self.identity_hits + self.structural_hits + self.misses
+        return {
+            "identity_hits": self.identity_hits,
+            "structural_hits": self.structural_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.identity_hits + self.structural_hits) / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
@@ -0,0 +1,408 @@
+import itertools
+import linecache
+import threading
+from typing import Any, Callable
+
+from .cache import CACHEABLE_TYPES, CONSTRUCTION_FAILED
+from .ctx import ValidationContext, materialize_path
+from .exc import ValidationError
+from .plan import ModelPlan, TypePlan
+from .schema_validator import SchemaValidator
+
+
+_MISSING = object()
+
+_unique_id = itertools.count()
+
+
+def _dict_error(path: list, value: Any, name: str) -> ValidationError:
+    return ValidationError(
+        path=materialize_path(path),
+        value=value,
+        cause=f"Значение должно быть типа dict",
+        expected_type=name,
+    )
+
+
+def _missing_error(path: list, key: str, name: str) -> ValidationError:
+    path = materialize_path(path) + [key]
+    return ValidationError(
+        path=path,
+        value=key,
+        cause=f"Отсутствует ключ {'.'.join(path)}",
+        expected_type=name,
+    )
+
+
+def _container_error(path: list, value: Any, name: str) -> ValidationError:
+    return ValidationError(
+        path=materialize_path(path),
+        value=value,
+        cause=f"Тип контейнера {type(value).__name__}, ожидается {name}",
+        expected_type=name,
+    )
+
+
+def _coerce_error(path: list, value: Any, name: str) -> ValidationError:
+    return ValidationError(
+        path=materialize_path(path),
+        value=value,
+        cause=f"Значение {value} не может быть приведено к типу '{name}'",
+        expected_type=name,
+    )
+
+
+def _strict_error(path: list, value: Any, name: str) -> ValidationError:
+    return ValidationError(
+        path=materialize_path(path),
+        value=value,
+        cause=f"Значение {value} не подходит к типу {name}",
+        expected_type=name,
+    )
+
+
+def _overflow_error(path: list, value: Any, dtype: Any, name: str) -> ValidationError:
+    return ValidationError(
+        path=materialize_path(path),
+        value=value,
+        cause=f"Значения списка не помещаются в {dtype}",
+        expected_type=name,
+    )
+
+
+def _tag_error(path: list, value: Any, tag: str, variants: dict, name: str) -> ValidationError:
+    return ValidationError(
+        path=materialize_path(path) + [tag],
+        value=value,
+        cause=f"Неизвестное значение {value} ключа {tag}, ожидается одно из: {', '.join(map(str, variants))}",
+        expected_type=name,
+    )
+
+
+def _select_variant(variants: dict, tag_value: Any) -> Callable[[Any, list, list], dict] | None:
+    try:
+        return variants.get(tag_value)
+    except TypeError:
+        return None
+
+
+def _delegate(plan: ModelPlan, obj: Any, path: list, errors: list, coerce: bool) -> dict:
+    ctx = ValidationContext()
+    ctx.errors = errors
+    ctx.path = path
+    return plan.model._validate(obj, ctx, coerce, plan)[0]
+
+
+def _try_union_members(plan: ModelPlan, tp: TypePlan, value: Any, path: list, errors: list, coerce: bool) -> Any:
+    ctx = ValidationContext()
+    ctx.errors = errors
+    ctx.path = path
+    return SchemaValidator(plan, ctx, coerce)._try_union_members(value, tp)
+
+
+class _FunctionBuilder:
+    def __init__(self, plan: ModelPlan, coerce: bool, validator_cls: type):
+        self.plan = plan
+        self.coerce = coerce
+        self.validator_cls = validator_cls
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {
+            "ValidationError": ValidationError,
+            "_MISSING": _MISSING,
+            "_FAILED": CONSTRUCTION_FAILED,
+            "_CACHEABLE_TYPES": CACHEABLE_TYPES,
+            "_dict_error": _dict_error,
+            "_missing_error": _missing_error,
+            "_container_error": _container_error,
+            "_coerce_error": _coerce_error,
+            "_strict_error": _strict_error,
+            "_delegate": _delegate,
+            "_tag_error": _tag_error,
+            "_overflow_error": _overflow_error,
+            "_select_variant": _select_variant,
+            "_try_union_members": _try_union_members,
+        }
+        self._names = itertools.count()
+
+    def const(self, value: Any, prefix: str = "_c") -> str:
+        name = f"{prefix}{next(self._names)}"
+        self.namespace[name] = value
+        return name
+
+    def var(self, prefix: str) -> str:
+        return f"{prefix}{next(self._names)}"
+
+    def emit(self, indent: int, line: str):
+        self.lines.append("    " * indent + line)
+
+    def emit_model(self, plan: ModelPlan, src: str, dst: str, seg: str, indent: int):
+        self.emit(indent, f"path.append({seg})")
+        if plan.validator_cls is self.validator_cls:
+            fn = self.const(get_function(plan, self.coerce, self.validator_cls), "_model")
+            self.emit(indent, f"{dst} = {fn}({src}, path, errors)")
+        else:
+            model_plan = self.const(plan, "_plan")
+            self.emit(indent, f"{dst} = _delegate({model_plan}, {src}, path, errors, {self.coerce})")
+        self.emit(indent, "path.pop()")
+
+    def emit_container(self, tp: TypePlan, src: str, dst: str, seg: str, indent: int):
+        origin = self.const(tp.origin, "_origin")
+        name = self.const(tp.name, "_name")
+        idx, item, res = self.var("i"), self.var("item"), self.var("r")
+
+        self.emit(indent, f"if type({src}) is not {origin}:")
+        self.emit(indent + 1, f"errors.append(_container_error(path + [{seg}], {src}, {name}))")
+        self.emit(indent + 1, f"{dst} = None")
+        self.emit(indent, "else:")
+        self.emit(indent + 1, f"path.append({seg})")
+
+        numeric = tp.item.numeric
+        loop_indent = indent + 1
+        if numeric is not None:
+            converter = self.const(numeric, "_numeric")
+            errors_count = self.var("e")
+            self.emit(loop_indent, f"{dst} = {converter}.convert_list({src}, {self.coerce})")
+            self.emit(loop_indent, f"if {dst} is None:")
+            loop_indent += 1
+            self.emit(loop_indent, f"{errors_count} = len(errors)")
+
+        if tp.item.batch is not None:
+            # пакетный конвертер отдает None на месте неудач, такие элементы
+            # (и в строгом режиме не прошедшие check) проверяются поштучно
+            batch = self.const(tp.item.batch, "_batch")
+            self.emit(loop_indent, f"{dst} = {batch}({src})")
+            self.emit(loop_indent, f"for {idx}, {item} in enumerate({src}):")
+            condition = f"{dst}[{idx}] is None"
+            if not self.coerce and tp.item.check is not None:
+                check = self.const(tp.item.check, "_check")
+                condition += f" or not {check}({item})"
+            self.emit(loop_indent + 1, f"if {condition}:")
+            self.emit_type(tp.item, item, res, idx, loop_indent + 2)
+            self.emit(loop_indent + 2, f"{dst}[{idx}] = {res}")
+        else:
+            self.emit(loop_indent, f"{dst} = []")
+            self.emit(loop_indent, f"for {idx}, {item} in enumerate({src}):")
+            self.emit_type(tp.item, item, res, idx, loop_indent + 1)
+            self.emit(loop_indent + 1, f"{dst}.append({res})")
+
+        if numeric is not None and numeric.dtype is not None:
+            self.emit(loop_indent, f"if len(errors) == {errors_count}:")
+            self.emit(loop_indent + 1, "try:")
+            self.emit(loop_indent + 2, f"{dst} = {converter}.to_ndarray({dst})")
+            self.emit(loop_indent + 1, "except OverflowError:")
+            self.emit(loop_indent + 2, f"errors.append(_overflow_error(path, {src}, {converter}.dtype, {name}))")
+            self.emit(loop_indent + 2, f"{dst} = None")
+
+        self.emit(indent + 1, "path.pop()")
+
+    def emit_scalar(self, tp: TypePlan, src: str, dst: str, seg: str, indent: int):
+        ctor = self.const(tp.convert, "_type")
+        name = self.const(tp.name, "_name")
+        caught = self.const((ValueError,) if self.coerce else (ValueError, ValidationError), "_caught")
+        check = None if self.coerce or tp.check is None else self.const(tp.check, "_check")
+
+        if tp.passthrough:
+            annotation = self.const(tp.annotation, "_type")
+            self.emit(indent, f"if type({src}) is {annotation}:")
+            self.emit(indent + 1, f"{dst} = {src}")
+            self.emit(indent, "else:")
+            indent += 1
+
+        construct_indent = indent
+        if check is not None:
+            self.emit(indent, f"if not {check}({src}):")
+            self.emit(indent + 1, f"{dst} = _FAILED")
+            self.emit(indent, "else:")
+            construct_indent += 1
+
+        cache_indent = construct_indent
+        if tp.coercion_cache is not None:
+            cache = self.const(tp.coercion_cache, "_cache")
+            self.emit(cache_indent, f"if type({src}) in _CACHEABLE_TYPES:")
+            self.emit(cache_indent + 1, f"{dst} = {cache}.construct({ctor}, {src}, {caught})")
+            self.emit(cache_indent, "else:")
+            construct_indent += 1
+
+        self.emit(construct_indent, "try:")
+        self.emit(construct_indent + 1, f"{dst} = {ctor}({src})")
+        self.emit(construct_indent, f"except {caught}:")
+        self.emit(construct_indent + 1, f"{dst} = _FAILED")
+
+        if self.coerce or check is not None:
+            self.emit(indent, f"if {dst} is _FAILED:")
+        else:
+            self.emit(indent, f"if {dst} is _FAILED or not isinstance({dst}, type({src})):")
+        if self.coerce:
+            self.emit(indent + 1, f"errors.append(_coerce_error(path + [{seg}], {src}, {name}))")
+        else:
+            self.emit(indent + 1, f"errors.append(_strict_error(path + [{seg}], {src}, {name}))")
+        self.emit(indent + 1, f"{dst} = None")
+
+    def emit_union(self, tp: TypePlan, src: str, dst: str, seg: str, indent: int):
+        members = {id(member): idx for idx, member in enumerate(tp.members)}
+        dispatch = self.const(
+            {runtime_type: members[id(member)] for runtime_type, member in tp.dispatch.items()},
+            "_dispatch",
+        )
+        union = self.const(tp, "_union")
+        member_idx = self.var("m")
+
+        self.emit(indent, f"{member_idx} = {dispatch}.get(type({src}))")
+        keyword = "if"
+        for idx, member in enumerate(tp.members):
+            if member not in tp.dispatch.values():
+                continue
+            self.emit(indent, f"{keyword} {member_idx} == {idx}:")
+            self.emit_type(member, src, dst, seg, indent + 1)
+            keyword = "elif"
+
+        if keyword == "elif":
+            self.emit(indent, "else:")
+            indent += 1
+        model_plan = self.const(self.plan, "_plan")
+        self.emit(indent, f"path.append({seg})")
+        self.emit(indent, f"{dst} = _try_union_members({model_plan}, {union}, {src}, path, errors, {self.coerce})")
+        self.emit(indent, "path.pop()")
+
+    def variant_function(self, plan: ModelPlan) -> Callable[[Any, list, list], dict]:
+        if plan.validator_cls is self.validator_cls:
+            return get_function(plan, self.coerce, self.validator_cls)
+
+        def delegate(obj, path, errors, plan=plan, coerce=self.coerce):
+            return _delegate(plan, obj, path, errors, coerce)
+        return delegate
+
+    def emit_tagged(self, tp: TypePlan, src: str, dst: str, seg: str, indent: int):
+        name = self.const(tp.name, "_name")
+        tag = repr(tp.tag)
+        variants = self.const(
+            {tag_value: self.variant_function(plan) for tag_value, plan in tp.variants.items()},
+            "_variants",
+        )
+        fn = self.var("fn")
+
+        self.emit(indent, f"path.append({seg})")
+        self.emit(indent, f"if not isinstance({src}, dict):")
+        self.emit(indent + 1, f"errors.append(_dict_error(path, {src}, {name}))")
+        self.emit(indent + 1, f"{dst} = None")
+        self.emit(indent, f"elif {tag} not in {src}:")
+        self.emit(indent + 1, f"errors.append(_missing_error(path, {tag}, {name}))")
+        self.emit(indent + 1, f"{dst} = None")
+        self.emit(indent, "else:")
+        self.emit(indent + 1, f"{fn} = _select_variant({variants}, {src}[{tag}])")
+        self.emit(indent + 1, f"if {fn} is None:")
+        self.emit(indent + 2, f"errors.append(_tag_error(path, {src}[{tag}], {tag}, {variants}, {name}))")
+        self.emit(indent + 2, f"{dst} = None")
+        self.emit(indent + 1, "else:")
+        self.emit(indent + 2, f"{dst} = {fn}({src}, path, errors)")
+        self.emit(indent, "path.pop()")
+
+    def emit_type(self, tp: TypePlan, src: str, dst: str, seg: str, indent: int):
+        if tp.model is not None:
+            self.emit_model(tp.model, src, dst, seg, indent)
+        elif tp.origin is not None:
+            self.emit_container(tp, src, dst, seg, indent)
+        elif tp.members is not None:
+            self.emit_union(tp, src, dst, seg, indent)
+        elif tp.variants is not None:
+            self.emit_tagged(tp, src, dst, seg, indent)
+        else:
+            self.emit_scalar(tp, src, dst, seg, indent)
+
+    def build(self) -> Callable[[Any, list, list], dict]:
+        plan = self.plan
+        fn_name = f"validate_{plan.name}_{'coerce' if self.coerce else 'strict'}"
+
+        self.emit(0, f"def {fn_name}(obj, path, errors):")
+        self.emit(1, "if not isinstance(obj, dict):")
+        self.emit(2, f"errors.append(_dict_error(path, obj, {plan.name!r}))")
+        self.emit(2, "return {}")
+        self.emit(1, "result = {}")
+
+        for field in plan.fields:
+            key = repr(field.name)
+            value, res = self.var("v"), self.var("r")
+
+            self.emit(1, f"{value} = obj.get({key}, _MISSING)")
+            self.emit(1, f"if {value} is _MISSING:")
+            if field.has_default:
+                default = self.const(field.default, "_default")
+                self.emit(2, f"result[{key}] = {default}")
+            else:
+                self.emit(2, f"errors.append(_missing_error(path, {key}, {field.type.name!r}))")
+            self.emit(1, "else:")
+            self.emit_type(field.type, value, res, key, 2)
+            self.emit(2, f"result[{key}] = {res}")
+
+        if plan.record_cls is not None:
+            self.emit(1, f"return {self.const(plan.record_cls, '_record')}(result)")
+        else:
+            self.emit(1, "return result")
+
+        source = "\n".join(self.lines) + "\n"
+        filename = f"<serializer generated {fn_name} {next(_unique_id)}>"
+        # исходник регистрируется в linecache, чтобы трейсбеки показывали сгенерированный код
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        exec(compile(source, filename, "exec"), self.namespace)
+
+        fn = self.namespace[fn_name]
+        fn.__source__ = source
+        return fn
+
+
+# функции, которые строятся сейчас (None — еще не готова). В plan.generated
+# они попадают только после сборки всех связанных моделей, иначе другой поток
+# мог бы вызвать ссылку на еще не построенную функцию
+_building: dict[tuple[ModelPlan, bool], Callable[[Any, list, list], dict] | None] = {}
+_build_lock = threading.RLock()
+
+
+def _late_bound(generated: dict, coerce: bool) -> Callable[[Any, list, list], dict]:
+    # ссылка на модель, функция которой еще строится (рекурсивная модель):
+    # функция берется из плана в момент вызова
+    def call(obj: Any, path: list, errors: list) -> dict:
+        return generated[coerce](obj, path, errors)
+    return call
+
+
+def get_function(plan: ModelPlan, coerce: bool, validator_cls: type) -> Callable[[Any, list, list], dict]:
+    fn = plan.generated.get(coerce)
+    if fn is not None:
+        return fn
+
+    with _build_lock:
+        fn = plan.generated.get(coerce)
+        if fn is not None:
+            return fn
+
+        key = (plan, coerce)
+        if key in _building:
+            return _building[key] or _late_bound(plan.generated, coerce)
+
+        is_root = not _building
+        _building[key] = None
+        try:
+            _building[key] = _FunctionBuilder(plan, coerce, validator_cls).build()
+        except BaseException:
+            if is_root:
+                _building.clear()
+            raise
+
+        fn = _building[key]
+        if is_root:
+            for (built_plan, built_coerce), built_fn in _building.items():
+                built_plan.generated[built_coerce] = built_fn
+            _building.clear()
+        return fn
+
+
+class CodegenValidator(SchemaValidator):
+    def __init__(self, plan: ModelPlan, context: ValidationContext | None, coerce: bool):
+        super().__init__(plan, context, coerce)
+        self._fn = get_function(plan, coerce, type(self))
+
+    def validate_json(self, obj: dict) -> dict:
+        if self.ctx.memo is not None or self.ctx.hooks is not None:
+            # сгенерированный код не работает с кэшем поддеревьев и хуками
+            return super().validate_json(obj)
+        return self._fn(obj, self.ctx.path, self.ctx.errors)
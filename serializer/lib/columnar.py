@@ -0,0 +1,142 @@
+from typing import Any, Iterable, Iterator
+
+from .exc import ErrorLimitReached, ValidationError
+from .numeric import NUMERIC_TYPES, np
+from .plan import FieldPlan, ModelPlan
+from .schema_validator import SchemaValidator
+
+
+class _Layout:
+    # поля модели: у листового поля есть колонка, у вложенной модели — свой layout
+    __slots__ = ("plan", "entries", "columns")
+
+    def __init__(self, plan: ModelPlan, prefix: str, columns: dict[str, list], parents: tuple[ModelPlan, ...] = ()):
+        self.plan = plan
+        self.entries: list[tuple[FieldPlan, list | None, _Layout | None]] = []
+        # все колонки поддерева, чтобы заполнять их None, если вложенного объекта нет
+        self.columns: list[list] = []
+
+        parents = parents + (plan,)
+        for field in plan.fields:
+            name = prefix + field.name
+            nested = field.type.model
+            # рекурсивная модель не разворачивается, а остается колонкой словарей
+            if nested is not None and nested not in parents:
+                child = _Layout(nested, name + ".", columns, parents)
+                self.entries.append((field, None, child))
+                self.columns.extend(child.columns)
+            else:
+                column = columns[name] = []
+                self.entries.append((field, column, None))
+                self.columns.append(column)
+
+
+class ColumnarValidation:
+    """Пакетная валидация с записью значений в колонки, без словаря на каждую запись.
+
+    Колонки называются по полям модели, поля вложенных моделей — через точку
+    (``contact.phone``). Значения и ошибки совпадают с ``validator.validate_json``.
+    """
+
+    def __init__(self, validator: SchemaValidator):
+        self.validator = validator
+        self.ctx = validator.ctx
+        self.columns: dict[str, list] = {}
+        self.layout = _Layout(validator.plan, "", self.columns)
+        # _process_missing_field пишет значение по умолчанию в словарь
+        self._missing: dict[str, Any] = {}
+
+    def _fill_none(self, layout: _Layout):
+        for column in layout.columns:
+            column.append(None)
+
+    def _validate_into(self, obj: dict, layout: _Layout):
+        ctx = self.ctx
+        validator = self.validator
+        path_depth = ctx.depth
+
+        for field, column, child in layout.entries:
+            ctx.append_path(field.name)
+            try:
+                value = obj[field.name]
+            except KeyError:
+                validator._process_missing_field(field, self._missing)
+                value = self._missing.pop(field.name, None)
+                if child is None:
+                    column.append(value)
+                elif value is None:
+                    self._fill_none(child)
+                else:
+                    self._validate_nested(value, child)
+            else:
+                if child is None:
+                    column.append(validator._validate_value_type(value, field.type))
+                else:
+                    self._validate_nested(value, child)
+            ctx.remove_path_from_idx(path_depth)
+
+    def _validate_nested(self, value: Any, layout: _Layout):
+        if isinstance(value, dict):
+            self._validate_into(value, layout)
+            return
+
+        self.ctx.add_error(
+            ValidationError(
+                path=self.ctx.path,
+                value=value,
+                cause=f"Значение должно быть типа dict",
+                expected_type=layout.plan.name,
+            )
+        )
+        self._fill_none(layout)
+
+    def append_empty_row(self):
+        self._fill_none(self.layout)
+
+    def iter_validate(self, objs: Iterable[Any]) -> Iterator[tuple[int, list[ValidationError] | None]]:
+        """Дописывает строку в колонки для каждой записи; у невалидных строк
+        колонки обрезаются обратно, решение о строке остается за вызывающим."""
+        ctx = self.ctx
+        layout = self.layout
+
+        for idx, obj in enumerate(objs):
+            rows = len(layout.columns[0]) if layout.columns else 0
+            try:
+                if isinstance(obj, dict):
+                    self._validate_into(obj, layout)
+                else:
+                    self.validator._validate_model(obj, layout.plan)
+            except ErrorLimitReached:
+                ctx.remove_path_from_idx(0)
+
+            if not ctx.errors:
+                yield idx, None
+                continue
+
+            for column in layout.columns:
+                del column[rows:]
+            yield idx, ctx.take_errors()
+
+    def to_ndarrays(self, valid: list[bool]) -> tuple[dict[str, Any], Any]:
+        # числовые колонки становятся массивами, невалидные строки в них
+        # заполнены нулями и отмечаются маской valid
+        arrays: dict[str, Any] = {}
+        for name, column, field in self._leaves(self.layout, ""):
+            annotation = field.type.annotation
+            if annotation not in NUMERIC_TYPES:
+                arrays[name] = column
+                continue
+
+            zero = annotation()
+            try:
+                arrays[name] = np.array([zero if value is None else value for value in column], dtype=annotation)
+            except OverflowError:
+                arrays[name] = column
+        return arrays, np.array(valid, dtype=bool)
+
+    def _leaves(self, layout: _Layout, prefix: str) -> Iterator[tuple[str, list, FieldPlan]]:
+        for field, column, child in layout.entries:
+            if child is None:
+                yield prefix + field.name, column, field
+            else:
+                yield from self._leaves(child, prefix + field.name + ".")
@@ -1,22 +1,62 @@
 from typing import Self
 
-from .exc import ValidationError
+from .cache import SubtreeCache
+from .exc import ErrorLimitReached, ValidationError
+from .hooks import ValidationHooks
+
+
+class LimitedErrorList(list):
+    """Список ошибок, прерывающий обход при достижении лимита.
+
+    ``limit_reached`` означает лишь, что записано ``max_errors`` ошибок:
+    были ли ошибки дальше, неизвестно, обход на этом останавливается.
+    """
+
+    def __init__(self, max_errors: int):
+        super().__init__()
+        self.max_errors = max_errors
+        self.limit_reached = False
+
+    def append(self, error: ValidationError):
+        super().append(error)
+        if len(self) >= self.max_errors:
+            self.limit_reached = True
+            raise ErrorLimitReached
+
+
+def materialize_path(path_stack: list[str | int]) -> list[str]:
+    return [f"[{segment}]" if type(segment) is int else segment for segment in path_stack]
 
 
 class ValidationContext:
-    def __init__(self):
-        self._errors: list[ValidationError] = []
-        self._path_stack = []
+    def __init__(self, max_errors: int | None = None, memo: SubtreeCache | None = None, hooks: ValidationHooks | None = None):
+        self.max_errors = max_errors
+        self.memo = memo
+        self.hooks = hooks
+        self._errors: list[ValidationError] = self._new_error_list()
+        # индексы элементов списков хранятся как int и превращаются в "[idx]"
+        # только при построении пути для ошибки
+        self._path_stack: list[str | int] = []
 
-    def append_path(self, path: str):
+    def append_path(self, path: str | int):
         self._path_stack.append(path)
     
     def remove_path_from_idx(self, idx: int):
-        self._path_stack = self._path_stack[:idx]
+        del self._path_stack[idx:]
+
+    def _new_error_list(self) -> list[ValidationError]:
+        if self.max_errors is None:
+            return []
+        return LimitedErrorList(self.max_errors)
 
     def add_error(self, error: ValidationError):
         self._errors.append(error)
 
+    def take_errors(self) -> list[ValidationError]:
+        errors = self._errors
+        self._errors = self._new_error_list()
+        return errors
+
     @property 
     def errors(self):
         return self._errors
@@ -26,28 +66,24 @@ class ValidationContext:
         self._errors = value
 
     @property
-    def path(self):
-        return self._path_stack
+    def path(self) -> list[str]:
+        return materialize_path(self._path_stack)
     
     @path.setter
     def path(self, value: list):
-        self._path_stack = value
+        self._path_stack = list(value)
+
+    @property
+    def limit_reached(self) -> bool:
+        return getattr(self._errors, "limit_reached", False)
 
     @property
     def depth(self):
         return len(self._path_stack)
-
-    @classmethod
-    def _join_contexts(cls, other: 'ValidationContext') -> 'ValidationContext':
-        new_ctx = ValidationContext()
-        new_ctx.errors = other.errors
-        new_ctx.path = other.path
-        
-        return new_ctx
     
     @classmethod
     def init_context(cls, context: Self | None):
         if not context:
             return ValidationContext()
                 
-        return cls._join_contexts(context)
\ No newline at end of file
+        return context
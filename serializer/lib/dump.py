@@ -0,0 +1,195 @@
+import json
+import threading
+from itertools import islice
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from .plan import ModelPlan, TypePlan
+from .records import Record
+
+
+DEFAULT_DUMP_BATCH_SIZE = 1000
+
+# компактный вывод без экранирования не-ASCII символов; экземпляр создается
+# один раз, а не на каждый вызов, как у json.dumps с параметрами
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+# план модели, которой при сериализации преобразования не нужны
+_NO_CONVERSION = object()
+# функции, которые строятся сейчас (None — еще не готова). В plan.dumper они
+# попадают только после сборки всех связанных моделей, иначе другой поток
+# получил бы недостроенную функцию
+_compiling: dict[ModelPlan, Any] = {}
+_compile_lock = threading.RLock()
+
+
+def _call_dumper(plan: ModelPlan, value: Any) -> Any:
+    dumper = plan.dumper
+    return value if dumper is _NO_CONVERSION else dumper(value)
+
+
+def model_dumper(plan: ModelPlan) -> Callable[[Any], Any] | None:
+    """Функция, превращающая результат валидации модели в JSON-совместимые данные.
+
+    ``None`` — преобразования не нужны, данные сериализуются как есть.
+    """
+    dumper = plan.dumper
+    if dumper is None:
+        dumper = _compile(plan)
+    return None if dumper is _NO_CONVERSION else dumper
+
+
+def _compile(plan: ModelPlan) -> Any:
+    with _compile_lock:
+        if plan.dumper is not None:
+            return plan.dumper
+
+        if plan in _compiling:
+            # рекурсивная ссылка на модель: функция берется из плана при вызове
+            return _compiling[plan] or (lambda value: _call_dumper(plan, value))
+
+        is_root = not _compiling
+        _compiling[plan] = None
+        try:
+            _compiling[plan] = dumper = _compile_model_dumper(plan)
+        except BaseException:
+            if is_root:
+                _compiling.clear()
+            raise
+
+        if is_root:
+            for compiled_plan, compiled_dumper in _compiling.items():
+                compiled_plan.dumper = compiled_dumper
+            _compiling.clear()
+        return dumper
+
+
+def _compile_model_dumper(plan: ModelPlan) -> Any:
+    field_dumpers = tuple(
+        (field.name, dumper)
+        for field in plan.fields
+        if (dumper := _type_dumper(field.type)) is not None
+    )
+    if not field_dumpers and plan.record_cls is None:
+        return _NO_CONVERSION
+
+    def dump_model(value: Any) -> Any:
+        if type(value) is dict:
+            result = value.copy()
+        elif isinstance(value, Record):
+            result = {name: getattr(value, name) for name in value._fields}
+        else:
+            return value
+
+        for name, dumper in field_dumpers:
+            item = result.get(name)
+            if item is not None:
+                result[name] = dumper(item)
+        return result
+
+    return dump_model
+
+
+def _type_dumper(tp: TypePlan) -> Callable[[Any], Any] | None:
+    if tp.model is not None:
+        return model_dumper(tp.model)
+
+    if tp.item is not None:
+        return _list_dumper(tp)
+
+    if tp.members is not None:
+        return _union_dumper(tp)
+
+    if tp.variants is not None:
+        return _tagged_dumper(tp)
+
+    return tp.encode
+
+
+def _list_dumper(tp: TypePlan) -> Callable[[Any], Any] | None:
+    numeric = tp.item.numeric
+    if numeric is not None and numeric.dtype is not None:
+        return lambda value: value if type(value) is list else value.tolist()
+
+    item_dumper = _type_dumper(tp.item)
+    if item_dumper is None:
+        return None
+    return lambda value: [item_dumper(item) if item is not None else None for item in value]
+
+
+def _union_dumper(tp: TypePlan) -> Callable[[Any], Any] | None:
+    members = tp.trial_members[True]
+    if len(members) == 1:
+        # Optional[X]: None до дампера не доходит
+        return _type_dumper(members[0])
+
+    dict_member = tp.dispatch.get(dict)
+    list_member = tp.dispatch.get(list)
+    dict_dumper = _type_dumper(dict_member) if dict_member is not None else None
+    list_dumper = _type_dumper(list_member) if list_member is not None else None
+    # валидированные скаляры разных членов не различить по типу (PhoneNumber —
+    # тоже str), поэтому скаляр кодируется, только если скалярный член один
+    scalars = [member for member in members if member.model is None and member.origin is None and member.variants is None]
+    scalar_dumper = scalars[0].encode if len(scalars) == 1 else None
+    if dict_dumper is None and list_dumper is None and scalar_dumper is None:
+        return None
+
+    def dump_union(value: Any) -> Any:
+        if isinstance(value, (dict, Record)):
+            return value if dict_dumper is None else dict_dumper(value)
+        if type(value) is list:
+            return value if list_dumper is None else list_dumper(value)
+        return value if scalar_dumper is None else scalar_dumper(value)
+
+    return dump_union
+
+
+def _tagged_dumper(tp: TypePlan) -> Callable[[Any], Any] | None:
+    tag = tp.tag
+    by_tag = {}
+    by_model = {}
+    for tag_value, plan in tp.variants.items():
+        dumper = model_dumper(plan)
+        if dumper is not None:
+            by_tag[tag_value] = by_model[plan.model] = dumper
+    if not by_tag:
+        return None
+
+    def dump_tagged(value: Any) -> Any:
+        if type(value) is dict:
+            dumper = by_tag.get(value.get(tag))
+        else:
+            dumper = by_model.get(getattr(value, "_model", None))
+        return value if dumper is None else dumper(value)
+
+    return dump_tagged
+
+
+def dump(plan: ModelPlan, obj: Any) -> Any:
+    dumper = model_dumper(plan)
+    return obj if dumper is None else dumper(obj)
+
+
+def dumps(plan: ModelPlan, obj: Any) -> bytes:
+    return _json_encode(dump(plan, obj)).encode()
+
+
+def iter_dumps(plan: ModelPlan, objs: Iterable[Any], batch_size: int = DEFAULT_DUMP_BATCH_SIZE) -> Iterator[bytes]:
+    """JSON-массив по частям: каждая пачка из ``batch_size`` объектов кодируется одним вызовом."""
+    dumper = model_dumper(plan)
+    objs = iter(objs)
+    separator = ""
+
+    yield b"["
+    while batch := list(islice(objs, batch_size)):
+        if dumper is not None:
+            batch = [dumper(obj) for obj in batch]
+        # кодируется список целиком, скобки отрезаются
+        yield (separator + _json_encode(batch)[1:-1]).encode()
+        separator = ","
+    yield b"]"
+
+
+def dump_to(plan: ModelPlan, objs: Iterable[Any], fp: IO[bytes], batch_size: int = DEFAULT_DUMP_BATCH_SIZE):
+    write = fp.write
+    for chunk in iter_dumps(plan, objs, batch_size):
+        write(chunk)
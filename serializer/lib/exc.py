@@ -1,4 +1,5 @@
 import json
+from functools import cached_property
 from typing import Any
 
 
@@ -9,6 +10,9 @@ class ValidationError(Exception):
         self.value = value
         self.expected_type = expected_type
         super().__init__(*args)
+
+    def __reduce__(self):
+        return type(self), (self.path, self.value, self.message, self.expected_type, *self.args)
         
     def as_dict(self):
         return {
@@ -19,16 +23,59 @@ class ValidationError(Exception):
         }
 
 
+class ErrorLimitReached(Exception):
+    pass
+
+
 class ValidationErrorGroup(Exception):
     def __init__(self, errors: list[ValidationError], cls_name: str):
-        self.errors = [error.as_dict() for error in errors]
-        super().__init__(self.format_error_message(self.errors, cls_name))
+        # словари ошибок и текст сообщения строятся только при первом обращении:
+        # часто исключение перехватывают лишь для того, чтобы посчитать ошибки
+        self.validation_errors = errors
+        self.cls_name = cls_name
+        super().__init__()
+
+    def __reduce__(self):
+        return type(self), (self.validation_errors, self.cls_name)
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.error_count} errors for {self.cls_name})"
+
+    @property
+    def error_count(self) -> int:
+        return len(self.validation_errors)
+
+    @property
+    def limit_reached(self) -> bool:
+        return getattr(self.validation_errors, "limit_reached", False)
+
+    @cached_property
+    def errors(self) -> list[dict]:
+        return [error.as_dict() for error in self.validation_errors]
+
+    @cached_property
+    def message(self) -> str:
+        return self.format_error_message(self.errors, self.cls_name, self.limit_reached)
+
+    def to_json_bytes(self) -> bytes:
+        return json.dumps(
+            {"model": self.cls_name, "limit_reached": self.limit_reached, "errors": self.errors},
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        ).encode()
     
-    def format_error_message(self, errors_as_dict: list[dict], cls_name: str):
+    def format_error_message(self, errors_as_dict: list[dict], cls_name: str, limit_reached: bool = False):
         err_count = len(errors_as_dict)
-        msg = f"Got {err_count} validation errors for {cls_name}: \n\n"
+        parts = [f"Got {err_count} validation errors for {cls_name}: \n\n"]
+        if limit_reached:
+            # лимит мог совпасть с числом ошибок, поэтому не утверждаем, что их было больше
+            parts[0] = f"Got {err_count} validation errors for {cls_name} (error limit reached, validation stopped): \n\n"
 
         for err in errors_as_dict:
-            msg += json.dumps(err, indent=4, ensure_ascii=False, separators=(",", ": "))
-            msg += "\n\n"
-        return msg
+            parts.append(json.dumps(err, indent=4, ensure_ascii=False, separators=(",", ": "), default=str))
+            parts.append("\n\n")
+        return "".join(parts)
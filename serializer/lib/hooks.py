@@ -0,0 +1,91 @@
+from typing import Any, Callable
+
+from .exc import ValidationError
+
+
+class ValidationHooks:
+    """Обратные вызовы валидации; методы по умолчанию ничего не делают.
+
+    Обработчики можно переопределить в подклассе или передать в конструктор.
+    ``on_field`` получает время и число ошибок поля вместе с вложенными
+    моделями, ``on_error`` вызывается один раз для каждой ошибки итогового
+    результата (ошибки неудачных попыток членов объединения не сообщаются).
+    """
+
+    def __init__(
+        self,
+        on_model_start: Callable[[str], Any] | None = None,
+        on_model_end: Callable[[str, float], Any] | None = None,
+        on_field: Callable[[str, str, float, int], Any] | None = None,
+        on_error: Callable[[ValidationError], Any] | None = None,
+    ):
+        for name, callback in (
+            ("on_model_start", on_model_start),
+            ("on_model_end", on_model_end),
+            ("on_field", on_field),
+            ("on_error", on_error),
+        ):
+            if callback is not None:
+                setattr(self, name, callback)
+
+    def on_model_start(self, model: str):
+        pass
+
+    def on_model_end(self, model: str, elapsed: float):
+        pass
+
+    def on_field(self, model: str, field: str, elapsed: float, errors: int):
+        pass
+
+    def on_error(self, error: ValidationError):
+        pass
+
+
+def error_path_pattern(path: list[str]) -> str:
+    # индексы списков заменяются на [*], чтобы число разных путей не росло с данными
+    return ".".join("[*]" if segment.startswith("[") else segment for segment in path)
+
+
+class ProfileCollector(ValidationHooks):
+    """Накапливает число вызовов и время по моделям и полям ``Model.field``
+    и число ошибок по путям и типам."""
+
+    def __init__(self):
+        self.clear()
+
+    def on_model_end(self, model: str, elapsed: float):
+        stats = self.models.get(model)
+        if stats is None:
+            stats = self.models[model] = {"calls": 0, "time": 0.0}
+        stats["calls"] += 1
+        stats["time"] += elapsed
+
+    def on_field(self, model: str, field: str, elapsed: float, errors: int):
+        key = f"{model}.{field}"
+        stats = self.fields.get(key)
+        if stats is None:
+            stats = self.fields[key] = {"calls": 0, "time": 0.0, "errors": 0}
+        stats["calls"] += 1
+        stats["time"] += elapsed
+        stats["errors"] += errors
+
+    def on_error(self, error: ValidationError):
+        path = error_path_pattern(error.path)
+        self.errors_by_path[path] = self.errors_by_path.get(path, 0) + 1
+        self.errors_by_type[error.expected_type] = self.errors_by_type.get(error.expected_type, 0) + 1
+
+    def clear(self):
+        self.models: dict[str, dict] = {}
+        self.fields: dict[str, dict] = {}
+        self.errors_by_path: dict[str, int] = {}
+        self.errors_by_type: dict[str, int] = {}
+
+    def to_dict(self) -> dict:
+        return {
+            "models": {name: dict(stats) for name, stats in self.models.items()},
+            "fields": {name: dict(stats) for name, stats in self.fields.items()},
+            "errors": {
+                "by_path": dict(self.errors_by_path),
+                "by_type": dict(self.errors_by_type),
+            },
+        }
@@ -0,0 +1,196 @@
+import json
+import re
+from json.decoder import scanstring
+from typing import Any
+
+from .plan import ModelPlan, TypePlan
+from .schema_validator import SchemaValidator
+
+
+_scan_once = json.JSONDecoder().scan_once
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# ключ без escape-последовательностей и управляющих символов вместе с двоеточием
+# разбирается одним совпадением, остальные ключи — через scanstring
+_SIMPLE_KEY = re.compile(r'"([^"\\\x00-\x1f]*)"[ \t\n\r]*:[ \t\n\r]*')
+_DELIMITER = re.compile(r"[ \t\n\r]*([,}\]]|)[ \t\n\r]*")
+
+
+class SchemaParser:
+    """Разбирает JSON-текст по плану модели и валидирует значения по мере разбора.
+
+    Результат и ошибки совпадают с ``validator.validate_json(json.loads(s))``,
+    значения ключей, которых нет в модели, только проверяются на синтаксис.
+    При лимите ошибок документ разбирается целиком, а лимит применяется к
+    ошибкам в порядке объявления полей.
+    """
+
+    def __init__(self, validator: SchemaValidator):
+        self.validator = validator
+        self.ctx = validator.ctx
+
+    def _skip_whitespace(self, s: str, idx: int) -> int:
+        return _WHITESPACE.match(s, idx).end()
+
+    def _skip_value(self, s: str, idx: int) -> int:
+        # значение неизвестного ключа разбирается C-сканером json и отбрасывается:
+        # он проверяет синтаксис так же строго, как json.loads, и быстрее обхода
+        # токенов на Python
+        return self._scan_value(s, idx)[1]
+
+    def _parse_key(self, s: str, idx: int) -> tuple[str, int]:
+        if s[idx:idx + 1] != '"':
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", s, idx)
+        key, idx = scanstring(s, idx + 1)
+
+        idx = self._skip_whitespace(s, idx)
+        if s[idx:idx + 1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", s, idx)
+        return key, self._skip_whitespace(s, idx + 1)
+
+    def _scan_value(self, s: str, idx: int) -> tuple[Any, int]:
+        try:
+            return _scan_once(s, idx)
+        except StopIteration as err:
+            raise json.JSONDecodeError("Expecting value", s, err.value) from None
+
+    def _parse_value(self, s: str, idx: int, expected_type: TypePlan) -> tuple[Any, int]:
+        char = s[idx:idx + 1]
+
+        if expected_type.model is not None and char == "{":
+            return self._parse_model(s, idx, expected_type.model)
+
+        if expected_type.origin is list and char == "[" and expected_type.item.numeric is None:
+            return self._parse_list(s, idx, expected_type.item)
+
+        value, end = self._scan_value(s, idx)
+        return self.validator._validate_value_type(value, expected_type), end
+
+    def _parse_list(self, s: str, idx: int, expected_type: TypePlan) -> tuple[list, int]:
+        validated_lst = []
+
+        idx = self._skip_whitespace(s, idx + 1)
+        if s[idx:idx + 1] == "]":
+            return validated_lst, idx + 1
+
+        path_depth = self.ctx.depth
+        while True:
+            self.ctx.append_path(len(validated_lst))
+            value, idx = self._parse_value(s, idx, expected_type)
+            validated_lst.append(value)
+            self.ctx.remove_path_from_idx(path_depth)
+
+            match = _DELIMITER.match(s, idx)
+            char = match.group(1)
+            if char == "]":
+                return validated_lst, match.end()
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", s, idx)
+            idx = match.end()
+
+    def _parse_model(self, s: str, idx: int, plan: ModelPlan) -> tuple[dict, int]:
+        ctx = self.ctx
+        errors = ctx.errors
+        errors_start = len(errors)
+        path_depth = ctx.depth
+        # (индекс поля, начало, конец) — ошибки каждого поля в общем списке
+        error_spans = []
+        parsed = {}
+        in_order = True
+        last_field_idx = -1
+
+        idx = self._skip_whitespace(s, idx + 1)
+        if s[idx:idx + 1] == "}":
+            idx += 1
+        else:
+            while True:
+                match = _SIMPLE_KEY.match(s, idx)
+                if match is not None:
+                    key = match.group(1)
+                    idx = match.end()
+                else:
+                    key, idx = self._parse_key(s, idx)
+
+                field_idx = plan.field_index.get(key)
+                if field_idx is None:
+                    idx = self._skip_value(s, idx)
+                else:
+                    field = plan.fields[field_idx]
+                    in_order = in_order and field_idx > last_field_idx
+                    last_field_idx = field_idx
+
+                    field_errors_start = len(errors)
+                    ctx.append_path(key)
+                    parsed[key], idx = self._parse_value(s, idx, field.type)
+                    ctx.remove_path_from_idx(path_depth)
+                    # пустой диапазон тоже записывается: при повторе ключа он
+                    # заменяет ошибки предыдущего значения
+                    error_spans.append((field_idx, field_errors_start, len(errors)))
+
+                match = _DELIMITER.match(s, idx)
+                char = match.group(1)
+                if char == "}":
+                    idx = match.end()
+                    break
+                if char != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", s, idx)
+                idx = match.end()
+
+        has_missing = len(parsed) != len(plan.fields)
+        if has_missing:
+            for field_idx, field in enumerate(plan.fields):
+                if field.name in parsed:
+                    continue
+
+                field_errors_start = len(errors)
+                ctx.append_path(field.name)
+                self.validator._process_missing_field(field, parsed)
+                ctx.remove_path_from_idx(path_depth)
+                if len(errors) > field_errors_start:
+                    error_spans.append((field_idx, field_errors_start, len(errors)))
+
+        if has_missing or not in_order:
+            parsed = {field.name: parsed[field.name] for field in plan.fields if field.name in parsed}
+
+        if len(errors) > errors_start:
+            # ошибки переставляются в порядок объявления полей; при повторе ключа
+            # остаются ошибки последнего значения, как у json.loads
+            last_spans = {field_idx: (start, end) for field_idx, start, end in error_spans}
+            errors[errors_start:] = [
+                error
+                for field_idx in sorted(last_spans)
+                for error in errors[last_spans[field_idx][0]:last_spans[field_idx][1]]
+            ]
+
+        if plan.record_cls is not None:
+            return plan.record_cls(parsed), idx
+        return parsed, idx
+
+    def parse(self, s: str) -> dict:
+        idx = self._skip_whitespace(s, 0)
+        if s[idx:idx + 1] != "{":
+            value = self._scan_value(s, idx)[0]
+            raise TypeError(f"Must be dict type, got {type(value).__name__ }")
+
+        ctx = self.ctx
+        limited_errors = ctx.errors
+        if ctx.max_errors is not None:
+            # лимит сработал бы в порядке текста, а не в порядке объявления
+            # полей, поэтому ошибки собираются полностью и обрезаются после
+            # перестановки
+            ctx.errors = []
+        try:
+            validated_obj, idx = self._parse_model(s, idx, self.validator.plan)
+
+            idx = self._skip_whitespace(s, idx)
+            if idx != len(s):
+                raise json.JSONDecodeError("Extra data", s, idx)
+        finally:
+            errors = ctx.errors
+            ctx.errors = limited_errors
+
+        if errors is not limited_errors:
+            for error in errors[:ctx.max_errors]:
+                limited_errors.append(error)
+
+        return validated_obj
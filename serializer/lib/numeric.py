@@ -0,0 +1,53 @@
+from typing import Any, Callable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+NUMERIC_TYPES = (int, float, bool)
+
+
+class NumericList:
+    """Проверка списка int/float/bool целиком, без обхода элементов в Python.
+
+    В строгом режиме проверяется множество типов элементов, при приведении
+    конвертер применяется через ``map``; результат совпадает с поэлементной
+    проверкой. ``None`` означает, что в списке есть ошибки и его нужно
+    проверить поэлементно, чтобы найти индексы. При ``as_ndarray`` результатом
+    будет ``numpy.ndarray``.
+    """
+
+    __slots__ = ("annotation", "convert", "types", "dtype")
+
+    def __init__(self, annotation: type, convert: Callable[[Any], Any], as_ndarray: bool = False):
+        if as_ndarray and np is None:
+            raise ImportError("Для _ndarray_lists требуется numpy: pip install numpy")
+
+        self.annotation = annotation
+        self.convert = convert
+        self.types = frozenset((annotation,))
+        self.dtype = np.dtype(annotation) if as_ndarray else None
+
+    def convert_list(self, lst: list, coerce: bool) -> Any:
+        if coerce:
+            try:
+                values = list(map(self.convert, lst))
+            except (ValueError, TypeError, OverflowError):
+                return None
+        elif set(map(type, lst)) <= self.types:
+            values = lst.copy()
+        else:
+            return None
+
+        if self.dtype is None:
+            return values
+
+        try:
+            return self.to_ndarray(values)
+        except OverflowError:
+            return None
+
+    def to_ndarray(self, values: list) -> Any:
+        return np.array(values, dtype=self.dtype)
@@ -0,0 +1,51 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator
+
+from .exc import ValidationError
+
+
+# ниже этого размера пакет валидируется в текущем процессе: запуск пула и
+# передача данных между процессами обходятся дороже самой валидации
+DEFAULT_MIN_PARALLEL_SIZE = 10_000
+
+_worker_model: Any = None
+_worker_coerce: bool = False
+_worker_max_errors: int | None = None
+
+
+def _init_worker(model: type, coerce: bool, max_errors: int | None):
+    # модель передается воркеру один раз при старте, а не с каждым чанком
+    global _worker_model, _worker_coerce, _worker_max_errors
+    _worker_model = model
+    _worker_coerce = coerce
+    _worker_max_errors = max_errors
+
+
+def _validate_chunk(start: int, chunk: list) -> list[tuple[int, dict | None, list[ValidationError] | None]]:
+    return list(_worker_model._iter_validate(chunk, _worker_coerce, start, _worker_max_errors))
+
+
+def iter_validate_parallel(
+    model: type,
+    objs: list,
+    coerce: bool,
+    workers: int,
+    chunksize: int | None,
+    max_errors: int | None = None,
+) -> Iterator[tuple[int, dict | None, list[ValidationError] | None]]:
+    if not chunksize:
+        chunksize = max(1, -(-len(objs) // (workers * 4)))
+
+    starts = range(0, len(objs), chunksize)
+    chunks = (objs[start:start + chunksize] for start in starts)
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(model, coerce, max_errors),
+    )
+    try:
+        for results in executor.map(_validate_chunk, starts, chunks):
+            yield from results
+    finally:
+        executor.shutdown(cancel_futures=True)
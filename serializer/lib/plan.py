@@ -0,0 +1,294 @@
+import threading
+import types
+import typing
+from typing import Any, Iterable
+
+from .abstract import AbstractModel, AbstractTaggedUnion
+from .cache import CoercionCache
+from .numeric import NUMERIC_TYPES, NumericList
+from .records import Record, make_record_class
+from .registry import get_type_spec
+
+
+# значения ровно этих типов валидны как есть (конструкторы вернули бы их без
+# изменений), поэтому такие значения пропускаются без вызова конструктора
+PASSTHROUGH_TYPES = (str, int, float, bool, type(None))
+
+UNION_ORIGINS = (typing.Union, types.UnionType)
+
+
+def type_name(tp: Any) -> str:
+    if tp is type(None):
+        return "None"
+    if typing.get_origin(tp) in UNION_ORIGINS:
+        return " | ".join(type_name(arg) for arg in typing.get_args(tp))
+    return getattr(tp, "__name__", None) or repr(tp)
+
+
+class TypePlan:
+    __slots__ = (
+        "annotation", "name", "origin", "item", "model", "passthrough", "coercion_cache",
+        "convert", "check", "batch", "encode", "members", "dispatch", "trial_members",
+        "tag", "variants", "numeric",
+    )
+
+    def __init__(self, annotation: Any, coercion_cache: CoercionCache | None = None, ndarray_lists: bool = False):
+        self.annotation = annotation
+        self.name = type_name(annotation)
+        self.origin = typing.get_origin(annotation)
+        self.passthrough = annotation in PASSTHROUGH_TYPES
+        self.item: TypePlan | None = None
+        self.model: ModelPlan | None = None
+        self.coercion_cache: CoercionCache | None = None
+        # без регистрации тип проверяется вызовом конструктора
+        self.convert = annotation
+        self.check = None
+        self.batch = None
+        self.encode = None
+        self.members: tuple[TypePlan, ...] | None = None
+        self.dispatch: dict[type, TypePlan] = {}
+        self.trial_members: dict[bool, tuple[TypePlan, ...]] = {}
+        self.tag: str | None = None
+        self.variants: dict[Any, ModelPlan] | None = None
+        # заполняется только у элементов списков
+        self.numeric: NumericList | None = None
+
+        if self.origin in UNION_ORIGINS:
+            self.origin = None
+            self._compile_union(coercion_cache, ndarray_lists)
+        elif self.origin:
+            self.item = TypePlan(typing.get_args(annotation)[0], coercion_cache, ndarray_lists)
+            if self.item.annotation in NUMERIC_TYPES:
+                self.item.numeric = NumericList(self.item.annotation, self.item.convert, ndarray_lists)
+        elif isinstance(annotation, type) and issubclass(annotation, AbstractModel):
+            self.model = compile_model(annotation)
+        elif isinstance(annotation, AbstractTaggedUnion):
+            self.tag = annotation.tag
+            self.variants = {value: compile_model(model) for value, model in annotation.variants.items()}
+        else:
+            self.coercion_cache = coercion_cache
+            spec = get_type_spec(annotation)
+            if spec is not None:
+                self.convert = spec.coerce
+                self.check = spec.check
+                # пакетный конвертер обошел бы кэш, поэтому с кэшем элементы
+                # списков приводятся по одному через него
+                self.batch = spec.batch if coercion_cache is None else None
+                self.encode = spec.encode
+
+    def _compile_union(self, coercion_cache: CoercionCache | None, ndarray_lists: bool):
+        self.members = tuple(TypePlan(arg, coercion_cache, ndarray_lists) for arg in typing.get_args(self.annotation))
+
+        # точный тип значения -> единственный подходящий член объединения;
+        # типы, которым подходят несколько членов, в таблицу не попадают
+        candidates: dict[type, list[TypePlan]] = {}
+        for member in self.members:
+            if member.model is not None:
+                runtime_type = dict
+            elif member.origin is not None:
+                runtime_type = member.origin
+            elif isinstance(member.annotation, type):
+                runtime_type = member.annotation
+            else:
+                continue
+            candidates.setdefault(runtime_type, []).append(member)
+
+        self.dispatch = {
+            runtime_type: members[0]
+            for runtime_type, members in candidates.items()
+            if len(members) == 1
+        }
+
+        # перебор нужен, только если точный тип значения не нашелся в таблице.
+        # None подходит лишь самому None, а встроенные типы в строгом режиме —
+        # только значениям своего типа, поэтому перебирать их бессмысленно
+        trial = tuple(member for member in self.members if member.annotation is not type(None))
+        self.trial_members = {
+            True: trial,
+            False: tuple(member for member in trial if not member.passthrough),
+        }
+
+
+class FieldPlan:
+    __slots__ = ("name", "type", "default", "has_default")
+
+    def __init__(
+        self,
+        name: str,
+        annotation: Any,
+        default_values: dict,
+        coercion_cache: CoercionCache | None = None,
+        ndarray_lists: bool = False,
+    ):
+        self.name = name
+        self.type = TypePlan(annotation, coercion_cache, ndarray_lists)
+        self.default = default_values.get(name)
+        self.has_default = name in default_values
+
+
+class ModelPlan:
+    __slots__ = (
+        "model", "name", "fields", "field_index", "validator_cls", "generated", "record_cls", "projections",
+        "dumper",
+    )
+
+    def __init__(self, model: type):
+        self.model = model
+        self.name = model.__name__
+        self.validator_cls = model._validator_cls
+        self.fields: tuple[FieldPlan, ...] = ()
+        self.field_index: dict[str, int] = {}
+        self.generated: dict = {}
+        self.record_cls: type[Record] | None = None
+        self.projections: dict[tuple, ModelPlan] = {}
+        # функция сериализации, строится при первом dump (см. dump.py)
+        self.dumper: Any = None
+
+
+# планы, которые строятся сейчас; рекурсивные ссылки получают их отсюда.
+# В model._plan планы попадают только после сборки всех связанных моделей,
+# иначе другой поток мог бы валидировать по недостроенному плану
+_compiling: dict[type, ModelPlan] = {}
+_compile_lock = threading.RLock()
+
+
+def compile_model(model: type) -> ModelPlan:
+    plan = model.__dict__.get("_plan")
+    if plan is not None:
+        return plan
+
+    with _compile_lock:
+        plan = model.__dict__.get("_plan") or _compiling.get(model)
+        if plan is not None:
+            return plan
+
+        is_root = not _compiling
+        plan = _compiling[model] = ModelPlan(model)
+        try:
+            plan.fields = tuple(
+                FieldPlan(name, annotation, model._default_values, model._coercion_cache, model._ndarray_lists)
+                for name, annotation in model.__annotations__.items()
+            )
+            plan.field_index = {field.name: idx for idx, field in enumerate(plan.fields)}
+            if model._record_output:
+                plan.record_cls = make_record_class(model, tuple(field.name for field in plan.fields))
+        except BaseException:
+            if is_root:
+                _compiling.clear()
+            raise
+
+        if is_root:
+            for compiled_model, compiled_plan in _compiling.items():
+                compiled_model._plan = compiled_plan
+            _compiling.clear()
+    return plan
+
+
+def _copy(obj: Any, **changes: Any) -> Any:
+    clone = object.__new__(type(obj))
+    for slot in type(obj).__slots__:
+        setattr(clone, slot, changes[slot] if slot in changes else getattr(obj, slot))
+    return clone
+
+
+def _path_tree(paths: Iterable[str] | None) -> dict | None:
+    # {"a.b", "c"} -> {"a": {"b": {}}, "c": {}}; пустое поддерево — поле целиком
+    if paths is None:
+        return None
+
+    tree: dict = {}
+    for path in paths:
+        node = tree
+        for segment in path.split("."):
+            node = node.setdefault(segment, {})
+    return tree
+
+
+def _has_model(tp: TypePlan) -> bool:
+    if tp.model is not None or tp.variants is not None:
+        return True
+    if tp.item is not None:
+        return _has_model(tp.item)
+    return tp.members is not None and any(_has_model(member) for member in tp.members)
+
+
+def _project_type(tp: TypePlan, include: dict | None, exclude: dict | None, path: str) -> TypePlan:
+    if tp.model is not None:
+        return _copy(tp, model=_project_model(tp.model, include, exclude, path + "."))
+
+    if tp.item is not None:
+        item = _project_type(tp.item, include, exclude, path)
+        return _copy(tp, item=item)
+
+    if tp.members is not None:
+        if not _has_model(tp):
+            raise ValueError(f"Поле {path} не содержит моделей, выбрать вложенные поля нельзя")
+        # скалярные члены объединения остаются как есть
+        projected = {
+            id(member): _project_type(member, include, exclude, path) if _has_model(member) else member
+            for member in tp.members
+        }
+        return _copy(
+            tp,
+            members=tuple(projected[id(member)] for member in tp.members),
+            dispatch={runtime_type: projected[id(member)] for runtime_type, member in tp.dispatch.items()},
+            trial_members={
+                coerce: tuple(projected[id(member)] for member in members)
+                for coerce, members in tp.trial_members.items()
+            },
+        )
+
+    if tp.variants is not None:
+        return _copy(
+            tp,
+            variants={
+                tag_value: _project_model(plan, include, exclude, path + ".")
+                for tag_value, plan in tp.variants.items()
+            },
+        )
+
+    raise ValueError(f"Поле {path} не является моделью, выбрать вложенные поля нельзя")
+
+
+def _project_model(plan: ModelPlan, include: dict | None, exclude: dict | None, prefix: str = "") -> ModelPlan:
+    for name in (include or {}).keys() | (exclude or {}).keys():
+        if name not in plan.field_index:
+            raise ValueError(f"Поле {prefix}{name} отсутствует в модели {plan.name}")
+
+    fields = []
+    for field in plan.fields:
+        if include is not None and field.name not in include:
+            continue
+        field_include = include[field.name] or None if include is not None else None
+        field_exclude = exclude.get(field.name) if exclude is not None else None
+        if field_exclude == {}:
+            continue
+
+        if field_include is None and field_exclude is None:
+            fields.append(field)
+        else:
+            path = prefix + field.name
+            fields.append(_copy(field, type=_project_type(field.type, field_include, field_exclude, path)))
+
+    projected = ModelPlan(plan.model)
+    projected.fields = tuple(fields)
+    projected.field_index = {field.name: idx for idx, field in enumerate(projected.fields)}
+    if plan.record_cls is not None:
+        projected.record_cls = make_record_class(plan.model, tuple(field.name for field in projected.fields))
+    return projected
+
+
+def project_plan(plan: ModelPlan, include: Iterable[str] | None = None, exclude: Iterable[str] | None = None) -> ModelPlan:
+    """Урезанный план, в котором остаются только выбранные поля; кэшируется в исходном плане."""
+    if include is None and exclude is None:
+        return plan
+
+    key = (
+        frozenset(include) if include is not None else None,
+        frozenset(exclude) if exclude is not None else None,
+    )
+    try:
+        return plan.projections[key]
+    except KeyError:
+        projected = plan.projections[key] = _project_model(plan, _path_tree(key[0]), _path_tree(key[1]))
+        return projected
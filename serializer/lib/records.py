@@ -0,0 +1,54 @@
+from typing import Any
+
+
+class Record:
+    """Компактный результат валидации модели: значения полей хранятся в слотах.
+
+    Классы записей создаются для моделей с ``_record_output = True``;
+    ``to_dict()`` возвращает тот же словарь, что и валидация без записей.
+    """
+
+    __slots__ = ()
+    _model: type
+    _fields: tuple[str, ...] = ()
+
+    def __init__(self, values: dict):
+        for name in self._fields:
+            setattr(self, name, values.get(name))
+
+    def to_dict(self) -> dict:
+        return {name: _to_builtin(getattr(self, name)) for name in self._fields}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self):
+        # класс записи создается динамически, поэтому при распаковке он
+        # берется из плана модели
+        return _restore_record, (self._model, {name: getattr(self, name) for name in self._fields})
+
+
+def _to_builtin(value: Any) -> Any:
+    if isinstance(value, Record):
+        return value.to_dict()
+    if type(value) is list:
+        return [_to_builtin(item) for item in value]
+    return value
+
+
+def _restore_record(model: type, values: dict) -> Record:
+    return model._get_plan().record_cls(values)
+
+
+def make_record_class(model: type, fields: tuple[str, ...]) -> type[Record]:
+    return type(
+        f"{model.__name__}Record",
+        (Record,),
+        {"__slots__": fields, "__module__": model.__module__, "_model": model, "_fields": fields},
+    )
@@ -0,0 +1,70 @@
+from typing import Any, Callable
+
+
+class TypeSpec:
+    """Правила валидации скалярного типа.
+
+    ``check`` — дешевый предикат для строгого режима: значение, не прошедшее
+    его, отклоняется без вызова конвертера. ``coerce`` — конвертер, при
+    неудаче бросающий ``ValueError``. ``batch`` — необязательный конвертер
+    списка, возвращающий ``None`` на месте значений, которые не удалось
+    привести; такие элементы перепроверяются поштучно. ``encode`` —
+    необязательное преобразование валидированного значения при сериализации.
+    """
+
+    __slots__ = ("tp", "check", "coerce", "batch", "encode")
+
+    def __init__(
+        self,
+        tp: type,
+        check: Callable[[Any], bool] | None = None,
+        coerce: Callable[[Any], Any] | None = None,
+        batch: Callable[[list], list] | None = None,
+        encode: Callable[[Any], Any] | None = None,
+    ):
+        self.tp = tp
+        self.check = check
+        self.coerce = coerce if coerce is not None else tp
+        self.batch = batch
+        self.encode = encode
+
+
+_registry: dict[type, TypeSpec] = {}
+
+
+def register_type(
+    tp: type,
+    *,
+    check: Callable[[Any], bool] | None = None,
+    coerce: Callable[[Any], Any] | None = None,
+    batch: Callable[[list], list] | None = None,
+    encode: Callable[[Any], Any] | None = None,
+) -> TypeSpec:
+    # планы моделей строятся лениво и кэшируются, поэтому тип нужно
+    # зарегистрировать до первой валидации использующих его моделей
+    if not isinstance(tp, type):
+        raise TypeError(f"Ожидается тип, получено {tp!r}")
+
+    spec = _registry[tp] = TypeSpec(tp, check, coerce, batch, encode)
+    return spec
+
+
+def get_type_spec(tp: Any) -> TypeSpec | None:
+    try:
+        return _registry.get(tp)
+    except TypeError:
+        # нехэшируемые аннотации в реестре отсутствовать заведомо
+        return None
+
+
+def _exact_type_check(tp: type) -> Callable[[Any], bool]:
+    def check(value: Any) -> bool:
+        return type(value) is tp
+    return check
+
+
+# для str, int и float строгая проверка конструктором принимает только значения
+# ровно этого типа, поэтому она сводится к сравнению типов. bool остается без
+# регистрации: конструктор принимает и int (bool(1) — экземпляр int)
+for _tp in (str, int, float):
+    register_type(_tp, check=_exact_type_check(_tp))
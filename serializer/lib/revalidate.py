@@ -0,0 +1,237 @@
+from typing import Any, Iterable
+
+from .plan import FieldPlan, ModelPlan, TypePlan
+from .records import Record
+from .schema_validator import SchemaValidator
+
+
+PATCH_OPERATIONS = ("add", "replace", "remove")
+
+
+def parse_pointer(pointer: str) -> list[str]:
+    # JSON Pointer (RFC 6901): "/a/0/b~1c" -> ["a", "0", "b/c"]
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise ValueError(f"Некорректный путь {pointer!r}")
+    if not pointer:
+        return []
+    return [segment.replace("~1", "/").replace("~0", "~") for segment in pointer[1:].split("/")]
+
+
+def _is_model_value(value: Any) -> bool:
+    # результат валидации модели — словарь или запись (_record_output)
+    return type(value) is dict or isinstance(value, Record)
+
+
+def _get_item(container: Any, key: str | int) -> Any:
+    if isinstance(container, Record):
+        return getattr(container, key)
+    return container[key]
+
+
+def _set_item(container: Any, key: str | int, value: Any):
+    if isinstance(container, Record):
+        setattr(container, key, value)
+    else:
+        container[key] = value
+
+
+# отметки в дереве изменений: значение нужно провалидировать целиком или
+# поле удалено и нужно подставить значение по умолчанию
+_VALIDATE = object()
+_MISSING = object()
+
+
+class Revalidation:
+    """Применяет JSON Patch к уже валидированному документу.
+
+    Операции сначала применяются к документу без проверки, а затронутые
+    места отмечаются в дереве изменений. Валидация выполняется один раз по
+    итоговому документу: значение, перезаписанное или удаленное более поздней
+    операцией, ошибок не дает, а пути ошибок содержат итоговые индексы.
+    Контейнеры на пути к изменениям копируются, нетронутые поддеревья
+    переиспользуются по ссылке. Исходный документ не изменяется.
+    """
+
+    def __init__(self, validator: SchemaValidator):
+        self.validator = validator
+        self.ctx = validator.ctx
+        # id контейнеров, скопированных в этом патче, — их можно менять на месте
+        self._owned: set[int] = set()
+        # дерево изменений повторяет структуру документа: у модели — словарь
+        # поле -> отметка, у списка — список отметок той же длины
+        self._changes: Any = {}
+
+    def _own(self, container: dict | list | Record) -> dict | list | Record:
+        if id(container) in self._owned:
+            return container
+        if isinstance(container, Record):
+            copy = type(container)({name: getattr(container, name) for name in container._fields})
+        else:
+            copy = container.copy()
+        self._owned.add(id(copy))
+        return copy
+
+    def _container_schema(self, tp: TypePlan, value: Any, path: list[str]) -> ModelPlan | TypePlan:
+        if tp.model is not None and _is_model_value(value):
+            return tp.model
+        if tp.item is not None and type(value) is list:
+            return tp.item
+        if tp.members is not None:
+            member = tp.dispatch.get(dict if _is_model_value(value) else type(value))
+            if member is not None:
+                return self._container_schema(member, value, path)
+        if tp.variants is not None and _is_model_value(value):
+            try:
+                tag_value = getattr(value, tp.tag, None) if isinstance(value, Record) else value.get(tp.tag)
+                plan = tp.variants.get(tag_value)
+            except TypeError:
+                plan = None
+            if plan is not None:
+                return plan
+
+        raise ValueError(f"Путь /{'/'.join(path)} не ведет внутрь модели или списка")
+
+    def _list_index(self, segment: str, lst: list, op: str, path: list[str]) -> int:
+        size = len(lst)
+        if op == "add" and segment == "-":
+            return size
+        if not segment.isdigit() or (segment != "0" and segment.startswith("0")):
+            raise ValueError(f"Некорректный индекс списка в пути /{'/'.join(path)}")
+
+        idx = int(segment)
+        if idx > size or (idx == size and op != "add"):
+            raise ValueError(f"Индекс вне списка в пути /{'/'.join(path)}")
+        return idx
+
+    def _field(self, plan: ModelPlan, segment: str, path: list[str]) -> FieldPlan:
+        field_idx = plan.field_index.get(segment)
+        if field_idx is None:
+            raise ValueError(f"Поле /{'/'.join(path)} отсутствует в модели {plan.name}")
+        return plan.fields[field_idx]
+
+    def _child_changes(self, changes: Any, key: str | int, child: Any, schema: ModelPlan | TypePlan) -> Any:
+        if changes is _VALIDATE:
+            # внутри значения, которое и так будет провалидировано целиком
+            return _VALIDATE
+
+        child_changes = changes[key] if type(changes) is list else changes.get(key)
+        if type(child_changes) is not dict and type(child_changes) is not list:
+            child_changes = {} if isinstance(schema, ModelPlan) else [None] * len(child)
+            changes[key] = child_changes
+        return child_changes
+
+    def apply(self, root: dict | Record, operation: dict) -> dict | Record:
+        op = operation.get("op")
+        if op not in PATCH_OPERATIONS:
+            raise ValueError(f"Операция патча должна быть одной из {PATCH_OPERATIONS}, получено {op!r}")
+        if op != "remove" and "value" not in operation:
+            raise ValueError(f"Для операции {op} требуется value")
+
+        segments = parse_pointer(operation.get("path"))
+
+        if not segments:
+            if op == "remove":
+                raise ValueError("Нельзя удалить документ целиком")
+            self._owned.clear()
+            self._changes = _VALIDATE
+            return operation["value"]
+
+        if not _is_model_value(root):
+            raise ValueError(f"Путь /{'/'.join(segments)} не ведет внутрь модели или списка")
+
+        root = self._own(root)
+        container: dict | list | Record = root
+        schema: ModelPlan | TypePlan = self.validator.plan
+        changes = self._changes
+
+        for depth, segment in enumerate(segments[:-1], 1):
+            path = segments[:depth]
+            if isinstance(schema, ModelPlan):
+                key: str | int = segment
+                child_type = self._field(schema, segment, path).type
+                if not isinstance(container, Record) and segment not in container:
+                    raise ValueError(f"Путь /{'/'.join(path)} отсутствует в документе")
+            else:
+                key = self._list_index(segment, container, "replace", path)
+                child_type = schema
+
+            child = _get_item(container, key)
+            schema = self._container_schema(child_type, child, path)
+            child = self._own(child)
+            _set_item(container, key, child)
+            changes = self._child_changes(changes, key, child, schema)
+            container = child
+
+        segment = segments[-1]
+        if isinstance(schema, ModelPlan):
+            self._field(schema, segment, segments)
+            if op == "remove":
+                if isinstance(container, Record):
+                    # у записи отсутствующее поле хранится как None
+                    setattr(container, segment, None)
+                else:
+                    container.pop(segment, None)
+            else:
+                _set_item(container, segment, operation["value"])
+            if changes is not _VALIDATE:
+                changes[segment] = _MISSING if op == "remove" else _VALIDATE
+        else:
+            idx = self._list_index(segment, container, op, segments)
+            if op == "remove":
+                del container[idx]
+            elif op == "add":
+                container.insert(idx, operation["value"])
+            else:
+                container[idx] = operation["value"]
+
+            if changes is not _VALIDATE:
+                if op == "remove":
+                    del changes[idx]
+                elif op == "add":
+                    changes.insert(idx, _VALIDATE)
+                else:
+                    changes[idx] = _VALIDATE
+
+        return root
+
+    def _validate_change(self, container: dict | list | Record, key: str | int, mark: Any, tp: TypePlan, field: FieldPlan | None):
+        if mark is _VALIDATE:
+            _set_item(container, key, self.validator._validate_value_type(_get_item(container, key), tp))
+        elif mark is _MISSING:
+            values = {}
+            self.validator._process_missing_field(field, values)
+            if isinstance(container, Record):
+                setattr(container, key, values.get(key))
+            else:
+                container.update(values)
+        else:
+            child = _get_item(container, key)
+            self._validate_changes(child, mark, self._container_schema(tp, child, self.ctx.path))
+
+    def _validate_changes(self, container: dict | list | Record, changes: dict | list, schema: ModelPlan | TypePlan):
+        # обход в порядке объявления полей и индексов, как у validate
+        ctx = self.ctx
+        depth = ctx.depth
+        if isinstance(schema, ModelPlan):
+            for field in schema.fields:
+                mark = changes.get(field.name)
+                if mark is not None:
+                    ctx.append_path(field.name)
+                    self._validate_change(container, field.name, mark, field.type, field)
+                    ctx.remove_path_from_idx(depth)
+        else:
+            for idx, mark in enumerate(changes):
+                if mark is not None:
+                    ctx.append_path(idx)
+                    self._validate_change(container, idx, mark, schema, None)
+                    ctx.remove_path_from_idx(depth)
+
+    def apply_patch(self, root: dict | Record, patch: Iterable[dict]) -> dict | Record:
+        for operation in patch:
+            root = self.apply(root, operation)
+
+        self.ctx.remove_path_from_idx(0)
+        if self._changes is _VALIDATE:
+            return self.validator._validate_model(root, self.validator.plan)
+        self._validate_changes(root, self._changes, self.validator.plan)
+        return root
@@ -1,123 +1,390 @@
-import typing
+import time
 from typing import Any
 
-from .abstract import AbstractModel
-from .ctx import ValidationContext 
+from .ctx import ValidationContext
 from .exc import ValidationError
 from .abstract import AbstractSchemaValidator
+from .cache import CACHEABLE_TYPES, CONSTRUCTION_FAILED
+from .plan import FieldPlan, ModelPlan, TypePlan
 
 
 
+def select_variant(value: Any, expected_type: TypePlan, ctx: ValidationContext) -> ModelPlan | None:
+    """Выбирает план варианта размеченного объединения по тегу; если выбрать не удалось, добавляет ошибку в контекст."""
+    if not isinstance(value, dict):
+        ctx.add_error(
+            ValidationError(
+                path=ctx.path,
+                value=value,
+                cause=f"Значение должно быть типа dict",
+                expected_type=expected_type.name,
+            )
+        )
+        return None
+
+    tag = expected_type.tag
+    if tag not in value:
+        path = ctx.path + [tag]
+        ctx.add_error(
+            ValidationError(
+                path=path,
+                value=tag,
+                cause=f"Отсутствует ключ {'.'.join(path)}",
+                expected_type=expected_type.name,
+            )
+        )
+        return None
+
+    tag_value = value[tag]
+    try:
+        plan = expected_type.variants.get(tag_value)
+    except TypeError:
+        plan = None
+
+    if plan is None:
+        ctx.add_error(
+            ValidationError(
+                path=ctx.path + [tag],
+                value=tag_value,
+                cause=f"Неизвестное значение {tag_value} ключа {tag}, ожидается одно из: {', '.join(map(str, expected_type.variants))}",
+                expected_type=expected_type.name,
+            )
+        )
+        return None
+
+    return plan
+
+
 class SchemaValidator(AbstractSchemaValidator):
-    def __init__(self, annotations: dict, default_values: dict, context: ValidationContext, coerce: bool):
-        self.annotations = annotations
-        self.default_values = default_values
+    def __init__(self, plan: ModelPlan, context: ValidationContext | None, coerce: bool):
+        self.plan = plan
         self.coerce_flag = coerce
         self.ctx = ValidationContext.init_context(context)
-            
-    def _coerce_value_to_type(self, value, expected_type):
+
+    def _construct(self, value: Any, expected_type: TypePlan, errors: tuple[type[Exception], ...]) -> Any:
+        cache = expected_type.coercion_cache
+        if cache is not None and type(value) in CACHEABLE_TYPES:
+            return cache.construct(expected_type.convert, value, errors)
+
         try:
-            return expected_type(value)
-        except ValueError:
+            return expected_type.convert(value)
+        except errors:
+            return CONSTRUCTION_FAILED
+
+
+    def _coerce_value_to_type(self, value, expected_type: TypePlan):
+        coerced_value = self._construct(value, expected_type, (ValueError,))
+        if coerced_value is CONSTRUCTION_FAILED:
             self.ctx.add_error(
                 ValidationError(
-                    path=self.ctx.path, 
+                    path=self.ctx.path,
                     value=value,
-                    cause=f"Значение {value} не может быть приведено к типу '{expected_type.__name__}'",
-                    expected_type=expected_type.__name__,
+                    cause=f"Значение {value} не может быть приведено к типу '{expected_type.name}'",
+                    expected_type=expected_type.name,
                 )
             )
             return
+        return coerced_value
 
 
-    def _check_without_coercion(self, value, expected_type) -> Any:
-        init_type = type(value)
-        try:
-            coerced_value = expected_type(value)
-        except (ValueError, ValidationError):
+    def _check_without_coercion(self, value, expected_type: TypePlan) -> Any:
+        check = expected_type.check
+        if check is not None:
+            if check(value):
+                coerced_value = self._construct(value, expected_type, (ValueError, ValidationError))
+                is_valid = coerced_value is not CONSTRUCTION_FAILED
+            else:
+                is_valid = False
+        else:
+            coerced_value = self._construct(value, expected_type, (ValueError, ValidationError))
+            is_valid = coerced_value is not CONSTRUCTION_FAILED and isinstance(coerced_value, type(value))
+
+        if not is_valid:
             self.ctx.add_error(
                 ValidationError(
-                    path=self.ctx.path, 
+                    path=self.ctx.path,
                     value=value,
-                    cause=f"Значение {value} не подходит к типу {expected_type.__name__}",
-                    expected_type=expected_type.__name__,
+                    cause=f"Значение {value} не подходит к типу {expected_type.name}",
+                    expected_type=expected_type.name,
                 )
             )
-            return 
-        else:
-            if not isinstance(coerced_value, init_type):
-                self.ctx.add_error(
-                    ValidationError(
-                        path=self.ctx.path, 
-                        value=value,
-                        cause=f"Значение {value} не подходит к типу {expected_type.__name__}",
-                        expected_type=expected_type.__name__,
-                    )
-                )
-                return 
-            return coerced_value
+            return
+        return coerced_value
 
 
-    def _process_list(self, lst: list, expected_type: Any) -> list[Any]:
-        validated_lst = []
+    def _process_list_batch(self, lst: list, expected_type: TypePlan) -> list[Any]:
+        validated_lst = expected_type.batch(lst)
+        check = None if self.coerce_flag else expected_type.check
+        path_depth = self.ctx.depth
         for idx, v in enumerate(lst):
-            path_depth = self.ctx.depth
-            self.ctx.append_path(str([idx]))
-            validated_lst.append(self._validate_value_type(v, expected_type))
+            if validated_lst[idx] is not None and (check is None or check(v)):
+                continue
+
+            self.ctx.append_path(idx)
+            validated_lst[idx] = self._validate_value_type(v, expected_type)
             self.ctx.remove_path_from_idx(path_depth)
 
         return validated_lst
 
 
-    def _validate_value_type(self, value: Any, expected_type: Any):
-        root = typing.get_origin(expected_type)
-        args = typing.get_args(expected_type)
+    def _process_list(self, lst: list, expected_type: TypePlan) -> list[Any]:
+        numeric = expected_type.numeric
+        if numeric is not None:
+            converted = numeric.convert_list(lst, self.coerce_flag)
+            if converted is not None:
+                return converted
+            errors_count = len(self.ctx.errors)
+
+        if expected_type.batch is not None:
+            return self._process_list_batch(lst, expected_type)
 
-        if root:
-            if type(value) != root:
+        validated_lst = []
+        path_depth = self.ctx.depth
+        passthrough_type = expected_type.annotation if expected_type.passthrough else None
+        for idx, v in enumerate(lst):
+            if type(v) is passthrough_type:
+                validated_lst.append(v)
+                continue
+
+            self.ctx.append_path(idx)
+            validated_lst.append(self._validate_value_type(v, expected_type))
+            self.ctx.remove_path_from_idx(path_depth)
+
+        if numeric is not None and numeric.dtype is not None and len(self.ctx.errors) == errors_count:
+            try:
+                return numeric.to_ndarray(validated_lst)
+            except OverflowError:
                 self.ctx.add_error(
                     ValidationError(
-                        path=self.ctx.path, 
-                        value=value,
-                        cause=f"Тип контейнера {type(value).__name__}, ожидается {expected_type.__name__}",
-                        expected_type=expected_type.__name__,
+                        path=self.ctx.path,
+                        value=lst,
+                        cause=f"Значения списка не помещаются в {numeric.dtype}",
+                        expected_type=expected_type.name,
                     )
                 )
                 return
-            
-            return self._process_list(value, args[0])
+
+        return validated_lst
+
+
+    def _process_missing_field(self, field: FieldPlan, validated_obj: dict):
+        if not field.has_default:
+            self.ctx.add_error(
+                ValidationError(
+                    path=self.ctx.path,
+                    value=field.name,
+                    cause=f"Отсутствует ключ {'.'.join(self.ctx.path)}",
+                    expected_type=field.type.name,
+                )
+            )
         else:
-            if issubclass(expected_type, AbstractModel):
-                return expected_type._validate(value, context=self.ctx, coerce=self.coerce_flag)[0]
-            
-            if self.coerce_flag:
-                return self._coerce_value_to_type(value, expected_type)
-            else:
-                return self._check_without_coercion(value, expected_type)
+            validated_obj[field.name] = field.default
 
 
-    def validate_json(self, obj: dict) -> dict:
+    def _try_union_members(self, value: Any, expected_type: TypePlan) -> Any:
+        ctx = self.ctx
+        errors = ctx.errors
+        try:
+            for member in expected_type.trial_members[self.coerce_flag]:
+                # ошибки неудачных попыток не должны попадать в результат
+                # и расходовать лимит max_errors
+                ctx.errors = []
+                validated_value = self._validate_value_type(value, member)
+                if not ctx.errors:
+                    return validated_value
+        finally:
+            ctx.errors = errors
+
+        ctx.add_error(
+            ValidationError(
+                path=ctx.path,
+                value=value,
+                cause=f"Значение {value} не подходит ни к одному из типов {expected_type.name}",
+                expected_type=expected_type.name,
+            )
+        )
+
+
+    def _validate_tagged(self, value: Any, expected_type: TypePlan) -> dict | None:
+        plan = select_variant(value, expected_type, self.ctx)
+        if plan is None:
+            return
+        return self._validate_model(value, plan)
+
+
+    def _validate_model(self, obj: Any, plan: ModelPlan) -> dict:
+        if not isinstance(obj, dict):
+            error = ValidationError(
+                path=self.ctx.path,
+                value=obj,
+                cause=f"Значение должно быть типа dict",
+                expected_type=plan.name,
+            )
+            if self.ctx.hooks is not None and not self.ctx.depth:
+                self.ctx.hooks.on_error(error)
+            self.ctx.add_error(error)
+            return {}
+
+        if plan.validator_cls is not type(self):
+            return plan.model._validate(obj, context=self.ctx, coerce=self.coerce_flag, plan=plan)[0]
+
+        if self.ctx.hooks is not None:
+            return self._validate_model_hooked(obj, plan)
+
+        if self.ctx.memo is not None:
+            return self._validate_model_memo(obj, plan)
+
+        return self._validate_fields(obj, plan)
+
+
+    def _validate_model_hooked(self, obj: dict, plan: ModelPlan) -> dict:
+        ctx = self.ctx
+        hooks = ctx.hooks
+        # ошибки сообщает только корневая модель: во вложенных они еще могут
+        # оказаться ошибками неудачной попытки члена объединения
+        is_root = not ctx.depth
+        errors = ctx.errors
+        errors_start = len(errors)
+
+        hooks.on_model_start(plan.name)
+        started = time.perf_counter()
+        try:
+            if ctx.memo is not None:
+                return self._validate_model_memo(obj, plan)
+            return self._validate_fields_hooked(obj, plan)
+        finally:
+            hooks.on_model_end(plan.name, time.perf_counter() - started)
+            if is_root:
+                for error in errors[errors_start:]:
+                    hooks.on_error(error)
+
+
+    def _validate_fields_hooked(self, obj: dict, plan: ModelPlan) -> dict:
+        ctx = self.ctx
+        on_field = ctx.hooks.on_field
+        perf_counter = time.perf_counter
         validated_obj = {}
 
-        for key in self.annotations:
-            path_depth = self.ctx.depth
+        for field in plan.fields:
+            path_depth = ctx.depth
+            errors_start = len(ctx.errors)
+            started = perf_counter()
 
-            self.ctx.append_path(key)
+            ctx.append_path(field.name)
             try:
-                validated_obj[key] = self._validate_value_type(obj[key], self.annotations[key])
+                value = obj[field.name]
             except KeyError:
-                if not self.default_values.get(key):
-                    self.ctx.add_error(
+                self._process_missing_field(field, validated_obj)
+            else:
+                validated_obj[field.name] = self._validate_value_type(value, field.type)
+
+            ctx.remove_path_from_idx(path_depth)
+            on_field(plan.name, field.name, perf_counter() - started, len(ctx.errors) - errors_start)
+
+        if plan.record_cls is not None:
+            return plan.record_cls(validated_obj)
+        return validated_obj
+
+
+    def _validate_model_memo(self, obj: dict, plan: ModelPlan) -> dict:
+        ctx = self.ctx
+        memo = ctx.memo
+        identity_key, structural_key, entry = memo.lookup(plan, self.coerce_flag, obj)
+
+        if entry is not None:
+            if entry[2]:
+                prefix = ctx.path
+                for relative_path, value, message, expected_type, embeds_path in entry[2]:
+                    path = prefix + relative_path
+                    ctx.add_error(
                         ValidationError(
-                            path=self.ctx.path, 
-                            value=key,
-                            cause=f"Отсутствует ключ {'.'.join(self.ctx.path)}",
-                            expected_type=self.annotations[key].__name__,
+                            path=path,
+                            value=value,
+                            cause=f"Отсутствует ключ {'.'.join(path)}" if embeds_path else message,
+                            expected_type=expected_type,
                         )
                     )
-                else:
-                    validated_obj[key] = self.default_values[key]
-            
+            return entry[1]
+
+        errors_start = len(ctx.errors)
+        prefix_len = ctx.depth
+        if ctx.hooks is None:
+            validated_obj = self._validate_fields(obj, plan)
+        else:
+            validated_obj = self._validate_fields_hooked(obj, plan)
+
+        # пути ошибок хранятся относительно модели; путь, вшитый в текст
+        # ошибки об отсутствующем ключе, перестраивается при повторе
+        errors = [
+            (
+                error.path[prefix_len:],
+                error.value,
+                error.message,
+                error.expected_type,
+                error.message == f"Отсутствует ключ {'.'.join(error.path)}",
+            )
+            for error in ctx.errors[errors_start:]
+        ] if len(ctx.errors) > errors_start else ()
+        memo.store((identity_key, structural_key), obj, validated_obj, errors)
+        return validated_obj
+
+
+    def _validate_fields(self, obj: dict, plan: ModelPlan) -> dict:
+        validated_obj = {}
+
+        for field in plan.fields:
+            path_depth = self.ctx.depth
+
+            self.ctx.append_path(field.name)
+            try:
+                value = obj[field.name]
+            except KeyError:
+                self._process_missing_field(field, validated_obj)
+            else:
+                validated_obj[field.name] = self._validate_value_type(value, field.type)
+
             self.ctx.remove_path_from_idx(path_depth)
 
-        return validated_obj
\ No newline at end of file
+        if plan.record_cls is not None:
+            return plan.record_cls(validated_obj)
+        return validated_obj
+
+
+    def _validate_value_type(self, value: Any, expected_type: TypePlan):
+        if expected_type.passthrough and type(value) is expected_type.annotation:
+            return value
+
+        if expected_type.model is not None:
+            return self._validate_model(value, expected_type.model)
+
+        if expected_type.origin is not None:
+            if type(value) is not expected_type.origin:
+                self.ctx.add_error(
+                    ValidationError(
+                        path=self.ctx.path,
+                        value=value,
+                        cause=f"Тип контейнера {type(value).__name__}, ожидается {expected_type.name}",
+                        expected_type=expected_type.name,
+                    )
+                )
+                return
+
+            return self._process_list(value, expected_type.item)
+
+        if expected_type.members is not None:
+            member = expected_type.dispatch.get(type(value))
+            if member is not None:
+                return self._validate_value_type(value, member)
+            return self._try_union_members(value, expected_type)
+
+        if expected_type.variants is not None:
+            return self._validate_tagged(value, expected_type)
+
+        if self.coerce_flag:
+            return self._coerce_value_to_type(value, expected_type)
+        else:
+            return self._check_without_coercion(value, expected_type)
+
+
+    def validate_json(self, obj: dict) -> dict:
+        return self._validate_model(obj, self.plan)
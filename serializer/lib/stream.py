@@ -0,0 +1,150 @@
+import codecs
+import json
+from typing import IO, Any, Iterator
+
+from .exc import ValidationError
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# ошибка разбора ближе к концу буфера может означать, что запись обрезана
+# границей чанка; самый длинный обрезаемый токен — суррогатная пара "\ud83d\ude00"
+_TRUNCATION_MARGIN = 12
+
+
+class MalformedRecord:
+    """Запись NDJSON, которая не разбирается как JSON; сообщается как ошибка этой записи."""
+
+    __slots__ = ("text", "error")
+
+    def __init__(self, text: str | bytes, error: json.JSONDecodeError):
+        self.text = text
+        self.error = error
+
+    def to_error(self, expected_type: str) -> ValidationError:
+        return ValidationError(
+            path=[],
+            value=self.text,
+            cause=f"Некорректный JSON: {self.error}",
+            expected_type=expected_type,
+        )
+
+
+def decode_record(text: str | bytes) -> Any:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as err:
+        return MalformedRecord(text, err)
+
+
+def _may_be_truncated(err: json.JSONDecodeError, size: int) -> bool:
+    return err.msg.startswith("Unterminated string") or err.pos >= size - _TRUNCATION_MARGIN
+
+
+class _Buffer:
+    def __init__(self, fp: IO, chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.data = ""
+        self.pos = 0
+        self.eof = False
+        self._text_decoder = None
+
+    def _read(self, size: int) -> bool:
+        chunk = self.fp.read(size)
+        if not chunk:
+            if self._text_decoder is not None:
+                self._text_decoder.decode(b"", final=True)
+            self.eof = True
+            return False
+
+        if isinstance(chunk, bytes):
+            if self._text_decoder is None:
+                self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            chunk = self._text_decoder.decode(chunk)
+
+        # уже разобранная часть отбрасывается, в памяти остается только текущая запись
+        self.data = self.data[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def fill(self) -> bool:
+        # при неудачном разборе буфер как минимум удваивается, чтобы большие записи
+        # не разбирались заново на каждом маленьком чанке
+        return self._read(max(self.chunk_size, len(self.data) - self.pos))
+
+    def skip_whitespace(self) -> str:
+        while True:
+            data, pos = self.data, self.pos
+            while pos < len(data) and data[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(data):
+                return data[pos]
+            if not self.fill():
+                return ""
+
+    def read_line(self) -> str | None:
+        searched = self.pos
+        while True:
+            end = self.data.find("\n", searched)
+            if end != -1:
+                line = self.data[self.pos:end]
+                self.pos = end + 1
+                return line
+
+            searched = len(self.data) - self.pos
+            if not self.fill():
+                if self.pos == len(self.data):
+                    return None
+                line = self.data[self.pos:]
+                self.pos = len(self.data)
+                return line
+
+    def decode_value(self) -> Any:
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.data, self.pos)
+            except json.JSONDecodeError as err:
+                # дочитывать имеет смысл, только если ошибка у конца буфера,
+                # иначе запись испорчена и остаток потока читать незачем
+                if self.eof or not _may_be_truncated(err, len(self.data)) or not self.fill():
+                    raise
+                continue
+
+            # число в конце буфера может продолжаться в следующем чанке
+            if end == len(self.data) and not self.eof and self.fill():
+                continue
+
+            self.pos = end
+            return value
+
+
+def iter_json_records(fp: IO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    buf = _Buffer(fp, chunk_size)
+
+    first = buf.skip_whitespace()
+    if first != "[":
+        # NDJSON: записи разделены переводами строк, испорченная строка
+        # становится ошибкой своей записи и не мешает читать следующие
+        while (line := buf.read_line()) is not None:
+            if line.strip(_WHITESPACE):
+                yield decode_record(line)
+        return
+
+    buf.pos += 1
+    if buf.skip_whitespace() == "]":
+        return
+
+    while True:
+        yield buf.decode_value()
+
+        sep = buf.skip_whitespace()
+        if sep == "]":
+            return
+        if sep != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", buf.data, buf.pos)
+        buf.pos += 1
+        buf.skip_whitespace()
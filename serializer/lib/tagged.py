@@ -0,0 +1,94 @@
+from typing import Any, Callable, Iterable
+
+from .abstract import AbstractModel, AbstractTaggedUnion
+from .batch import check_on_error, collect_batch, iter_validate, resolve_max_errors
+from .ctx import ValidationContext
+from .exc import ErrorLimitReached, ValidationErrorGroup
+from .plan import ModelPlan, TypePlan
+from .schema_validator import select_variant
+
+
+class TaggedUnion(AbstractTaggedUnion):
+    """Объединение моделей, вариант которого выбирается по значению тега.
+
+    Значение тега каждого варианта — значение по умолчанию одноименного поля
+    модели. Вариант находится одним поиском в словаре независимо от числа
+    вариантов, ошибки сообщаются только для выбранного варианта. Экземпляр
+    можно использовать как аннотацию поля и как самостоятельный валидатор.
+    """
+
+    def __init__(self, *variants: type, tag: str = "type"):
+        if not variants:
+            raise TypeError("TaggedUnion требует хотя бы одну модель")
+
+        self.tag = tag
+        self.variants: dict[Any, type] = {}
+        for model in variants:
+            if not (isinstance(model, type) and issubclass(model, AbstractModel)):
+                raise TypeError(f"Вариант {model!r} должен быть моделью")
+            if tag not in model._default_values:
+                raise TypeError(f"У модели {model.__name__} нет значения по умолчанию для тега '{tag}'")
+
+            tag_value = model._default_values[tag]
+            if tag_value in self.variants:
+                raise TypeError(
+                    f"Значение тега {tag_value!r} повторяется у {self.variants[tag_value].__name__} и {model.__name__}"
+                )
+            self.variants[tag_value] = model
+
+        self.__name__ = " | ".join(model.__name__ for model in variants)
+        self._type_plan: TypePlan | None = None
+
+    def __repr__(self) -> str:
+        return f"TaggedUnion({self.__name__}, tag={self.tag!r})"
+
+    def _get_type_plan(self) -> TypePlan:
+        if self._type_plan is None:
+            self._type_plan = TypePlan(self)
+        return self._type_plan
+
+    def _validator(self, ctx: ValidationContext, coerce: bool) -> Callable[[Any], dict | None]:
+        """Возвращает функцию валидации одного объекта; валидаторы вариантов создаются по мере надобности."""
+        type_plan = self._get_type_plan()
+        validators: dict[ModelPlan, Callable[[dict], dict]] = {}
+
+        def validate_one(obj: Any) -> dict | None:
+            plan = select_variant(obj, type_plan, ctx)
+            if plan is None:
+                return None
+
+            validate_json = validators.get(plan)
+            if validate_json is None:
+                validate_json = validators[plan] = plan.validator_cls(plan=plan, context=ctx, coerce=coerce).validate_json
+            return validate_json(obj)
+
+        return validate_one
+
+    def validate(self, obj: dict, *, coerce: bool = False, fail_fast: bool = False, max_errors: int | None = None) -> dict:
+        if not isinstance(obj, dict):
+            raise TypeError(f"Must be dict type, got {type(obj).__name__ }")
+
+        context = ValidationContext(resolve_max_errors(fail_fast, max_errors))
+        try:
+            validated_obj = self._validator(context, coerce)(obj)
+        except ErrorLimitReached:
+            raise ValidationErrorGroup(context.errors, self.__name__) from None
+
+        if context.errors:
+            raise ValidationErrorGroup(context.errors, self.__name__)
+
+        return validated_obj
+
+    def validate_many(
+        self,
+        objs: Iterable[dict],
+        *,
+        coerce: bool = False,
+        on_error: str = "collect",
+        fail_fast: bool = False,
+        max_errors: int | None = None,
+    ) -> tuple[list[dict | None], dict[int, ValidationErrorGroup]]:
+        check_on_error(on_error)
+        ctx = ValidationContext(resolve_max_errors(fail_fast, max_errors))
+        results = iter_validate(self._validator(ctx, coerce), objs, ctx)
+        return collect_batch(results, on_error, self.__name__)
@@ -1,24 +1,86 @@
 import re
+from typing import Any, Iterable
+
+from .registry import register_type
+
+_NON_DIGITS = re.compile(r"\D")
+
 
 class PhoneNumber:
+    # группы шаблона захватывают цифры номера после первой; шаблон без групп
+    # тоже допустим, тогда цифры извлекаются удалением всех нецифровых символов
     _locale_pattern_map = {
         "ru": {
-            "pattern": r"^[7|8]\s\(\d{3}\)\s\d{3}-\d{2}-\d{2}$",
-            "begins": "7"
+            "pattern": re.compile(r"^[7|8]\s\((\d{3})\)\s(\d{3})-(\d{2})-(\d{2})$"),
+            "begins": "7",
+            # шаблон для обратного форматирования, поля — цифры номера по порядку
+            "template": "{0} ({1}{2}{3}) {4}{5}{6}-{7}{8}-{9}{10}",
         } 
     }
 
     @classmethod
-    def _build_number_str(cls, value: str, locale: str) -> str:
-        return cls._locale_pattern_map[locale]["begins"] + "".join([c for c in value[1:] if c.isdecimal()])
+    def register_locale(cls, locale: str, pattern: str | re.Pattern, begins: str, template: str | None = None):
+        cls._locale_pattern_map[locale] = {
+            "pattern": re.compile(pattern),
+            "begins": begins,
+            "template": template,
+        }
+
+    @classmethod
+    def format(cls, value: str, locale: str = "ru") -> str:
+        """Форматирует нормализованный номер обратно по шаблону локали."""
+        template = cls._locale_pattern_map[locale]["template"]
+        if template is None:
+            return value
+        return template.format(*value)
+
+    @classmethod
+    def _build_number_str(cls, match: re.Match, begins: str) -> str:
+        if match.re.groups:
+            return begins + "".join(match.groups())
+        return begins + _NON_DIGITS.sub("", match.string[1:])
+
+    @classmethod
+    def normalize_many(cls, values: Iterable[Any], locale: str = "ru") -> list[str | None]:
+        """Нормализует пакет номеров; на месте невалидных значений возвращается None."""
+        locale_spec = cls._locale_pattern_map[locale]
+        pattern = locale_spec["pattern"]
+        fullmatch = pattern.fullmatch
+        begins = locale_spec["begins"]
+
+        if not pattern.groups:
+            strip_non_digits = _NON_DIGITS.sub
+            return [
+                begins + strip_non_digits("", value[1:]) if isinstance(value, str) and fullmatch(value) else None
+                for value in values
+            ]
+
+        return [
+            begins + "".join(match.groups()) if isinstance(value, str) and (match := fullmatch(value)) else None
+            for value in values
+        ]
 
 
     def __new__(cls, value: str, locale: str = "ru") -> str:
         if not isinstance(value, str):
             raise ValueError(f"Value {value} must conform to str type")
+
+        locale_spec = cls._locale_pattern_map[locale]
+        match = locale_spec["pattern"].fullmatch(value)
+        if not match:
+            raise ValueError(f"Value {value} must conform to {locale.upper()} phone number format")
         
-        if not re.fullmatch(cls._locale_pattern_map[locale]["pattern"], value):
-            raise ValueError(f"Value {value} must conform to RU phone number format")
-        
-        return cls._build_number_str(value, locale)
-    
\ No newline at end of file
+        return cls._build_number_str(match, locale_spec["begins"])
+
+
+def _is_str(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+register_type(
+    PhoneNumber,
+    check=_is_str,
+    coerce=PhoneNumber,
+    batch=PhoneNumber.normalize_many,
+    encode=PhoneNumber.format,
+)
@@ -0,0 +1,103 @@
+import asyncio
+import json
+
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(Model):
+    first_name: str
+    contact: Contact
+
+class Team(Model):
+    team_name: str
+    members: list[Employee]
+    scores: list[int] = [0]
+
+
+def _team(size, broken=()):
+    members = []
+    for idx in range(size):
+        extension = "абв" if idx in broken else str(idx)
+        members.append({"first_name": f"user{idx}", "contact": {"phone": "8 (950) 111-22-33", "extension": extension}})
+    return {"team_name": "Backend", "members": members, "scores": list(range(size))}
+
+
+def _run(validate, payload):
+    try:
+        return validate(payload), None
+    except ValidationErrorGroup as e:
+        return None, e.errors
+
+
+@pytest.mark.parametrize("coerce", (False, True))
+@pytest.mark.parametrize("payload", (_team(50), _team(50, broken={3, 40}), {"team_name": 1, "members": "x"}))
+def test_avalidate_matches_validate(payload, coerce):
+    async def avalidate(obj):
+        return await Team.avalidate(obj, coerce=coerce, yield_every=7)
+
+    expected = _run(lambda obj: Team.validate(obj, coerce=coerce), payload)
+
+    assert _run(lambda obj: asyncio.run(avalidate(obj)), payload) == expected
+
+
+def test_avalidate_yields_to_event_loop():
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        result = await Team.avalidate(_team(2000), coerce=True, yield_every=100, time_budget=None)
+        task.cancel()
+        return result
+
+    result = asyncio.run(main())
+
+    assert len(result["members"]) == 2000
+    assert ticks > 20
+
+
+def test_avalidate_stream():
+    lines = [json.dumps(_team(2)).encode() + b"\n", b"\n", json.dumps(_team(2, broken={1})).encode() + b"\n"]
+
+    async def main():
+        stream = asyncio.StreamReader()
+        for line in lines:
+            stream.feed_data(line)
+        stream.feed_eof()
+        return [item async for item in Team.avalidate_stream(stream, coerce=True)]
+
+    results = asyncio.run(main())
+
+    assert [idx for idx, _, _ in results] == [0, 1]
+    assert results[0][1] == Team.validate(_team(2), coerce=True)
+    assert results[1][1] is None
+    assert results[1][2].errors[0]["path"] == "members.[1].contact.extension"
+
+
+def test_avalidate_stream_malformed_line():
+    lines = [b"{broken\n", json.dumps(_team(2)).encode() + b"\n"]
+
+    async def main():
+        stream = asyncio.StreamReader()
+        for line in lines:
+            stream.feed_data(line)
+        stream.feed_eof()
+        return [item async for item in Team.avalidate_stream(stream, coerce=True)]
+
+    results = asyncio.run(main())
+
+    assert [idx for idx, _, _ in results] == [0, 1]
+    assert results[0][1] is None
+    assert results[0][2].errors[0]["message"].startswith("Некорректный JSON")
+    assert results[1][1] == Team.validate(_team(2), coerce=True)
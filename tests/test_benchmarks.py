@@ -0,0 +1,71 @@
+import json
+
+import pytest
+from serializer import ValidationErrorGroup
+
+from benchmarks.payloads import MODELS_BY_DEPTH, PayloadGenerator, contacts_per_document
+from benchmarks.runner import Result, Scenario, compare, default_scenarios, load_baseline, run_scenario, save_baseline
+
+
+@pytest.mark.parametrize("coerce", [False, True])
+@pytest.mark.parametrize("depth", [1, 2, 3, 4, 5])
+def test_valid_documents(depth, coerce):
+    generator = PayloadGenerator(width=3, error_rate=0.0, coerce=coerce)
+
+    document = generator.document(depth)
+
+    MODELS_BY_DEPTH[depth - 1].validate(document, coerce=coerce)
+    assert generator.contacts == contacts_per_document(depth, 3)
+
+
+def test_coerce_documents_require_coercion():
+    document = PayloadGenerator(width=2, error_rate=0.0, coerce=True).document(2)
+
+    with pytest.raises(ValidationErrorGroup):
+        MODELS_BY_DEPTH[1].validate(document)
+
+
+def test_error_rate():
+    generator = PayloadGenerator(width=4, error_rate=0.25, coerce=False, seed=1)
+
+    document = generator.document(5)
+
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        MODELS_BY_DEPTH[4].validate(document)
+    assert len(excinfo.value.errors) == generator.invalid_contacts
+    assert 0 < generator.invalid_contacts < generator.contacts
+
+
+def test_default_scenarios_are_unique():
+    names = [scenario.name for scenario in default_scenarios()]
+
+    assert len(names) == len(set(names))
+    assert "Company-w8-e0.1-coerce" in names
+
+
+def test_run_scenario():
+    result = run_scenario(Scenario(depth=3, width=2, error_rate=0.5, coerce=True), contacts=40, repeat=1, min_documents=5)
+
+    assert result.scenario == "Team-w2-e0.5-coerce"
+    assert result.documents == 20
+    assert result.contacts == 40
+    assert 0 < result.invalid_documents < result.documents
+    assert result.records_per_sec > 0
+    assert result.p50_us <= result.p90_us <= result.p99_us
+    assert result.peak_memory_kib > 0
+
+
+def _result(name: str, records_per_sec: float) -> Result:
+    return Result(name, 1, 1, 0, records_per_sec, records_per_sec, 1.0, 1.0, 1.0, 1.0)
+
+
+def test_compare_flags_regressions(tmp_path):
+    path = tmp_path / "baseline.json"
+    save_baseline(path, [_result("a", 1000), _result("b", 1000)])
+    baseline = load_baseline(path)
+
+    regressions = compare([_result("a", 850), _result("b", 700), _result("new", 1)], baseline, tolerance=0.2)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("b:")
+    assert json.loads(path.read_text())["results"]["a"]["records_per_sec"] == 1000
@@ -0,0 +1,147 @@
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup, CodegenValidator
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(Model):
+    first_name: str
+    last_name: str
+    contact: Contact
+
+class Team(Model):
+    team_name: str
+    members: list[Employee]
+    tags: list[str] = ["default"]
+
+
+class GeneratedModel(Model):
+    _validator_cls = CodegenValidator
+
+class GeneratedContact(GeneratedModel):
+    phone: PhoneNumber
+    extension: int
+
+class GeneratedEmployee(GeneratedModel):
+    first_name: str
+    last_name: str
+    contact: GeneratedContact
+
+class GeneratedTeam(GeneratedModel):
+    team_name: str
+    members: list[GeneratedEmployee]
+    tags: list[str] = ["default"]
+
+
+def _run(model, payload, coerce):
+    try:
+        return model.validate(payload, coerce=coerce), None
+    except ValidationErrorGroup as e:
+        for err in e.errors:
+            err["expected_type"] = err["expected_type"].removeprefix("Generated")
+        return None, e.errors
+
+
+PAYLOADS = (
+    {
+        "team_name": "Backend",
+        "members": [
+            {
+                "first_name": "Alice",
+                "last_name": "Smith",
+                "contact": {"phone": "8 (950) 111-22-33", "extension": "101"},
+            },
+            {
+                "first_name": "Bob",
+                "last_name": "Johnson",
+                "contact": {"phone": "7 (950) 222-33-44", "extension": 102},
+            },
+        ],
+    },
+    {
+        "team_name": 123,
+        "members": [
+            {
+                "first_name": "Charlie",
+                "contact": {"phone": "8 (950) 111-22-330", "extension": "123АБВ"},
+            },
+            {
+                "first_name": "Dana",
+                "last_name": "White",
+                "contact": {"phone": 123456, "extension": 103.5},
+            },
+            "not a dict",
+        ],
+        "tags": ["a", 1],
+    },
+    {
+        "team_name": "QA",
+        "members": {"first_name": "Eve"},
+    },
+)
+
+
+@pytest.mark.parametrize("coerce", (False, True))
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_codegen_matches_interpreter(payload, coerce):
+    assert _run(GeneratedTeam, payload, coerce) == _run(Team, payload, coerce)
+
+
+def test_codegen_error_paths():
+    _, errors = _run(GeneratedTeam, PAYLOADS[1], coerce=False)
+
+    assert [err["path"] for err in errors] == [
+        "team_name",
+        "members.[0].last_name",
+        "members.[0].contact.phone",
+        "members.[0].contact.extension",
+        "members.[1].contact.phone",
+        "members.[1].contact.extension",
+        "members.[2]",
+        "tags.[1]",
+    ]
+
+
+def test_codegen_delegates_to_interpreted_models():
+    class MixedTeam(GeneratedModel):
+        team_name: str
+        members: list[Employee]
+
+    payload = {
+        "team_name": "Mixed",
+        "members": [{"first_name": "Max", "contact": {"phone": "8 (960) 123-54-64", "extension": 22}}],
+    }
+    _, errors = _run(MixedTeam, payload, coerce=False)
+
+    assert [err["path"] for err in errors] == ["members.[0].last_name"]
+
+
+class TreeNode(Model):
+    value: int
+    children: list["TreeNode"] = []
+    parent: "TreeNode | None" = None
+
+TreeNode.__annotations__.update(children=list[TreeNode], parent=TreeNode | None)
+
+class GeneratedTreeNode(GeneratedModel):
+    value: int
+    children: list["GeneratedTreeNode"] = []
+    parent: "GeneratedTreeNode | None" = None
+
+GeneratedTreeNode.__annotations__.update(children=list[GeneratedTreeNode], parent=GeneratedTreeNode | None)
+
+
+@pytest.mark.parametrize("coerce", (False, True))
+@pytest.mark.parametrize("payload", (
+    {"value": 1, "children": [{"value": 2, "children": [{"value": 3}]}], "parent": {"value": 0}},
+    {"value": "x", "children": [{"value": 2, "children": [{"value": "4", "parent": []}]}, 5]},
+))
+def test_codegen_recursive_model(payload, coerce):
+    result, errors = _run(GeneratedTreeNode, payload, coerce)
+    expected_result, expected_errors = _run(TreeNode, payload, coerce)
+
+    assert result == expected_result
+    # имена моделей в сообщениях различаются
+    assert repr(errors).replace("GeneratedTreeNode", "TreeNode") == repr(expected_errors)
@@ -0,0 +1,155 @@
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup, CodegenValidator, CoercionCache, SchemaValidator
+from serializer.lib.exc import ValidationError
+
+
+class CachedModel(Model):
+    _coercion_cache = CoercionCache(maxsize=64)
+
+class Contact(CachedModel):
+    phone: PhoneNumber
+    extension: int
+
+class Team(CachedModel):
+    team_name: str
+    phones: list[PhoneNumber]
+
+class GeneratedTeam(Model):
+    _validator_cls = CodegenValidator
+    _coercion_cache = CoercionCache(maxsize=64)
+
+    team_name: str
+    phones: list[PhoneNumber]
+
+
+PHONE = "7 (999) 123-45-67"
+
+
+def test_cache_hits_and_misses():
+    cache = CoercionCache()
+
+    assert cache.construct(PhoneNumber, PHONE) == "79991234567"
+    assert cache.construct(PhoneNumber, PHONE) == "79991234567"
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1, "maxsize": 4096}
+
+
+def test_cache_distinguishes_value_types():
+    cache = CoercionCache()
+
+    assert cache.construct(str, 1) == "1"
+    assert cache.construct(str, True) == "True"
+    assert cache.construct(str, 1.0) == "1.0"
+    assert cache.misses == 3
+
+
+def test_cache_stores_failures():
+    from serializer.lib.cache import CONSTRUCTION_FAILED
+
+    cache = CoercionCache()
+
+    assert cache.construct(int, "abc") is CONSTRUCTION_FAILED
+    assert cache.construct(int, "abc") is CONSTRUCTION_FAILED
+    assert cache.hits == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = CoercionCache(maxsize=2)
+
+    cache.construct(int, "1")
+    cache.construct(int, "2")
+    cache.construct(int, "1")
+    cache.construct(int, "3")
+
+    assert cache.evictions == 1
+    cache.construct(int, "1")
+    assert cache.hits == 2
+    cache.construct(int, "2")
+    assert cache.misses == 4
+
+
+def test_cache_clear():
+    cache = CoercionCache()
+    cache.construct(int, "1")
+    cache.clear()
+
+    assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "maxsize": 4096}
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        CoercionCache(maxsize=0)
+
+
+def test_model_uses_cache():
+    cache = CachedModel._coercion_cache
+    cache.clear()
+
+    result = Team.validate({"team_name": "core", "phones": [PHONE] * 5})
+
+    assert result["phones"] == ["79991234567"] * 5
+    assert cache.misses == 1
+    assert cache.hits == 4
+
+
+@pytest.mark.parametrize("coerce", (True, False))
+def test_cached_errors_match_uncached(coerce):
+    payload = {"phone": "not a phone", "extension": "x"}
+
+    class UncachedContact(Model):
+        phone: PhoneNumber
+        extension: int
+
+    for _ in range(2):
+        with pytest.raises(ValidationErrorGroup) as cached:
+            Contact.validate(payload, coerce=coerce)
+        with pytest.raises(ValidationErrorGroup) as uncached:
+            UncachedContact.validate(payload, coerce=coerce)
+
+        assert [(e["path"], e["message"]) for e in cached.value.errors] == [
+            (e["path"], e["message"]) for e in uncached.value.errors
+        ]
+
+
+@pytest.mark.parametrize("coerce", (True, False))
+def test_codegen_uses_cache(coerce):
+    cache = GeneratedTeam._coercion_cache
+    cache.clear()
+    payload = {"team_name": "core", "phones": [PHONE, PHONE, "bad"]}
+
+    with pytest.raises(ValidationErrorGroup) as generated:
+        GeneratedTeam.validate(payload, coerce=coerce)
+    with pytest.raises(ValidationErrorGroup) as interpreted:
+        Team.validate(payload, coerce=coerce)
+
+    assert [(e["path"], e["message"]) for e in generated.value.errors] == [
+        (e["path"], e["message"]) for e in interpreted.value.errors
+    ]
+    assert cache.misses == 2
+    assert cache.hits == 1
+
+
+class Code(str):
+    def __new__(cls, value):
+        if not str(value).isalnum():
+            raise ValidationError(path=[], value=value, cause="Некорректный код", expected_type="Code")
+        return super().__new__(cls, value)
+
+
+@pytest.mark.parametrize("validator_cls", (SchemaValidator, CodegenValidator))
+def test_cache_keeps_strict_error_handling(validator_cls):
+    class Coded(Model):
+        _validator_cls = validator_cls
+        code: Code
+
+    class CachedCoded(Coded):
+        _coercion_cache = CoercionCache()
+        code: Code
+
+    for _ in range(2):
+        errors = []
+        for model in (Coded, CachedCoded):
+            with pytest.raises(ValidationErrorGroup) as excinfo:
+                model.validate({"code": "a-b"})
+            errors.append([(e["path"], e["message"]) for e in excinfo.value.errors])
+
+        assert errors[0] == errors[1] == [("code", errors[0][0][1])]
@@ -0,0 +1,38 @@
+from serializer import Model
+from serializer.lib.ctx import ValidationContext
+
+
+class Item(Model):
+    name: str
+    tags: list[str]
+
+class Basket(Model):
+    items: list[Item]
+
+
+def test_path_stack_is_reused():
+    ctx = ValidationContext()
+    path_stack = ctx._path_stack
+
+    payload = {"items": [{"name": "a", "tags": ["x", 1]}, {"name": 2, "tags": []}]}
+    _, errors = Basket._validate(payload, ctx, coerce=False)
+
+    assert ctx._path_stack is path_stack
+    assert ctx._path_stack == []
+    assert [error.path for error in errors] == [
+        ["items", "[0]", "tags", "[1]"],
+        ["items", "[1]", "name"],
+    ]
+
+
+def test_path_is_materialized_copy():
+    ctx = ValidationContext()
+    ctx.append_path("items")
+    ctx.append_path(3)
+
+    path = ctx.path
+    ctx.remove_path_from_idx(1)
+
+    assert path == ["items", "[3]"]
+    assert ctx.path == ["items"]
+    assert ctx.depth == 1
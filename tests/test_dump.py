@@ -0,0 +1,231 @@
+import io
+import json
+import sys
+import threading
+
+import pytest
+from serializer import Model, PhoneNumber, TaggedUnion, CodegenValidator, register_type
+from serializer.lib import registry
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(Model):
+    first_name: str
+    contact: Contact
+    backup: PhoneNumber | None = None
+    previous: list[Contact] = []
+    tags: list[str] = ["default"]
+
+class Plain(Model):
+    name: str
+    scores: list[int]
+
+class RecordContact(Model):
+    _record_output = True
+
+    phone: PhoneNumber
+    extension: int
+
+class RecordEmployee(Model):
+    _record_output = True
+    _validator_cls = CodegenValidator
+
+    first_name: str
+    contact: RecordContact
+
+
+class Email(Model):
+    kind: str = "email"
+    address: str
+
+class Phone(Model):
+    kind: str = "phone"
+    phone: PhoneNumber
+
+class Channel(Model):
+    target: TaggedUnion(Email, Phone, tag="kind")
+
+
+PAYLOAD = {
+    "first_name": "Иван",
+    "contact": {"phone": "8 (955) 318-99-12", "extension": 1},
+    "backup": "7 (999) 999-99-99",
+    "previous": [{"phone": "8 (900) 000-11-22", "extension": 2}],
+}
+
+
+def test_dump_formats_phone_numbers():
+    employee = Employee.validate(PAYLOAD)
+
+    dumped = Employee.dump(employee)
+
+    assert dumped == {
+        "first_name": "Иван",
+        "contact": {"phone": "7 (955) 318-99-12", "extension": 1},
+        "backup": "7 (999) 999-99-99",
+        "previous": [{"phone": "7 (900) 000-11-22", "extension": 2}],
+        "tags": ["default"],
+    }
+    # исходный результат не меняется
+    assert employee["contact"]["phone"] == "79553189912"
+
+
+def test_dump_round_trip():
+    employee = Employee.validate(PAYLOAD)
+
+    assert Employee.validate(Employee.dump(employee)) == employee
+    assert Employee.validate_json(Employee.dumps(employee)) == employee
+
+
+def test_dump_skips_none():
+    employee = Employee.validate({**PAYLOAD, "backup": None})
+
+    assert Employee.dump(employee)["backup"] is None
+
+
+def test_dump_without_conversion_returns_same_object():
+    plain = Plain.validate({"name": "a", "scores": [1, 2]})
+
+    assert Plain.dump(plain) is plain
+
+
+def test_dumps_is_compact_utf8():
+    employee = Employee.validate(PAYLOAD)
+
+    data = Employee.dumps(employee)
+
+    assert isinstance(data, bytes)
+    assert data == json.dumps(Employee.dump(employee), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def test_dump_records():
+    employee = RecordEmployee.validate(PAYLOAD)
+
+    dumped = RecordEmployee.dump(employee)
+
+    assert dumped == {"first_name": "Иван", "contact": {"phone": "7 (955) 318-99-12", "extension": 1}}
+    assert type(dumped["contact"]) is dict
+    assert RecordEmployee.validate(dumped) == employee
+
+
+def test_dump_tagged_union():
+    email = Channel.validate({"target": {"kind": "email", "address": "a@b"}})
+    phone = Channel.validate({"target": {"kind": "phone", "phone": "8 (955) 318-99-12"}})
+
+    assert Channel.dump(email) == {"target": {"kind": "email", "address": "a@b"}}
+    assert Channel.dump(phone) == {"target": {"kind": "phone", "phone": "7 (955) 318-99-12"}}
+
+
+def test_dump_recursive_model():
+    class Node(Model):
+        phone: PhoneNumber
+        child: None = None
+
+    Node.__annotations__["child"] = Node | None
+    node = Node.validate({"phone": "8 (955) 318-99-12", "child": {"phone": "8 (900) 000-11-22", "child": None}})
+
+    assert Node.dump(node) == {
+        "phone": "7 (955) 318-99-12",
+        "child": {"phone": "7 (900) 000-11-22", "child": None},
+    }
+
+
+def test_dump_compiled_concurrently():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(5):
+            # много полей, чтобы построение дампера заняло заметное время
+            annotations = {"phone": PhoneNumber} | {f"f{idx}": list[Contact] for idx in range(300)}
+            defaults = {f"f{idx}": [] for idx in range(300)}
+            Node = type(Model)("Node", (Model,), {"__annotations__": annotations, "child": None, **defaults})
+            Node.__annotations__["child"] = Node | None
+            node = Node.validate({"phone": "8 (955) 318-99-12", "child": {"phone": "8 (900) 000-11-22"}})
+            expected = {
+                "phone": "7 (955) 318-99-12",
+                "child": {"phone": "7 (900) 000-11-22", "child": None, **defaults},
+                **defaults,
+            }
+
+            workers = 8
+            barrier = threading.Barrier(workers)
+            results = []
+
+            def first_dump():
+                barrier.wait()
+                try:
+                    results.append(Node.dump(node))
+                except Exception as exc:
+                    results.append(exc)
+
+            threads = [threading.Thread(target=first_dump) for _ in range(workers)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert results == [expected] * workers
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_dump_ndarray_lists():
+    np = pytest.importorskip("numpy")
+
+    class Vector(Model):
+        _ndarray_lists = True
+
+        values: list[float]
+
+    vector = Vector.validate({"values": [1.0, 2.5]})
+    assert isinstance(vector["values"], np.ndarray)
+
+    assert Vector.dumps(vector) == b'{"values":[1.0,2.5]}'
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_dump_iter(batch_size):
+    employees = [Employee.validate(PAYLOAD) for _ in range(3)]
+
+    data = b"".join(Employee.dump_iter(employees, batch_size=batch_size))
+
+    assert json.loads(data) == [Employee.dump(employee) for employee in employees]
+
+
+def test_dump_iter_empty():
+    assert b"".join(Employee.dump_iter([])) == b"[]"
+
+
+def test_dump_to():
+    employees = (Employee.validate(PAYLOAD) for _ in range(5))
+    fp = io.BytesIO()
+
+    Employee.dump_to(employees, fp, batch_size=2)
+
+    assert [Employee.validate(obj) for obj in json.loads(fp.getvalue())] == [Employee.validate(PAYLOAD)] * 5
+
+
+def test_registered_encode(monkeypatch):
+    monkeypatch.setattr(registry, "_registry", dict(registry._registry))
+
+    class Cents(int):
+        pass
+
+    register_type(
+        Cents,
+        check=lambda value: isinstance(value, int),
+        coerce=lambda value: Cents(round(float(value) * 100)),
+        encode=lambda value: f"{value / 100:.2f}",
+    )
+
+    class Price(Model):
+        amount: Cents
+
+    price = Price.validate({"amount": "12.5"}, coerce=True)
+
+    assert price == {"amount": 1250}
+    assert Price.dump(price) == {"amount": "12.50"}
+    assert Price.validate(Price.dump(price), coerce=True) == price
@@ -0,0 +1,57 @@
+import json
+import pickle
+
+import pytest
+from serializer import Model, ValidationErrorGroup
+
+
+class Point(Model):
+    x: int
+    y: int
+
+
+def _error_group():
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Point.validate({"x": "a"})
+    return excinfo.value
+
+
+def test_error_group_is_formatted_lazily():
+    error_group = _error_group()
+
+    assert error_group.error_count == 2
+    assert "errors" not in error_group.__dict__
+    assert "message" not in error_group.__dict__
+
+    assert [err["path"] for err in error_group.errors] == ["x", "y"]
+    assert "message" not in error_group.__dict__
+
+
+def test_error_group_message():
+    message = str(_error_group())
+
+    assert message.startswith("Got 2 validation errors for Point: ")
+    assert '"path": "y"' in message
+    assert '"message": "Отсутствует ключ y"' in message
+
+
+def test_error_group_to_json_bytes():
+    data = _error_group().to_json_bytes()
+
+    assert b"\n" not in data
+    assert json.loads(data) == {
+        "model": "Point",
+        "limit_reached": False,
+        "errors": [
+            {"path": "x", "message": "Значение a не подходит к типу int", "value": "a", "expected_type": "int"},
+            {"path": "y", "message": "Отсутствует ключ y", "value": "y", "expected_type": "int"},
+        ],
+    }
+
+
+def test_error_group_pickle():
+    error_group = _error_group()
+    restored = pickle.loads(pickle.dumps(error_group))
+
+    assert restored.errors == error_group.errors
+    assert str(restored) == str(error_group)
@@ -0,0 +1,101 @@
+import pytest
+from serializer import Model, ValidationErrorGroup, CodegenValidator
+
+
+class Item(Model):
+    name: str
+    count: int
+
+class Order(Model):
+    order_id: int
+    items: list[Item]
+    notes: list[str]
+
+class GeneratedItem(Model):
+    _validator_cls = CodegenValidator
+
+    name: str
+    count: int
+
+class GeneratedOrder(Model):
+    _validator_cls = CodegenValidator
+
+    order_id: int
+    items: list[GeneratedItem]
+    notes: list[str]
+
+
+PAYLOAD = {
+    "order_id": "x",
+    "items": [{"name": 1, "count": "a"}, {"name": 2, "count": "b"}],
+    "notes": [1, 2, 3],
+}
+
+
+@pytest.mark.parametrize("model", (Order, GeneratedOrder))
+def test_fail_fast(model):
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        model.validate(PAYLOAD, fail_fast=True)
+
+    assert excinfo.value.limit_reached
+    assert [err["path"] for err in excinfo.value.errors] == ["order_id"]
+    assert "error limit reached" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("model", (Order, GeneratedOrder))
+def test_max_errors_stops_inside_nested_lists(model):
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        model.validate(PAYLOAD, max_errors=3)
+
+    assert excinfo.value.limit_reached
+    assert [err["path"] for err in excinfo.value.errors] == ["order_id", "items.[0].name", "items.[0].count"]
+
+
+def test_max_errors_not_reached():
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Order.validate(PAYLOAD, max_errors=100)
+
+    assert not excinfo.value.limit_reached
+    assert excinfo.value.error_count == 8
+
+
+def test_max_errors_validate_json():
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Order.validate_json('{"order_id": 1, "items": [{"name": 1, "count": "a"}], "notes": [1]}', max_errors=1)
+
+    assert excinfo.value.limit_reached
+    assert [err["path"] for err in excinfo.value.errors] == ["items.[0].name"]
+
+
+def test_max_errors_per_record_in_batch():
+    records = [PAYLOAD, {"order_id": 1, "items": [], "notes": []}, PAYLOAD]
+
+    validated, errors = Order.validate_many(records, max_errors=2)
+
+    assert validated == [None, {"order_id": 1, "items": [], "notes": []}, None]
+    assert [errors[idx].error_count for idx in errors] == [2, 2]
+    assert all(errors[idx].limit_reached for idx in errors)
+
+
+def test_max_errors_must_be_positive():
+    with pytest.raises(ValueError):
+        Order.validate(PAYLOAD, max_errors=0)
+
+
+def test_exactly_max_errors():
+    class Point(Model):
+        x: int
+        y: int
+
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Point.validate({"x": "a", "y": 1}, max_errors=1)
+
+    assert excinfo.value.limit_reached
+    assert excinfo.value.error_count == 1
+    assert "error limit reached" in str(excinfo.value)
+
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Point.validate({"x": "a", "y": 1}, max_errors=2)
+
+    assert not excinfo.value.limit_reached
+    assert "error limit" not in str(excinfo.value)
@@ -0,0 +1,154 @@
+import io
+import json
+
+import pytest
+from serializer import Model, PhoneNumber, ProfileCollector, ValidationHooks, ValidationErrorGroup, CodegenValidator, SubtreeCache
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(Model):
+    first_name: str
+    contact: Contact
+    previous: list[Contact] | None = None
+
+class GeneratedEmployee(Model):
+    _validator_cls = CodegenValidator
+
+    first_name: str
+    contact: Contact
+
+
+VALID = {
+    "first_name": "Ivan",
+    "contact": {"phone": "8 (955) 318-99-12", "extension": 1},
+    "previous": [{"phone": "8 (900) 000-11-22", "extension": 2}],
+}
+
+INVALID = {
+    "first_name": "Ivan",
+    "contact": {"phone": "8 (955) 318-99-12", "extension": "x"},
+    "previous": [{"phone": "8 (900) 000-11-22", "extension": "y"}, {"phone": "bad", "extension": 3}],
+}
+
+
+def test_callbacks_order():
+    events = []
+    hooks = ValidationHooks(
+        on_model_start=lambda model: events.append(("start", model)),
+        on_model_end=lambda model, elapsed: events.append(("end", model)),
+        on_field=lambda model, field, elapsed, errors: events.append(("field", f"{model}.{field}", errors)),
+    )
+
+    Employee.validate({**VALID, "previous": None}, hooks=hooks)
+
+    assert events == [
+        ("start", "Employee"),
+        ("field", "Employee.first_name", 0),
+        ("start", "Contact"),
+        ("field", "Contact.phone", 0),
+        ("field", "Contact.extension", 0),
+        ("end", "Contact"),
+        ("field", "Employee.contact", 0),
+        ("field", "Employee.previous", 0),
+        ("end", "Employee"),
+    ]
+
+
+def test_on_error_reports_each_final_error_once():
+    reported = []
+    hooks = ValidationHooks(on_error=reported.append)
+
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Employee.validate(INVALID, hooks=hooks)
+
+    assert reported == excinfo.value.validation_errors
+    assert len(reported) == 3
+
+
+def test_collector():
+    collector = ProfileCollector()
+
+    Employee.validate_many([VALID, INVALID, 1], hooks=collector)
+    stats = collector.to_dict()
+
+    assert stats["models"]["Employee"]["calls"] == 2
+    assert stats["models"]["Contact"]["calls"] == 5
+    assert stats["fields"]["Contact.extension"]["calls"] == 5
+    assert stats["fields"]["Contact.extension"]["errors"] == 2
+    assert stats["fields"]["Employee.previous"]["errors"] == 2
+    assert all(field["time"] >= 0 for field in stats["fields"].values())
+    assert stats["errors"]["by_path"] == {
+        "contact.extension": 1,
+        "previous.[*].extension": 1,
+        "previous.[*].phone": 1,
+        "": 1,
+    }
+    assert stats["errors"]["by_type"] == {"int": 2, "PhoneNumber": 1, "Employee": 1}
+    json.dumps(stats)
+
+
+def test_collector_clear():
+    collector = ProfileCollector()
+    Employee.validate(VALID, hooks=collector)
+
+    collector.clear()
+
+    assert collector.to_dict() == {"models": {}, "fields": {}, "errors": {"by_path": {}, "by_type": {}}}
+
+
+def test_union_trial_errors_are_not_reported():
+    class Holder(Model):
+        value: Contact | int
+
+    reported = []
+
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Holder.validate({"value": "x"}, coerce=True, hooks=ValidationHooks(on_error=reported.append))
+
+    assert reported == excinfo.value.validation_errors
+    assert len(reported) == 1
+
+
+def test_hooks_with_fail_fast():
+    collector = ProfileCollector()
+
+    with pytest.raises(ValidationErrorGroup):
+        Employee.validate(INVALID, hooks=collector, fail_fast=True)
+
+    assert collector.errors_by_path == {"contact.extension": 1}
+
+
+def test_hooks_with_codegen_validator():
+    collector = ProfileCollector()
+
+    result = GeneratedEmployee.validate(VALID, hooks=collector)
+
+    assert result == GeneratedEmployee.validate(VALID)
+    assert collector.models["GeneratedEmployee"]["calls"] == 1
+    assert collector.fields["Contact.extension"]["calls"] == 1
+
+
+def test_hooks_with_memo():
+    collector = ProfileCollector()
+    contact = {"phone": "8 (955) 318-99-12", "extension": "x"}
+    payload = {"first_name": "Ivan", "contact": contact, "previous": [contact, contact]}
+
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Employee.validate(payload, hooks=collector, memo=SubtreeCache())
+
+    assert len(excinfo.value.validation_errors) == 3
+    assert collector.errors_by_path == {"contact.extension": 1, "previous.[*].extension": 2}
+
+
+def test_hooks_with_stream():
+    collector = ProfileCollector()
+    fp = io.StringIO(json.dumps([VALID, INVALID]))
+
+    results = list(Employee.validate_stream(fp, hooks=collector))
+
+    assert len(results) == 2
+    assert collector.models["Employee"]["calls"] == 2
+    assert sum(collector.errors_by_type.values()) == 3
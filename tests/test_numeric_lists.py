@@ -0,0 +1,121 @@
+import pytest
+from serializer import Model, ValidationErrorGroup, CodegenValidator
+
+
+class Telemetry(Model):
+    samples: list[float]
+    counters: list[int]
+    flags: list[bool]
+
+class GeneratedTelemetry(Model):
+    _validator_cls = CodegenValidator
+
+    samples: list[float]
+    counters: list[int]
+    flags: list[bool]
+
+
+MODELS = (Telemetry, GeneratedTelemetry)
+
+
+def _errors(model, payload, coerce=False):
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        model.validate(payload, coerce=coerce)
+    return [(error["path"], error["message"]) for error in excinfo.value.errors]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_strict_exact_types(model):
+    payload = {"samples": [1.5, 2.0], "counters": [1, 2], "flags": [True, False]}
+
+    result = model.validate(payload)
+
+    assert result == payload
+    assert result["samples"] is not payload["samples"]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_strict_reports_failing_indices(model):
+    payload = {"samples": [1.5, 2, "3"], "counters": [1, True], "flags": ["1"]}
+
+    assert _errors(model, payload) == [
+        ("samples.[1]", "Значение 2 не подходит к типу float"),
+        ("samples.[2]", "Значение 3 не подходит к типу float"),
+        ("counters.[1]", "Значение True не подходит к типу int"),
+        ("flags.[0]", "Значение 1 не подходит к типу bool"),
+    ]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_coerce_matches_builtin_constructors(model):
+    payload = {"samples": [1, "2.5", True], "counters": ["7", 3.9, False], "flags": [0, "", "x"]}
+
+    result = model.validate(payload, coerce=True)
+
+    assert result == {"samples": [1.0, 2.5, 1.0], "counters": [7, 3, 0], "flags": [False, False, True]}
+    assert [type(value) for value in result["samples"]] == [float, float, float]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_coerce_reports_failing_indices(model):
+    payload = {"samples": [1, "x"], "counters": [1, float("nan"), "2"], "flags": []}
+
+    assert _errors(model, payload, coerce=True) == [
+        ("samples.[1]", "Значение x не может быть приведено к типу 'float'"),
+        ("counters.[1]", "Значение nan не может быть приведено к типу 'int'"),
+    ]
+
+
+def test_validate_json_uses_whole_list():
+    assert Telemetry.validate_json('{"samples": [1.5, 2.5], "counters": [1], "flags": [true]}') == {
+        "samples": [1.5, 2.5],
+        "counters": [1],
+        "flags": [True],
+    }
+
+
+class TestNdarray:
+    np = pytest.importorskip("numpy")
+
+    class Samples(Model):
+        _ndarray_lists = True
+
+        samples: list[float]
+        counters: list[int]
+        names: list[str]
+
+    class GeneratedSamples(Model):
+        _ndarray_lists = True
+        _validator_cls = CodegenValidator
+
+        samples: list[float]
+        counters: list[int]
+        names: list[str]
+
+    @pytest.mark.parametrize("model_name", ("Samples", "GeneratedSamples"))
+    @pytest.mark.parametrize("coerce", (True, False))
+    def test_returns_ndarray(self, model_name, coerce):
+        model = getattr(self, model_name)
+
+        result = model.validate({"samples": [1.5, 2.5], "counters": [1, 2], "names": ["a"]}, coerce=coerce)
+
+        assert isinstance(result["samples"], self.np.ndarray)
+        assert result["samples"].dtype == self.np.float64
+        assert result["counters"].tolist() == [1, 2]
+        assert result["names"] == ["a"]
+
+    @pytest.mark.parametrize("model_name", ("Samples", "GeneratedSamples"))
+    def test_element_fallback_returns_ndarray(self, model_name):
+        model = getattr(self, model_name)
+
+        result = model.validate({"samples": [1, "2"], "counters": [], "names": []}, coerce=True)
+
+        assert result["samples"].tolist() == [1.0, 2.0]
+
+    @pytest.mark.parametrize("model_name", ("Samples", "GeneratedSamples"))
+    def test_overflow(self, model_name):
+        model = getattr(self, model_name)
+
+        assert _errors(model, {"samples": [], "counters": [2 ** 70], "names": []}) == [
+            ("counters", "Значения списка не помещаются в int64"),
+        ]
@@ -43,4 +43,27 @@ def test_phone_number_invalid(phone_number):
 
 def test_phone_number_conversion():
     assert PhoneNumber("8 (955) 318-99-12") == "79553189912"
-    assert PhoneNumber("7 (999) 999-99-99") == "79999999999"
\ No newline at end of file
+    assert PhoneNumber("7 (999) 999-99-99") == "79999999999"
+
+def test_phone_number_normalize_many():
+    values = ["8 (955) 318-99-12", "+7 (962) 284-33-13", 79999999999, "7 (999) 999-99-99"]
+
+    assert PhoneNumber.normalize_many(values) == ["79553189912", None, None, "79999999999"]
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    (
+        r"^\+?1\s(\d{3})\s(\d{3})\s(\d{4})$",
+        r"^\+?1\s\d{3}\s\d{3}\s\d{4}$",
+    )
+)
+def test_phone_number_register_locale(monkeypatch, pattern):
+    monkeypatch.setattr(PhoneNumber, "_locale_pattern_map", dict(PhoneNumber._locale_pattern_map))
+    PhoneNumber.register_locale("us", pattern, "1")
+
+    assert PhoneNumber("1 555 123 4567", locale="us") == "15551234567"
+    assert PhoneNumber.normalize_many(["1 555 123 4567", "8 (955) 318-99-12"], locale="us") == ["15551234567", None]
+
+    with pytest.raises(ValueError):
+        PhoneNumber("8 (955) 318-99-12", locale="us")
@@ -0,0 +1,93 @@
+import sys
+import threading
+
+from serializer import Model, PhoneNumber, ValidationErrorGroup
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int = 100
+
+class Employee(Model):
+    name: str
+    contacts: list[Contact]
+
+
+def test_plan_is_compiled_once():
+    plan = Employee._get_plan()
+
+    assert Employee._get_plan() is plan
+    assert Employee.validate({"name": "Max", "contacts": []}) == {"name": "Max", "contacts": []}
+    assert Employee._get_plan() is plan
+
+
+def test_plan_links_nested_models():
+    plan = Employee._get_plan()
+    name, contacts = plan.fields
+
+    assert name.type.annotation is str
+    assert name.type.origin is None
+    assert contacts.type.origin is list
+    assert contacts.type.item.model is Contact._get_plan()
+
+    extension = Contact._get_plan().fields[1]
+    assert extension.has_default
+    assert extension.default == 100
+
+
+def test_plan_is_not_inherited():
+    class Manager(Employee):
+        level: int
+
+    assert Manager._get_plan() is not Employee._get_plan()
+    assert [f.name for f in Manager._get_plan().fields] == ["level"]
+
+
+def test_exact_builtin_values_pass_through():
+    class Record(Model):
+        name: str
+        count: int
+        flag: bool
+
+    name = "".join(["na", "me"])
+    result = Record.validate({"name": name, "count": 10**30, "flag": True})
+
+    assert result["name"] is name
+    assert result["count"] == 10**30
+    assert Record._get_plan().fields[0].type.passthrough
+
+
+def _first_use_from_threads(model: type, workers: int) -> list:
+    barrier = threading.Barrier(workers)
+    results = []
+
+    def first_use():
+        barrier.wait()
+        try:
+            results.append(model.validate({}))
+        except ValidationErrorGroup as exc:
+            results.append(len(exc.errors))
+
+    threads = [threading.Thread(target=first_use) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_plan_compiled_concurrently():
+    class Leaf(Model):
+        value: int
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(5):
+            namespace = {"__annotations__": {f"f{idx}": int for idx in range(400)} | {"leaf": Leaf}}
+            Wide = type(Model)("Wide", (Model,), namespace)
+
+            assert _first_use_from_threads(Wide, 8) == [401] * 8
+            assert Wide._get_plan().fields[-1].type.model is Leaf._get_plan()
+    finally:
+        sys.setswitchinterval(interval)
@@ -0,0 +1,112 @@
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup, CodegenValidator
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(Model):
+    first_name: str
+    last_name: str
+    contact: Contact
+
+class Team(Model):
+    team_name: str
+    members: list[Employee]
+
+class Department(Model):
+    dept_name: str
+    teams: list[Team]
+
+class Company(Model):
+    company_name: str
+    departments: list[Department]
+
+class GeneratedTeam(Model):
+    _validator_cls = CodegenValidator
+
+    team_name: str
+    members: list[Employee]
+
+class GeneratedCompany(Model):
+    _validator_cls = CodegenValidator
+
+    company_name: str
+    departments: list[GeneratedTeam]
+
+
+PAYLOAD = {
+    "company_name": "Acme",
+    "departments": [
+        {
+            "dept_name": "R&D",
+            "teams": [
+                {"team_name": "core", "members": [{"first_name": 1, "contact": "broken"}]},
+            ],
+        },
+    ],
+}
+
+
+def test_include_skips_unselected_subtrees():
+    result = Company.validate(PAYLOAD, include={"company_name", "departments.teams.team_name"})
+
+    assert result == {"company_name": "Acme", "departments": [{"teams": [{"team_name": "core"}]}]}
+
+
+def test_exclude():
+    result = Company.validate(PAYLOAD, exclude={"departments.teams.members"})
+
+    assert result == {
+        "company_name": "Acme",
+        "departments": [{"dept_name": "R&D", "teams": [{"team_name": "core"}]}],
+    }
+
+
+def test_selected_fields_are_still_validated():
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Company.validate(PAYLOAD, include={"departments.teams.members.contact"})
+
+    assert [error["path"] for error in excinfo.value.errors] == ["departments.[0].teams.[0].members.[0].contact"]
+
+
+def test_missing_unselected_fields_are_not_reported():
+    assert Company.validate({"company_name": "Acme"}, include=["company_name"]) == {"company_name": "Acme"}
+
+
+def test_projection_is_cached():
+    plan = Company._get_projection({"company_name"}, None)
+
+    assert Company._get_projection(["company_name"], None) is plan
+    assert Company._get_projection(None, None) is Company._get_plan()
+    assert [field.name for field in plan.fields] == ["company_name"]
+    assert [field.name for field in Company._get_plan().fields] == ["company_name", "departments"]
+
+
+def test_invalid_paths():
+    with pytest.raises(ValueError):
+        Company.validate(PAYLOAD, include={"departments.unknown"})
+    with pytest.raises(ValueError):
+        Company.validate(PAYLOAD, include={"company_name.length"})
+
+
+def test_validate_json_and_many():
+    text = '{"company_name": "Acme", "departments": [{"dept_name": 1, "teams": "x"}]}'
+    assert Company.validate_json(text, include={"company_name"}) == {"company_name": "Acme"}
+
+    validated, errors = Company.validate_many([PAYLOAD, {"company_name": 1}], include={"company_name"})
+    assert validated[0] == {"company_name": "Acme"}
+    assert set(errors) == {1}
+
+
+def test_codegen_projection():
+    payload = {"company_name": "Acme", "departments": [{"team_name": "core", "members": [{"first_name": 1}]}]}
+
+    assert GeneratedCompany.validate(payload, include={"departments.team_name"}) == {
+        "departments": [{"team_name": "core"}],
+    }
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        GeneratedCompany.validate(payload, include={"departments.members.first_name"})
+
+    assert [error["path"] for error in excinfo.value.errors] == ["departments.[0].members.[0].first_name"]
@@ -0,0 +1,89 @@
+import pickle
+
+import pytest
+from serializer import Model, PhoneNumber, CodegenValidator
+
+
+class RecordModel(Model):
+    _record_output = True
+
+class Contact(RecordModel):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(RecordModel):
+    first_name: str
+    contact: Contact
+    previous: list[Contact] = []
+    tags: list[str] = ["default"]
+
+class GeneratedContact(RecordModel):
+    _validator_cls = CodegenValidator
+
+    phone: PhoneNumber
+    extension: int
+
+class GeneratedEmployee(RecordModel):
+    _validator_cls = CodegenValidator
+
+    first_name: str
+    contact: GeneratedContact
+    previous: list[GeneratedContact] = []
+    tags: list[str] = ["default"]
+
+
+PAYLOAD = {
+    "first_name": "Ivan",
+    "contact": {"phone": "8 (955) 318-99-12", "extension": 1},
+    "previous": [{"phone": "8 (999) 999-99-99", "extension": 2}],
+}
+
+EXPECTED = {
+    "first_name": "Ivan",
+    "contact": {"phone": "79553189912", "extension": 1},
+    "previous": [{"phone": "79999999999", "extension": 2}],
+    "tags": ["default"],
+}
+
+
+@pytest.mark.parametrize("model", (Employee, GeneratedEmployee))
+def test_validate_returns_records(model):
+    record = model.validate(PAYLOAD)
+
+    assert type(record).__name__ == f"{model.__name__}Record"
+    assert record.first_name == "Ivan"
+    assert record.contact.phone == "79553189912"
+    assert record.previous[0].extension == 2
+    assert record.to_dict() == EXPECTED
+    assert not hasattr(record, "__dict__")
+
+
+def test_other_entry_points_return_records():
+    assert Employee.validate_json(
+        '{"first_name": "Ivan", "contact": {"phone": "8 (955) 318-99-12", "extension": 1}, "previous": []}'
+    ).contact.extension == 1
+
+    validated, errors = Employee.validate_many([PAYLOAD, {"first_name": 1}])
+    assert validated[0].to_dict() == EXPECTED
+    assert validated[1] is None and set(errors) == {1}
+
+
+def test_record_equality_and_repr():
+    record = Contact.validate({"phone": "8 (955) 318-99-12", "extension": 1})
+
+    assert record == Contact.validate({"phone": "8 (955) 318-99-12", "extension": 1})
+    assert record != Contact.validate({"phone": "8 (955) 318-99-12", "extension": 2})
+    assert repr(record) == "ContactRecord(phone='79553189912', extension=1)"
+
+
+def test_record_pickle():
+    record = Employee.validate(PAYLOAD)
+
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_default_output_is_dict():
+    class Plain(Model):
+        name: str
+
+    assert Plain.validate({"name": "x"}) == {"name": "x"}
@@ -0,0 +1,209 @@
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(Model):
+    first_name: str
+    contact: Contact
+
+class Team(Model):
+    team_name: str
+    members: list[Employee]
+    lead: Employee | None
+
+class Company(Model):
+    company_name: str
+    teams: list[Team]
+    tags: list[str] = ["default"]
+
+
+def _employee(name, extension):
+    return {"first_name": name, "contact": {"phone": "8 (955) 318-99-12", "extension": extension}}
+
+
+PAYLOAD = {
+    "company_name": "Acme",
+    "teams": [
+        {"team_name": "core", "members": [_employee("Ivan", 1), _employee("Olga", 2)], "lead": None},
+        {"team_name": "infra", "members": [_employee("Petr", 3)], "lead": _employee("Anna", 4)},
+    ],
+}
+
+
+@pytest.fixture
+def company():
+    return Company.validate(PAYLOAD)
+
+
+def test_replace_reuses_untouched_subtrees(company):
+    result = Company.revalidate(company, [{"op": "replace", "path": "/teams/0/members/1/contact/extension", "value": 22}])
+
+    assert result["teams"][0]["members"][1]["contact"]["extension"] == 22
+    assert company["teams"][0]["members"][1]["contact"]["extension"] == 2
+    assert result["teams"][1] is company["teams"][1]
+    assert result["teams"][0]["members"][0] is company["teams"][0]["members"][0]
+    assert result == Company.validate({**PAYLOAD, "teams": [
+        {**PAYLOAD["teams"][0], "members": [_employee("Ivan", 1), _employee("Olga", 22)]},
+        PAYLOAD["teams"][1],
+    ]})
+
+
+def test_patch_values_are_validated_with_full_paths(company):
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Company.revalidate(company, [
+            {"op": "replace", "path": "/teams/1/lead/contact/extension", "value": "x"},
+            {"op": "add", "path": "/teams/0/members/-", "value": {"first_name": "Lev"}},
+        ])
+
+    assert [error["path"] for error in excinfo.value.errors] == [
+        "teams.[0].members.[2].contact",
+        "teams.[1].lead.contact.extension",
+    ]
+
+
+def _errors(validate, *args, **kwargs):
+    try:
+        validate(*args, **kwargs)
+    except ValidationErrorGroup as e:
+        return e.errors
+    return []
+
+
+def test_later_operation_overrides_earlier_errors(company):
+    result = Company.revalidate(company, [
+        {"op": "replace", "path": "/teams/0/members/1/contact/extension", "value": "z"},
+        {"op": "replace", "path": "/teams/0/members/1/contact/extension", "value": "2"},
+        {"op": "replace", "path": "/teams/1/team_name", "value": 5},
+        {"op": "remove", "path": "/teams/1"},
+        {"op": "remove", "path": "/company_name"},
+        {"op": "add", "path": "/company_name", "value": "Acme"},
+    ], coerce=True)
+
+    assert result == Company.validate({**PAYLOAD, "teams": PAYLOAD["teams"][:1]}, coerce=True)
+
+
+def test_error_paths_use_final_indices(company):
+    patch = [
+        {"op": "replace", "path": "/teams/1/members/0/contact/extension", "value": "x"},
+        {"op": "add", "path": "/teams/0", "value": {"team_name": "new", "members": [], "lead": None}},
+        {"op": "remove", "path": "/teams/1/members/0"},
+        {"op": "add", "path": "/teams/2/members/0", "value": _employee("Lev", "y")},
+    ]
+    patched = {**PAYLOAD, "teams": [
+        {"team_name": "new", "members": [], "lead": None},
+        {**PAYLOAD["teams"][0], "members": [_employee("Olga", 2)]},
+        {**PAYLOAD["teams"][1], "members": [_employee("Lev", "y"), _employee("Petr", "x")]},
+    ]}
+
+    errors = _errors(Company.revalidate, company, patch)
+
+    assert [error["path"] for error in errors] == [
+        "teams.[2].members.[0].contact.extension",
+        "teams.[2].members.[1].contact.extension",
+    ]
+    assert errors == _errors(Company.validate, patched)
+
+
+def test_coerce(company):
+    result = Company.revalidate(company, [{"op": "replace", "path": "/teams/0/members/0/contact", "value": {
+        "phone": "8 (999) 999-99-99", "extension": "5",
+    }}], coerce=True)
+
+    assert result["teams"][0]["members"][0]["contact"] == {"phone": "79999999999", "extension": 5}
+
+
+def test_add_and_remove(company):
+    result = Company.revalidate(company, [
+        {"op": "add", "path": "/teams/0/members/0", "value": _employee("Lev", 9)},
+        {"op": "remove", "path": "/teams/1"},
+        {"op": "remove", "path": "/tags"},
+    ])
+
+    assert [member["first_name"] for member in result["teams"][0]["members"]] == ["Lev", "Ivan", "Olga"]
+    assert len(result["teams"]) == 1
+    assert result["tags"] == ["default"]
+    assert len(company["teams"]) == 2
+
+
+def test_remove_required_field(company):
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Company.revalidate(company, [{"op": "remove", "path": "/teams/0/team_name"}])
+
+    assert excinfo.value.errors[0]["path"] == "teams.[0].team_name"
+
+
+def test_replace_whole_document(company):
+    assert Company.revalidate(company, [{"op": "replace", "path": "", "value": PAYLOAD}]) == company
+
+
+@pytest.mark.parametrize("operation", (
+    {"op": "move", "path": "/company_name", "from": "/tags"},
+    {"op": "replace", "path": "/unknown", "value": 1},
+    {"op": "replace", "path": "/teams/5/team_name", "value": "x"},
+    {"op": "replace", "path": "/teams/01/team_name", "value": "x"},
+    {"op": "replace", "path": "/company_name/x", "value": "x"},
+    {"op": "replace", "path": "company_name", "value": "x"},
+    {"op": "replace", "path": "/company_name"},
+    {"op": "remove", "path": ""},
+))
+def test_invalid_patch(company, operation):
+    with pytest.raises(ValueError):
+        Company.revalidate(company, [operation])
+
+
+class RecordContact(Model):
+    _record_output = True
+
+    phone: PhoneNumber
+    extension: int
+
+class RecordEmployee(Model):
+    _record_output = True
+
+    first_name: str
+    contact: RecordContact
+    previous: list[RecordContact] | None
+
+
+RECORD_PAYLOAD = {
+    "first_name": "Ivan",
+    "contact": {"phone": "8 (955) 318-99-12", "extension": 1},
+    "previous": [{"phone": "8 (900) 000-11-22", "extension": 2}],
+}
+
+
+def test_revalidate_records():
+    employee = RecordEmployee.validate(RECORD_PAYLOAD)
+
+    result = RecordEmployee.revalidate(employee, [
+        {"op": "replace", "path": "/contact/extension", "value": 5},
+        {"op": "add", "path": "/previous/0", "value": {"phone": "8 (911) 111-11-11", "extension": 3}},
+    ])
+
+    assert type(result) is type(employee)
+    assert result.contact.extension == 5
+    assert employee.contact.extension == 1
+    assert [contact.extension for contact in result.previous] == [3, 2]
+    assert result.previous[1] is employee.previous[0]
+    assert result == RecordEmployee.validate({
+        **RECORD_PAYLOAD,
+        "contact": {"phone": "8 (955) 318-99-12", "extension": 5},
+        "previous": [{"phone": "8 (911) 111-11-11", "extension": 3}, *RECORD_PAYLOAD["previous"]],
+    })
+
+
+def test_revalidate_records_remove_and_errors():
+    employee = RecordEmployee.validate(RECORD_PAYLOAD)
+
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        RecordEmployee.revalidate(employee, [
+            {"op": "replace", "path": "/contact/extension", "value": "x"},
+            {"op": "remove", "path": "/previous"},
+        ])
+
+    assert [error["path"] for error in excinfo.value.errors] == ["contact.extension", "previous"]
+    assert employee.previous is not None
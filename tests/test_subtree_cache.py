@@ -0,0 +1,109 @@
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup, CodegenValidator, SubtreeCache
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(Model):
+    first_name: str
+    contact: Contact
+
+class Team(Model):
+    team_name: str
+    members: list[Employee]
+
+class GeneratedTeam(Model):
+    _validator_cls = CodegenValidator
+
+    team_name: str
+    members: list[Employee]
+
+
+CONTACT = {"phone": "8 (955) 318-99-12", "extension": 1}
+
+
+def _errors(call):
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        call()
+    return [(error["path"], error["message"]) for error in excinfo.value.errors]
+
+
+@pytest.mark.parametrize("model", (Team, GeneratedTeam))
+def test_identity_hits(model):
+    memo = SubtreeCache()
+    payload = {"team_name": "core", "members": [{"first_name": f"n{i}", "contact": CONTACT} for i in range(5)]}
+
+    result = model.validate(payload, memo=memo)
+
+    assert result == model.validate(payload)
+    assert memo.identity_hits == 4
+    assert result["members"][0]["contact"] is result["members"][4]["contact"]
+
+
+def test_structural_hits():
+    memo = SubtreeCache(structural=True)
+    payload = {"team_name": "core", "members": [{"first_name": "n", "contact": dict(CONTACT)} for _ in range(3)]}
+
+    Team.validate(payload, memo=memo)
+
+    # второй и третий сотрудник совпадают с первым целиком
+    assert memo.structural_hits == 2
+    assert memo.stats()["hit_rate"] == pytest.approx(2 / 5)
+
+
+def test_structural_size_limit():
+    memo = SubtreeCache(structural=True, max_structural_size=2)
+    payload = {"team_name": "core", "members": [{"first_name": "n", "contact": dict(CONTACT)} for _ in range(3)]}
+
+    Team.validate(payload, memo=memo)
+
+    assert memo.structural_hits == 0
+
+
+def test_value_types_are_part_of_structural_key():
+    memo = SubtreeCache(structural=True)
+    payload = {"team_name": "core", "members": [
+        {"first_name": "a", "contact": {"phone": "8 (955) 318-99-12", "extension": 1}},
+        {"first_name": "b", "contact": {"phone": "8 (955) 318-99-12", "extension": True}},
+    ]}
+
+    assert _errors(lambda: Team.validate(payload, memo=memo)) == [
+        ("members.[1].contact.extension", "Значение True не подходит к типу int"),
+    ]
+
+
+def test_cached_errors_are_rebased():
+    contact = {"phone": "bad"}
+    payload = {"team_name": "core", "members": [{"first_name": "a", "contact": contact}, {"first_name": "b", "contact": contact}]}
+
+    cached = _errors(lambda: Team.validate(payload, memo=SubtreeCache(structural=True)))
+
+    assert cached == _errors(lambda: Team.validate(payload))
+    assert cached[-1] == ("members.[1].contact.extension", "Отсутствует ключ members.[1].contact.extension")
+
+
+def test_batch_memo_and_coerce_separation():
+    memo = SubtreeCache()
+    records = [{"first_name": "a", "contact": {"phone": "8 (955) 318-99-12", "extension": "1"}}] * 3
+
+    validated, errors = Employee.validate_many(records, memo=memo)
+    assert set(errors) == {0, 1, 2}
+    assert memo.identity_hits == 2
+
+    validated, errors = Employee.validate_many(records, coerce=True, memo=memo)
+    assert not errors
+    assert validated[0]["contact"]["extension"] == 1
+
+
+def test_eviction_and_clear():
+    memo = SubtreeCache(maxsize=2)
+    Team.validate({"team_name": "x", "members": [{"first_name": "n", "contact": dict(CONTACT)} for _ in range(3)]}, memo=memo)
+
+    assert memo.evictions > 0
+    memo.clear()
+    assert memo.stats()["size"] == 0
+
+    with pytest.raises(ValueError):
+        SubtreeCache(maxsize=0)
@@ -0,0 +1,129 @@
+import pytest
+from serializer import Model, ValidationErrorGroup, CodegenValidator, TaggedUnion
+
+
+class Created(Model):
+    type: str = "created"
+    user_id: int
+    name: str
+
+class Deleted(Model):
+    type: str = "deleted"
+    user_id: int
+
+Event = TaggedUnion(Created, Deleted)
+
+class Batch(Model):
+    source: str
+    events: list[Event]
+
+class GeneratedCreated(Model):
+    _validator_cls = CodegenValidator
+
+    type: str = "created"
+    user_id: int
+    name: str
+
+class GeneratedDeleted(Model):
+    _validator_cls = CodegenValidator
+
+    type: str = "deleted"
+    user_id: int
+
+class GeneratedBatch(Model):
+    _validator_cls = CodegenValidator
+
+    source: str
+    events: list[TaggedUnion(GeneratedCreated, GeneratedDeleted)]
+
+
+def _errors(call):
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        call()
+    return [(error["path"], error["message"]) for error in excinfo.value.errors]
+
+
+def test_top_level_validate():
+    assert Event.validate({"type": "deleted", "user_id": 1}) == {"type": "deleted", "user_id": 1}
+    assert Event.validate({"type": "created", "user_id": "1", "name": "x"}, coerce=True)["user_id"] == 1
+
+
+def test_errors_only_for_selected_variant():
+    assert _errors(lambda: Event.validate({"type": "created", "user_id": "x"})) == [
+        ("user_id", "Значение x не подходит к типу int"),
+        ("name", "Отсутствует ключ name"),
+    ]
+
+
+def test_unknown_and_missing_tag():
+    assert _errors(lambda: Event.validate({"type": "renamed"})) == [
+        ("type", "Неизвестное значение renamed ключа type, ожидается одно из: created, deleted"),
+    ]
+    assert _errors(lambda: Event.validate({"type": ["created"]}))[0][0] == "type"
+    assert _errors(lambda: Event.validate({"user_id": 1})) == [("type", "Отсутствует ключ type")]
+
+
+def test_top_level_requires_dict():
+    with pytest.raises(TypeError):
+        Event.validate([])
+
+
+def test_validate_many():
+    validated, errors = Event.validate_many(
+        [{"type": "deleted", "user_id": 1}, {"type": "x"}, 5, {"type": "created", "user_id": 2, "name": "n"}],
+    )
+
+    assert validated[0] == {"type": "deleted", "user_id": 1}
+    assert validated[1] is None and validated[2] is None
+    assert set(errors) == {1, 2}
+    assert errors[1].cls_name == "Created | Deleted"
+
+
+@pytest.mark.parametrize("model", (Batch, GeneratedBatch))
+def test_field_annotation(model):
+    payload = {
+        "source": "api",
+        "events": [
+            {"type": "created", "user_id": 1, "name": "n"},
+            {"type": "deleted", "user_id": "x"},
+            {"type": "unknown"},
+            "oops",
+        ],
+    }
+
+    assert _errors(lambda: model.validate(payload)) == [
+        ("events.[1].user_id", "Значение x не подходит к типу int"),
+        ("events.[2].type", "Неизвестное значение unknown ключа type, ожидается одно из: created, deleted"),
+        ("events.[3]", "Значение должно быть типа dict"),
+    ]
+
+    payload["events"] = payload["events"][:1]
+    assert model.validate(payload)["events"] == [{"type": "created", "user_id": 1, "name": "n"}]
+
+
+def test_invalid_variants():
+    class Untagged(Model):
+        user_id: int
+
+    class Duplicate(Model):
+        type: str = "created"
+
+    with pytest.raises(TypeError):
+        TaggedUnion()
+    with pytest.raises(TypeError):
+        TaggedUnion(Created, Untagged)
+    with pytest.raises(TypeError):
+        TaggedUnion(Created, Duplicate)
+    with pytest.raises(TypeError):
+        TaggedUnion(Created, dict)
+
+
+def test_custom_tag():
+    class Ping(Model):
+        kind: str = "ping"
+
+    class Pong(Model):
+        kind: str = "pong"
+        delay: float
+
+    assert TaggedUnion(Ping, Pong, tag="kind").validate({"kind": "pong", "delay": 0.5}) == {"kind": "pong", "delay": 0.5}
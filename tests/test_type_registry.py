@@ -0,0 +1,128 @@
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup, CodegenValidator, register_type
+from serializer.lib import registry
+
+
+class Percent(float):
+    def __new__(cls, value):
+        value = float(value)
+        if not 0 <= value <= 100:
+            raise ValueError(f"{value} вне диапазона")
+        return super().__new__(cls, value)
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    monkeypatch.setattr(registry, "_registry", dict(registry._registry))
+    calls = {"check": 0, "coerce": 0, "batch": 0}
+
+    def check(value):
+        calls["check"] += 1
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+    def coerce(value):
+        calls["coerce"] += 1
+        return Percent(value)
+
+    def batch(values):
+        calls["batch"] += 1
+        result = []
+        for value in values:
+            try:
+                result.append(Percent(value))
+            except (TypeError, ValueError):
+                result.append(None)
+        return result
+
+    register_type(Percent, check=check, coerce=coerce, batch=batch)
+    return calls
+
+
+def _models():
+    class Stats(Model):
+        share: Percent
+        history: list[Percent]
+
+    class GeneratedStats(Model):
+        _validator_cls = CodegenValidator
+
+        share: Percent
+        history: list[Percent]
+
+    return Stats, GeneratedStats
+
+
+def test_register_type_requires_type():
+    with pytest.raises(TypeError):
+        register_type("Percent")
+
+
+@pytest.mark.parametrize("generated", (False, True))
+def test_strict_check_rejects_without_converter(calls, generated):
+    model = _models()[generated]
+
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        model.validate({"share": "50", "history": []})
+
+    assert calls["coerce"] == 0
+    assert excinfo.value.errors[0]["path"] == "share"
+
+
+@pytest.mark.parametrize("generated", (False, True))
+def test_coerce_uses_converter(calls, generated):
+    model = _models()[generated]
+
+    result = model.validate({"share": "50", "history": []}, coerce=True)
+
+    assert result["share"] == 50.0
+    assert calls["check"] == 0
+    assert calls["coerce"] == 1
+
+
+@pytest.mark.parametrize("generated", (False, True))
+@pytest.mark.parametrize("coerce", (True, False))
+def test_batch_converter_for_lists(calls, generated, coerce):
+    model = _models()[generated]
+
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        model.validate({"share": 1, "history": [1, 2.5, 500, 3, "4"]}, coerce=coerce)
+
+    assert calls["batch"] == 1
+    paths = [error["path"] for error in excinfo.value.errors]
+    assert paths == (["history.[2]"] if coerce else ["history.[2]", "history.[4]"])
+
+
+def test_builtins_registered():
+    for tp in (str, int, float):
+        spec = registry.get_type_spec(tp)
+        assert spec.check(tp()) and not spec.check(object())
+
+
+@pytest.mark.parametrize("validator_cls", (None, CodegenValidator))
+def test_strict_bool_accepts_int_like_constructor(validator_cls):
+    class Flags(Model):
+        enabled: bool
+        flags: list[bool]
+
+    if validator_cls is not None:
+        Flags._validator_cls = validator_cls
+
+    assert registry.get_type_spec(bool) is None
+    assert Flags.validate({"enabled": 1, "flags": [0, True]}) == {"enabled": True, "flags": [False, True]}
+    with pytest.raises(ValidationErrorGroup):
+        Flags.validate({"enabled": "1", "flags": []})
+
+
+@pytest.mark.parametrize("validator_cls", (None, CodegenValidator))
+def test_phone_number_list_uses_batch(validator_cls):
+    class Contacts(Model):
+        phones: list[PhoneNumber]
+
+    if validator_cls is not None:
+        Contacts._validator_cls = validator_cls
+
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Contacts.validate({"phones": ["8 (955) 318-99-12", 79553189912, "bad"]}, coerce=True)
+
+    assert [error["path"] for error in excinfo.value.errors] == ["phones.[1]", "phones.[2]"]
+    assert Contacts.validate({"phones": ["8 (955) 318-99-12"]}) == {"phones": ["79553189912"]}
@@ -0,0 +1,134 @@
+from typing import Optional
+
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup, CodegenValidator
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(Model):
+    name: str
+    age: int | None
+    badge: str | int
+    contact: Optional[Contact]
+    scores: list[float | None]
+
+class GeneratedContact(Model):
+    _validator_cls = CodegenValidator
+
+    phone: PhoneNumber
+    extension: int
+
+class GeneratedEmployee(Model):
+    _validator_cls = CodegenValidator
+
+    name: str
+    age: int | None
+    badge: str | int
+    contact: Optional[GeneratedContact]
+    scores: list[float | None]
+
+
+MODELS = (Employee, GeneratedEmployee)
+
+VALID = {
+    "name": "Ivan",
+    "age": None,
+    "badge": 17,
+    "contact": None,
+    "scores": [1.5, None],
+}
+
+
+def _errors(model, payload, coerce=False, **kwargs):
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        model.validate(payload, coerce=coerce, **kwargs)
+    return [(error["path"], error["message"]) for error in excinfo.value.errors]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_exact_types_dispatch(model):
+    assert model.validate(VALID) == VALID
+    assert model.validate({**VALID, "age": 30, "badge": "A-17"})["badge"] == "A-17"
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_optional_model(model):
+    payload = {**VALID, "contact": {"phone": "8 (955) 318-99-12", "extension": 12}}
+
+    assert model.validate(payload)["contact"] == {"phone": "79553189912", "extension": 12}
+    assert _errors(model, {**VALID, "contact": {"phone": "8 (955) 318-99-12", "extension": "x"}}) == [
+        ("contact.extension", "Значение x не подходит к типу int"),
+    ]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_strict_mode_rejects_other_types(model):
+    assert _errors(model, {**VALID, "age": "30", "scores": [1]}) == [
+        ("age", "Значение 30 не подходит ни к одному из типов int | None"),
+        ("scores.[0]", "Значение 1 не подходит ни к одному из типов float | None"),
+    ]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_coerce_tries_members_in_order(model):
+    result = model.validate({**VALID, "age": "30", "badge": 1.5, "scores": [1, "2.5"]}, coerce=True)
+
+    assert result["age"] == 30
+    assert result["badge"] == "1.5"
+    assert result["scores"] == [1.0, 2.5]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_coerce_failure(model):
+    assert _errors(model, {**VALID, "age": "abc"}, coerce=True) == [
+        ("age", "Значение abc не подходит ни к одному из типов int | None"),
+    ]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_failed_trials_do_not_count_towards_limit(model):
+    result = model.validate({**VALID, "age": "30"}, coerce=True, max_errors=1)
+
+    assert result["age"] == 30
+
+
+def test_ambiguous_runtime_type_is_not_dispatched():
+    class Left(Model):
+        left: int
+
+    class Right(Model):
+        right: int
+
+    class Holder(Model):
+        value: Left | Right
+
+    plan = Holder._get_plan().fields[0].type
+    assert dict not in plan.dispatch
+    assert Holder.validate({"value": {"right": 1}}) == {"value": {"right": 1}}
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_union_names_in_errors(model):
+    contact = model._get_plan().fields[3].type.annotation.__args__[0].__name__
+
+    assert _errors(model, {**VALID, "contact": "x", "badge": None}) == [
+        ("badge", "Значение None не подходит ни к одному из типов str | int"),
+        ("contact", f"Значение x не подходит ни к одному из типов {contact} | None"),
+    ]
+
+
+@pytest.mark.parametrize("validator_cls", (None, CodegenValidator))
+def test_optional_field_with_none_default(validator_cls):
+    class Profile(Model):
+        name: str
+        contact: Optional[Contact] = None
+        age: int | None = None
+        rank: int = 0
+
+    if validator_cls is not None:
+        Profile._validator_cls = validator_cls
+
+    assert Profile.validate({"name": "Ivan"}) == {"name": "Ivan", "contact": None, "age": None, "rank": 0}
@@ -0,0 +1,96 @@
+import pytest
+from serializer import Model, PhoneNumber, CodegenValidator, ValidationErrorGroup
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(Model):
+    name: str
+    age: int
+    contact: Contact
+    tags: list[str] = ["default"]
+
+class Node(Model):
+    value: int
+
+Node.__annotations__["child"] = Node
+
+class GeneratedEmployee(Model):
+    _validator_cls = CodegenValidator
+
+    name: str
+    age: int
+    contact: Contact
+    tags: list[str] = ["default"]
+
+
+RECORDS = [
+    {"name": "Ivan", "age": 30, "contact": {"phone": "8 (955) 318-99-12", "extension": 1}},
+    {"name": "Petr", "age": "x", "contact": {"phone": "8 (955) 318-99-12", "extension": 2}},
+    {"name": "Anna", "age": 25, "contact": "none", "tags": ["a"]},
+    5,
+    {"name": "Olga", "age": 41, "contact": {"phone": "8 (999) 999-99-99", "extension": 3}, "tags": ["b"]},
+]
+
+
+@pytest.mark.parametrize("model", (Employee, GeneratedEmployee))
+def test_columns_collect(model):
+    columns, valid, errors = model.validate_columns(RECORDS)
+
+    assert columns == {
+        "name": ["Ivan", None, None, None, "Olga"],
+        "age": [30, None, None, None, 41],
+        "contact.phone": ["79553189912", None, None, None, "79999999999"],
+        "contact.extension": [1, None, None, None, 3],
+        "tags": [["default"], None, None, None, ["b"]],
+    }
+    assert valid == [True, False, False, False, True]
+    assert set(errors) == {1, 2, 3}
+    assert errors[2].errors[0]["path"] == "contact"
+
+
+def test_columns_match_validate_many():
+    _, errors = Employee.validate_many(RECORDS)
+    _, valid, column_errors = Employee.validate_columns(RECORDS)
+
+    assert {idx: group.errors for idx, group in errors.items()} == {
+        idx: group.errors for idx, group in column_errors.items()
+    }
+
+
+def test_columns_skip_and_raise():
+    columns, valid, errors = Employee.validate_columns(RECORDS, on_error="skip")
+
+    assert columns["name"] == ["Ivan", "Olga"]
+    assert valid == [True, True]
+    assert set(errors) == {1, 2, 3}
+
+    with pytest.raises(ValidationErrorGroup):
+        Employee.validate_columns(RECORDS, on_error="raise")
+
+
+def test_columns_fail_fast_keeps_lengths():
+    columns, valid, _ = Employee.validate_columns(RECORDS, fail_fast=True, coerce=True)
+
+    assert {len(column) for column in columns.values()} == {len(valid)}
+
+
+def test_recursive_model_is_not_flattened():
+    columns, valid, errors = Node.validate_columns([{"value": 1, "child": {"value": 2}}])
+
+    assert columns == {"value": [None], "child": [None]}
+    assert valid == [False]
+    assert errors[0].errors[0]["path"] == "child.child"
+
+
+def test_ndarray_columns():
+    np = pytest.importorskip("numpy")
+
+    columns, valid, _ = Employee.validate_columns(RECORDS, ndarray=True)
+
+    assert isinstance(columns["age"], np.ndarray)
+    assert columns["age"].tolist() == [30, 0, 0, 0, 41]
+    assert columns["contact.extension"][valid].tolist() == [1, 3]
+    assert columns["name"] == ["Ivan", None, None, None, "Olga"]
@@ -0,0 +1,147 @@
+import json
+
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(Model):
+    first_name: str
+    last_name: str
+    contact: Contact
+    position: str = "engineer"
+
+class Team(Model):
+    team_name: str
+    members: list[Employee]
+
+
+def _run(validate, payload, coerce):
+    try:
+        return validate(payload, coerce=coerce), None
+    except ValidationErrorGroup as e:
+        return None, e.errors
+
+
+PAYLOADS = (
+    """{
+        "team_name": "Backend",
+        "members": [
+            {
+                "first_name": "Alice",
+                "last_name": "Smith",
+                "contact": {"phone": "8 (950) 111-22-33", "extension": "101"}
+            }
+        ]
+    }""",
+    # ключи в другом порядке, лишние ключи и вложенные лишние объекты
+    """{
+        "extra": {"nested": [1, {"a": "}]"}], "s": "\\"{["},
+        "members": [
+            {
+                "contact": {"extension": 12, "phone": "7 (950) 222-33-44", "skip": [[], {}]},
+                "last_name": "Johnson",
+                "first_name": "Bob",
+                "position": "lead"
+            }
+        ],
+        "team_name": 123
+    }""",
+    # ошибки в разных полях и отсутствующие ключи
+    """{
+        "members": [
+            {"contact": {"extension": "абв", "phone": 123}, "first_name": "Charlie"},
+            "not a dict",
+            {"first_name": "Dana", "last_name": "White", "contact": []}
+        ]
+    }""",
+    '{"team_name": "QA", "members": {"first_name": "Eve"}}',
+    '{"team_name": "QA", "team_name": 5, "members": []}',
+    # ошибка в раннем значении повторенного ключа не сохраняется
+    '{"team_name": 5, "team_name": "QA", "members": []}',
+    '{"members": [{"contact": {"extension": "x", "phone": 1, "extension": 5}}], "team_name": "QA"}',
+)
+
+
+@pytest.mark.parametrize("coerce", (False, True))
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_validate_json_matches_validate(payload, coerce):
+    expected = _run(Team.validate, json.loads(payload), coerce)
+
+    assert _run(Team.validate_json, payload, coerce) == expected
+    assert _run(Team.validate_json, payload.encode(), coerce) == expected
+
+
+@pytest.mark.parametrize("max_errors", (1, 2, 3))
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_validate_json_error_limit_matches_validate(payload, max_errors):
+    def run(validate, payload):
+        try:
+            return validate(payload, max_errors=max_errors), None
+        except ValidationErrorGroup as e:
+            return None, (e.errors, e.limit_reached)
+
+    assert run(Team.validate_json, payload) == run(Team.validate, json.loads(payload))
+
+
+def test_validate_json_fail_fast_reports_first_declared_field():
+    payload = '{"members": "x", "team_name": 5}'
+
+    with pytest.raises(ValidationErrorGroup) as exc_info:
+        Team.validate_json(payload, fail_fast=True)
+
+    assert [error["path"] for error in exc_info.value.errors] == ["team_name"]
+
+
+def test_validate_json_keeps_declaration_order():
+    result = Team.validate_json(PAYLOADS[1], coerce=True)
+
+    assert list(result) == ["team_name", "members"]
+    assert list(result["members"][0]) == ["first_name", "last_name", "contact", "position"]
+
+
+@pytest.mark.parametrize("payload", ('{"team_name": "QA",', '{"team_name" "QA"}', '{"team_name": "QA"} []'))
+def test_validate_json_malformed(payload):
+    with pytest.raises(json.JSONDecodeError):
+        Team.validate_json(payload)
+
+
+@pytest.mark.parametrize(
+    "junk",
+    (
+        "[1,,2}",
+        "[1, 2}",
+        "{\"a\": [}",
+        "{\"a\": 1,}",
+        "[1 2]",
+        "{\"a\" 1}",
+        "{1: 2}",
+        "[[]",
+        "\"a\tb\"",
+        "\"\\x\"",
+        "[\"\\u12G4\"]",
+        "[nul]",
+    ),
+)
+def test_validate_json_malformed_unknown_key(junk):
+    payload = f'{{"team_name": "QA", "junk": {junk}, "members": []}}'
+
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(payload)
+    with pytest.raises(json.JSONDecodeError):
+        Team.validate_json(payload)
+
+
+def test_validate_json_control_character_in_key():
+    payload = '{"team_name": "QA", "a\x01": 1, "members": []}'
+
+    with pytest.raises(json.JSONDecodeError):
+        Team.validate_json(payload)
+
+
+def test_validate_json_not_an_object():
+    with pytest.raises(TypeError):
+        Team.validate_json("[1, 2]")
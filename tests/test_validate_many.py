@@ -0,0 +1,66 @@
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup, CodegenValidator
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class GeneratedContact(Model):
+    _validator_cls = CodegenValidator
+
+    phone: PhoneNumber
+    extension: int
+
+
+RECORDS = [
+    {"phone": "8 (960) 123-54-64", "extension": "22"},
+    {"phone": "8 (960) 123-54-6", "extension": "22"},
+    {"phone": "7 (950) 222-33-44", "extension": 102},
+    "not a dict",
+]
+
+
+@pytest.mark.parametrize("model", (Contact, GeneratedContact))
+def test_validate_many_collect(model):
+    validated, errors = model.validate_many(RECORDS, coerce=True)
+
+    assert validated == [
+        {"phone": "79601235464", "extension": 22},
+        None,
+        {"phone": "79502223344", "extension": 102},
+        None,
+    ]
+    assert list(errors) == [1, 3]
+    assert isinstance(errors[1], ValidationErrorGroup)
+
+    err = errors[1].errors[0]
+    assert err["path"] == "phone"
+    assert err["message"] == "Значение 8 (960) 123-54-6 не может быть приведено к типу 'PhoneNumber'"
+
+    err = errors[3].errors[0]
+    assert err["path"] == ""
+    assert err["message"] == "Значение должно быть типа dict"
+
+
+def test_validate_many_skip():
+    validated, errors = Contact.validate_many(iter(RECORDS), coerce=True, on_error="skip")
+
+    assert validated == [
+        {"phone": "79601235464", "extension": 22},
+        {"phone": "79502223344", "extension": 102},
+    ]
+    assert list(errors) == [1, 3]
+
+
+def test_validate_many_raise():
+    with pytest.raises(ValidationErrorGroup) as excinfo:
+        Contact.validate_many(RECORDS, on_error="raise")
+
+    assert len(excinfo.value.errors) == 1
+    assert excinfo.value.errors[0]["path"] == "extension"
+
+
+def test_validate_many_unknown_mode():
+    with pytest.raises(ValueError):
+        Contact.validate_many(RECORDS, on_error="ignore")
@@ -0,0 +1,63 @@
+import pickle
+
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup
+from serializer.lib.exc import ValidationError
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+class Employee(Model):
+    first_name: str
+    contact: Contact
+
+
+def _records(count):
+    records = []
+    for idx in range(count):
+        extension = "абв" if idx % 7 == 3 else str(idx)
+        records.append({"first_name": f"user{idx}", "contact": {"phone": "8 (950) 111-22-33", "extension": extension}})
+    return records
+
+
+def _as_dicts(errors):
+    return {idx: group.errors for idx, group in errors.items()}
+
+
+@pytest.mark.parametrize("chunksize", (None, 1, 5))
+def test_validate_parallel_matches_validate_many(chunksize):
+    records = _records(40)
+
+    validated, errors = Employee.validate_parallel(records, coerce=True, workers=2, chunksize=chunksize, min_parallel_size=0)
+    expected_validated, expected_errors = Employee.validate_many(records, coerce=True)
+
+    assert validated == expected_validated
+    assert _as_dicts(errors) == _as_dicts(expected_errors)
+    assert list(errors) == [3, 10, 17, 24, 31, 38]
+    assert errors[10].errors[0]["path"] == "contact.extension"
+
+
+def test_validate_parallel_small_batch_stays_in_process(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("process pool must not be used")
+
+    monkeypatch.setattr("serializer.lib.base.iter_validate_parallel", fail)
+
+    validated, errors = Employee.validate_parallel(_records(5), coerce=True, workers=2)
+
+    assert len(validated) == 5
+    assert list(errors) == [3]
+
+
+def test_validate_parallel_raise():
+    with pytest.raises(ValidationErrorGroup):
+        Employee.validate_parallel(_records(20), coerce=True, workers=2, min_parallel_size=0, on_error="raise")
+
+
+def test_validation_error_pickle():
+    error = ValidationError(path=["a", "[0]"], value="x", cause="message", expected_type="int")
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert restored.as_dict() == error.as_dict()
@@ -0,0 +1,106 @@
+import io
+import json
+
+import pytest
+from serializer import Model, PhoneNumber, ValidationErrorGroup
+
+
+class Contact(Model):
+    phone: PhoneNumber
+    extension: int
+
+
+RECORDS = [
+    {"phone": "8 (960) 123-54-64", "extension": "22"},
+    {"phone": "8 (960) 123-54-6", "extension": "22"},
+    {"phone": "7 (950) 222-33-44", "extension": 102, "note": "ignored"},
+]
+
+
+def _ndjson(records):
+    return "\n".join(json.dumps(r, ensure_ascii=False) for r in records) + "\n"
+
+
+@pytest.mark.parametrize("text", (json.dumps(RECORDS, indent=2), _ndjson(RECORDS)))
+@pytest.mark.parametrize("binary", (False, True))
+@pytest.mark.parametrize("chunk_size", (1, 16, 4096))
+def test_validate_stream_formats(text, binary, chunk_size):
+    fp = io.BytesIO(text.encode()) if binary else io.StringIO(text)
+
+    results = list(Contact.validate_stream(fp, coerce=True, chunk_size=chunk_size))
+
+    assert [idx for idx, _, _ in results] == [0, 1, 2]
+    assert results[0][1] == {"phone": "79601235464", "extension": 22}
+    assert results[1][1] is None
+    assert isinstance(results[1][2], ValidationErrorGroup)
+    assert results[1][2].errors[0]["path"] == "phone"
+    assert results[2][1] == {"phone": "79502223344", "extension": 102}
+
+
+def test_validate_stream_skip():
+    fp = io.StringIO(_ndjson(RECORDS))
+
+    results = list(Contact.validate_stream(fp, coerce=True, on_error="skip"))
+
+    assert [idx for idx, _, _ in results] == [0, 2]
+
+
+def test_validate_stream_is_lazy():
+    fp = io.StringIO(json.dumps(RECORDS)[:-1] + ", {broken]")
+    stream = Contact.validate_stream(fp, coerce=True, chunk_size=8)
+
+    assert next(stream)[1] == {"phone": "79601235464", "extension": 22}
+
+    with pytest.raises(json.JSONDecodeError):
+        list(stream)
+
+
+class _CountingReader(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.consumed = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.consumed += len(chunk)
+        return chunk
+
+
+def test_validate_stream_malformed_ndjson_line():
+    fp = io.StringIO(_ndjson(RECORDS[:1]) + '{"phone": \n' + _ndjson(RECORDS[2:]))
+
+    results = list(Contact.validate_stream(fp, coerce=True))
+
+    assert [idx for idx, _, _ in results] == [0, 1, 2]
+    assert results[1][1] is None
+    error = results[1][2].errors[0]
+    assert error["path"] == ""
+    assert error["value"] == '{"phone": '
+    assert error["message"].startswith("Некорректный JSON: Expecting value")
+    assert results[2][1] == {"phone": "79502223344", "extension": 102}
+
+
+def test_validate_stream_malformed_ndjson_line_is_not_buffered_past():
+    tail = _ndjson(RECORDS[:1] * 10_000).encode()
+    fp = _CountingReader(_ndjson(RECORDS[:1]).encode() + b'{"phone": \n' + tail)
+    stream = Contact.validate_stream(fp, coerce=True, chunk_size=1024)
+
+    assert next(stream)[2] is None
+    assert next(stream)[2] is not None
+    assert next(stream)[2] is None
+    assert fp.consumed <= 2048
+
+
+def test_validate_stream_malformed_array_item_raises_at_once():
+    items = ", ".join(json.dumps(RECORDS[0]) for _ in range(10_000))
+    fp = _CountingReader(f'[{json.dumps(RECORDS[0])}, {{"phone": ]}}, {items}]'.encode())
+    stream = Contact.validate_stream(fp, coerce=True, chunk_size=1024)
+
+    assert next(stream)[2] is None
+    with pytest.raises(json.JSONDecodeError):
+        next(stream)
+    assert fp.consumed <= 2048
+
+
+def test_validate_stream_empty_array():
+    assert list(Contact.validate_stream(io.StringIO(" [ ] "))) == []